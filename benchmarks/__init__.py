@@ -0,0 +1,4 @@
+"""Benchmark suite for table2ascii
+
+Run ``python -m benchmarks --help`` from the repository root for usage.
+"""
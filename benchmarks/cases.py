@@ -0,0 +1,119 @@
+"""Synthetic tables used by the benchmark suite"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from typing import Any, Callable, List
+
+from table2ascii import Alignment, Merge, PresetStyle
+
+Row = List[Any]
+
+ASCII_WORDS = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta", "eta", "theta"]
+WIDE_WORDS = ["表格", "数据", "東京", "서울", "😀", "🚀✨", "ｆｕｌｌ", "カタカナ"]
+
+
+@dataclass
+class BenchmarkCase:
+    """A table to render and the options to render it with"""
+
+    name: str
+    rows: int
+    columns: int
+    make_row: Callable[[random.Random, int, int], Row]
+    options: dict[str, Any] = field(default_factory=dict)
+    full_only: bool = False
+    """Whether the case is only run with ``--full`` because it takes a long time"""
+
+    @property
+    def cells(self) -> int:
+        return self.rows * self.columns
+
+    def build(self) -> dict[str, Any]:
+        """Generate the keyword arguments for :func:`table2ascii` for this case"""
+        rng = random.Random(f"{self.name}-{self.rows}-{self.columns}")
+        header = [f"Column {i}" for i in range(self.columns)]
+        body = [self.make_row(rng, index, self.columns) for index in range(self.rows)]
+        return {"header": header, "body": body, **self.options}
+
+
+def ascii_row(rng: random.Random, index: int, columns: int) -> Row:
+    return [index] + [rng.choice(ASCII_WORDS) for _ in range(columns - 1)]
+
+
+def wide_row(rng: random.Random, index: int, columns: int) -> Row:
+    return [index] + [rng.choice(WIDE_WORDS) for _ in range(columns - 1)]
+
+
+def multiline_row(rng: random.Random, index: int, columns: int) -> Row:
+    return [index] + [
+        "\n".join(rng.choice(ASCII_WORDS) for _ in range(rng.randint(1, 3)))
+        for _ in range(columns - 1)
+    ]
+
+
+def merged_row(rng: random.Random, index: int, columns: int) -> Row:
+    row: Row = [index]
+    while len(row) < columns:
+        row.append(rng.choice(ASCII_WORDS))
+        # merge runs of up to 3 cells to the left
+        for _ in range(min(rng.randint(0, 2), columns - len(row))):
+            row.append(Merge.LEFT)
+    return row
+
+
+def decimal_row(rng: random.Random, index: int, columns: int) -> Row:
+    return [index] + [
+        f"{rng.uniform(0, 10 ** rng.randint(1, 5)):.{rng.randint(0, 4)}f}"
+        for _ in range(columns - 1)
+    ]
+
+
+def all_cases() -> list[BenchmarkCase]:
+    """List every benchmark case"""
+    cases = [
+        # number of rows
+        BenchmarkCase("ascii", 10, 5, ascii_row),
+        BenchmarkCase("ascii", 1_000, 5, ascii_row),
+        BenchmarkCase("ascii", 100_000, 5, ascii_row),
+        BenchmarkCase("ascii", 1_000_000, 5, ascii_row, full_only=True),
+        # number of columns
+        BenchmarkCase("ascii", 1_000, 2, ascii_row),
+        BenchmarkCase("ascii", 1_000, 20, ascii_row),
+        BenchmarkCase("ascii", 1_000, 200, ascii_row),
+        BenchmarkCase("ascii", 100_000, 200, ascii_row, full_only=True),
+        # wide, short tables, where padding each cell dominates the time spent per row
+        BenchmarkCase("wide-short", 5, 1_000, ascii_row),
+        BenchmarkCase(
+            "wide-short-numbers",
+            5,
+            1_000,
+            decimal_row,
+            {"alignments": Alignment.LEFT, "number_alignments": Alignment.RIGHT},
+        ),
+        # content
+        BenchmarkCase("ascii-len", 10_000, 5, ascii_row, {"use_wcwidth": False}),
+        BenchmarkCase("wide", 10_000, 5, wide_row),
+        BenchmarkCase("multiline", 10_000, 5, multiline_row),
+        BenchmarkCase("merge-left", 10_000, 8, merged_row),
+        BenchmarkCase(
+            "decimal",
+            10_000,
+            5,
+            decimal_row,
+            {"number_alignments": Alignment.DECIMAL, "alignments": Alignment.LEFT},
+        ),
+    ]
+    # every preset style
+    for style_name in sorted(name for name in dir(PresetStyle) if not name.startswith("__")):
+        cases.append(
+            BenchmarkCase(
+                f"style-{style_name}",
+                1_000,
+                5,
+                merged_row,
+                {"style": getattr(PresetStyle, style_name), "first_col_heading": True},
+            )
+        )
+    return cases
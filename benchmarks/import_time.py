@@ -0,0 +1,81 @@
+"""Check the time taken to import table2ascii against a budget
+
+Usage: ``python -m benchmarks.import_time [--budget-ms MS] [--runs N]``
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+
+# modules that are slow to import and must only be imported when they are needed
+LAZY_MODULES = (
+    "asyncio",
+    "concurrent.futures",
+    "importlib.metadata",
+    "multiprocessing",
+    "textwrap",
+    "wcwidth",
+)
+
+CHECK_LAZY_MODULES = f"""
+import sys
+before = set(sys.modules)
+import table2ascii
+print(",".join(m for m in {LAZY_MODULES!r} if m in sys.modules and m not in before))
+"""
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    """Run Python in a subprocess with bytecode caching enabled"""
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True, env=env
+    )
+
+
+def import_time_us() -> int:
+    """Measure the cumulative time in microseconds taken to import table2ascii in a new process"""
+    result = run_python("-X", "importtime", "-c", "import table2ascii")
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        _, cumulative, name = line.split("|")
+        if name.strip() == "table2ascii" and not name.startswith("  "):
+            return int(cumulative)
+    raise RuntimeError("table2ascii import time not found in output")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.import_time",
+        description="Check the time taken to import table2ascii against a budget.",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=30.0,
+        help="maximum import time in milliseconds (default: 30)",
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="number of imports to measure (default: 10)"
+    )
+    args = parser.parse_args(argv)
+    # the first import writes the bytecode cache so that compilation is not measured
+    run_python("-c", "import table2ascii")
+    best_ms = min(import_time_us() for _ in range(args.runs)) / 1000
+    eager = [m for m in run_python("-c", CHECK_LAZY_MODULES).stdout.strip().split(",") if m]
+    print(f"import table2ascii: {best_ms:.2f} ms (budget: {args.budget_ms:.2f} ms)")
+    failed = False
+    if best_ms > args.budget_ms:
+        print("Import time is over budget")
+        failed = True
+    if eager:
+        print(f"Modules that should be imported lazily were imported: {', '.join(eager)}")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
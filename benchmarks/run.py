@@ -0,0 +1,143 @@
+"""Run the benchmark suite and compare the results against a saved baseline"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from table2ascii import table2ascii
+
+from .cases import BenchmarkCase, all_cases
+
+
+def case_id(case: BenchmarkCase) -> str:
+    """Get a unique identifier for a case used as the key in baseline files"""
+    return f"{case.name}[{case.rows}x{case.columns}]"
+
+
+def measure(case: BenchmarkCase, min_time: float) -> dict[str, float]:
+    """Render a case repeatedly for at least ``min_time`` seconds and once more
+    with memory tracing enabled
+
+    Returns:
+        The best time for a single render, the throughput, and the peak memory usage
+    """
+    kwargs = case.build()
+    output = table2ascii(**kwargs)
+    output_bytes = len(output.encode("utf-8"))
+    del output
+    best = float("inf")
+    total = 0.0
+    while total < min_time:
+        gc.collect()
+        start = time.perf_counter()
+        table2ascii(**kwargs)
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+    # tracing slows down rendering, so memory is measured in a separate run
+    gc.collect()
+    tracemalloc.start()
+    table2ascii(**kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "seconds": best,
+        "cells_per_second": case.cells / best,
+        "mb_per_second": output_bytes / best / 1_000_000,
+        "peak_memory_mb": peak / 1_000_000,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], tolerance: float
+) -> list[str]:
+    """Print the change in time and memory for each case relative to the baseline
+
+    Returns:
+        The identifiers of the cases that are slower than the baseline by more than ``tolerance``
+    """
+    regressions = []
+    print(f"\n{'case':<40} {'time':>10} {'memory':>10}")
+    for identifier, result in results.items():
+        if identifier not in baseline:
+            print(f"{identifier:<40} {'(new)':>10}")
+            continue
+        time_change = result["seconds"] / baseline[identifier]["seconds"] - 1
+        memory_change = result["peak_memory_mb"] / baseline[identifier]["peak_memory_mb"] - 1
+        flag = ""
+        if time_change > tolerance:
+            regressions.append(identifier)
+            flag = "  REGRESSION"
+        print(f"{identifier:<40} {time_change:>+10.1%} {memory_change:>+10.1%}{flag}")
+    return regressions
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark table2ascii rendering."
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="only run cases whose identifier contains this text"
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="include the largest cases (up to 1M rows)"
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.5,
+        help="minimum number of seconds to spend rendering each case (default: 0.5)",
+    )
+    parser.add_argument("--save", metavar="FILE", help="save the results as a baseline JSON file")
+    parser.add_argument("--compare", metavar="FILE", help="compare against a baseline JSON file")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="fraction by which a case may be slower than the baseline (default: 0.1)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    cases = [
+        case
+        for case in all_cases()
+        if (args.full or not case.full_only) and args.filter in case_id(case)
+    ]
+    results: dict[str, dict[str, Any]] = {}
+    print(f"{'case':<40} {'ms':>10} {'cells/s':>12} {'MB/s':>8} {'peak MB':>9}")
+    for case in cases:
+        identifier = case_id(case)
+        result = measure(case, args.min_time)
+        results[identifier] = result
+        print(
+            f"{identifier:<40} {result['seconds'] * 1000:>10.2f} "
+            f"{result['cells_per_second']:>12,.0f} {result['mb_per_second']:>8.2f} "
+            f"{result['peak_memory_mb']:>9.2f}"
+        )
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved results to {args.save}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(
+                f"\n{len(regressions)} case(s) slower than the baseline: {', '.join(regressions)}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
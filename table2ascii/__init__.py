@@ -3,52 +3,107 @@ table2ascii - Library for converting 2D Python lists to fancy ASCII/Unicode tabl
 """
 
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from .aio import atable2ascii, atable2ascii_lines, atable2ascii_stream
 from .alignment import Alignment
 from .annotations import SupportsStr
+from .batch import table2ascii_as_completed, table2ascii_many
+from .cache import RenderCache, RenderCacheInfo
+from .chunks import table2ascii_chunks
 from .exceptions import (
     AlignmentCountMismatchError,
     BodyColumnCountMismatchError,
+    BufferTooSmallError,
+    ChunkSizeTooSmallError,
     ColumnCountMismatchError,
     ColumnWidthsCountMismatchError,
     ColumnWidthTooSmallError,
     FooterColumnCountMismatchError,
     InvalidAlignmentError,
     InvalidCellPaddingError,
+    InvalidColumnsError,
     InvalidColumnWidthError,
+    InvalidRepeatHeaderEveryError,
+    InvalidWorkersError,
+    MaxWidthTooSmallError,
     Table2AsciiError,
     TableOptionError,
     TableStyleTooLongError,
     TableStyleTooShortWarning,
 )
+from .grid import compose_grid, iter_grid_lines, render_table
+from .live import LineChange, LiveTable, LiveTableUpdate, LiveTableWriter
+from .measure import OutputSize, measure_table, table2ascii_into
 from .merge import Merge
+from .panels import table2ascii_panels
 from .preset_style import PresetStyle
-from .table_style import TableStyle
+from .rendered_table import RenderedTable
+from .stats import RenderStats
+from .table_style import SeparatorGlyphs, TableStyle
 from .table_to_ascii import table2ascii
 
-if TYPE_CHECKING or sys.version_info >= (3, 8):
-    from importlib import metadata
-else:
-    import importlib_metadata as metadata
+if TYPE_CHECKING:
+    __version__: str
+
+
+def __getattr__(name: str) -> Any:
+    # the version is looked up on first access since reading the package metadata is slow
+    if name == "__version__":
+        if TYPE_CHECKING or sys.version_info >= (3, 8):
+            from importlib import metadata
+        else:
+            import importlib_metadata as metadata
+
+        version = metadata.version(__name__)
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__version__ = metadata.version(__name__)
 
 __all__ = [
     "Alignment",
+    "LineChange",
+    "LiveTable",
+    "LiveTableUpdate",
+    "LiveTableWriter",
     "Merge",
+    "OutputSize",
     "PresetStyle",
+    "RenderCache",
+    "RenderCacheInfo",
+    "RenderStats",
+    "RenderedTable",
+    "SeparatorGlyphs",
     "TableStyle",
     "table2ascii",
+    "table2ascii_many",
+    "table2ascii_as_completed",
+    "table2ascii_into",
+    "table2ascii_chunks",
+    "table2ascii_panels",
+    "render_table",
+    "compose_grid",
+    "iter_grid_lines",
+    "measure_table",
+    "atable2ascii",
+    "atable2ascii_lines",
+    "atable2ascii_stream",
     "AlignmentCountMismatchError",
     "BodyColumnCountMismatchError",
+    "BufferTooSmallError",
+    "ChunkSizeTooSmallError",
     "ColumnCountMismatchError",
     "ColumnWidthsCountMismatchError",
     "ColumnWidthTooSmallError",
     "FooterColumnCountMismatchError",
     "InvalidAlignmentError",
     "InvalidCellPaddingError",
+    "InvalidColumnsError",
     "InvalidColumnWidthError",
+    "InvalidRepeatHeaderEveryError",
+    "InvalidWorkersError",
+    "MaxWidthTooSmallError",
     "Table2AsciiError",
     "TableOptionError",
     "TableStyleTooLongError",
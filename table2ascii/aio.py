@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncGenerator, AsyncIterable, Sequence
+from typing import TYPE_CHECKING, Any
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii, _LineSplitter
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+# asyncio is imported by the coroutines that use it rather than at the top of the module
+# since importing it is slow, and it is always loaded already when a coroutine is running
+
+DEFAULT_TIME_SLICE = 0.005
+"""Default number of seconds to render for before yielding to the event loop"""
+
+DEFAULT_SAMPLE_ROWS = 100
+"""Default number of rows to measure before streaming a table"""
+
+
+class _Pacer:
+    """Keeps track of how long rendering has run since last yielding to the event loop"""
+
+    __slots__ = ("__time_slice", "__deadline")
+
+    def __init__(self, time_slice: float) -> None:
+        self.__time_slice = time_slice
+        self.__deadline = time.perf_counter() + time_slice
+
+    async def checkpoint(self) -> None:
+        """Yield to the event loop if the time slice has been used up"""
+        if time.perf_counter() >= self.__deadline:
+            import asyncio
+
+            await asyncio.sleep(0)
+            self.__deadline = time.perf_counter() + self.__time_slice
+
+
+async def _create_table(
+    header: Sequence[SupportsStr] | None,
+    body: Sequence[Sequence[SupportsStr]] | None,
+    footer: Sequence[SupportsStr] | None,
+    options: Options,
+    pacer: _Pacer,
+) -> TableToAscii:
+    """Lay out a table, yielding to the event loop while the rows are validated and measured"""
+    steps = TableToAscii.create_in_steps(header, body, footer, options)
+    while True:
+        try:
+            next(steps)
+        except StopIteration as done:
+            return done.value
+        await pacer.checkpoint()
+
+
+async def atable2ascii_lines(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    time_slice: float = DEFAULT_TIME_SLICE,
+    **options: Any,
+) -> AsyncGenerator[str, None]:
+    """Convert a 2D Python table to ASCII text, asynchronously yielding the lines of the table
+    as they are rendered
+
+    The body is rendered one row at a time. Whenever rendering has run for longer than
+    ``time_slice`` seconds, control is given back to the event loop so that other tasks
+    can run. The column widths are calculated before the first line is yielded, also
+    yielding to the event loop while the rows are measured.
+
+    Example::
+
+        async for line in atable2ascii_lines(header, body, style=PresetStyle.thin):
+            await stream.write(line + "\\n")
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        time_slice: The maximum number of seconds to render for without yielding
+            to the event loop. Defaults to ``0.005``.
+        options: Keyword arguments accepted by :func:`table2ascii`
+
+    Returns:
+        An asynchronous iterator of the lines of the table without trailing newlines
+
+    .. versionadded:: 1.3.0
+    """
+    pacer = _Pacer(time_slice)
+    table = await _create_table(header, body, footer, Options(**options), pacer)
+    for line in table.iter_lines():
+        yield line
+        await pacer.checkpoint()
+
+
+async def atable2ascii_stream(
+    header: Sequence[SupportsStr] | None = None,
+    body: AsyncIterable[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    sample_rows: int = DEFAULT_SAMPLE_ROWS,
+    time_slice: float = DEFAULT_TIME_SLICE,
+    **options: Any,
+) -> AsyncGenerator[str, None]:
+    """Convert a 2D Python table with rows from an asynchronous source to ASCII text,
+    yielding the lines of the table as the rows arrive
+
+    The column widths are calculated from the header, the footer, and the first
+    ``sample_rows`` rows of the body, or can be fixed using the ``column_widths`` option.
+    Cells in later rows that do not fit within their column are wrapped onto multiple lines.
+    Rows are only read from ``body`` when the consumer asks for more lines, so a slow
+    consumer is never buffered ahead of by more than one row. With the ``transpose`` option,
+    each row is a column of the table, so all of the rows are read before the first line.
+
+    Example::
+
+        async def fetch_rows():
+            async for record in cursor:
+                yield [record.id, record.name, record.status]
+
+        async for line in atable2ascii_stream(["ID", "Name", "Status"], fetch_rows()):
+            print(line)
+
+    Args:
+        header: The values in the header of the table
+        body: An asynchronous iterable of the rows of values in the body of the table
+        footer: The values in the footer of the table
+        sample_rows: The number of rows to read from ``body`` to calculate the column widths
+            before the first line is yielded. If ``0``, the column widths are calculated from
+            the header and footer alone. Defaults to ``100``.
+        time_slice: The maximum number of seconds to render for without yielding
+            to the event loop. Defaults to ``0.005``.
+        options: Keyword arguments accepted by :func:`table2ascii`
+
+    Returns:
+        An asynchronous iterator of the lines of the table without trailing newlines
+
+    .. versionadded:: 1.3.0
+    """
+    rows = body.__aiter__() if body is not None else None
+    table_options = Options(**options)
+    sample: list[Sequence[SupportsStr]] = []
+    if table_options.transpose:
+        # each row is a column of a transposed table, so every row is needed for the first line
+        sample = [row async for row in rows] if rows is not None else []
+        async for line in atable2ascii_lines(
+            header, sample, footer, time_slice=time_slice, **options
+        ):
+            yield line
+        return
+    if rows is not None and sample_rows > 0:
+        async for row in rows:
+            sample.append(row)
+            if len(sample) >= sample_rows:
+                break
+    pacer = _Pacer(time_slice)
+    table = await _create_table(header, sample, footer, table_options, pacer)
+    prepared_sample = [table.prepare_row(row) for row in sample]
+    splitter = _LineSplitter()
+    first_row = prepared_sample[0] if prepared_sample else None
+    for line in splitter.feed(table.head_to_ascii(first_row)):
+        yield line
+    previous_row: list[SupportsStr] | None = None
+    for index, row in enumerate(prepared_sample):
+        for line in splitter.feed(table.rows_to_ascii([row], previous_row, index)):
+            yield line
+            await pacer.checkpoint()
+        previous_row = row
+    # the sample has been rendered, so the rest of the rows are rendered as they arrive
+    if rows is not None and len(sample) >= sample_rows:
+        index = len(prepared_sample)
+        async for row in rows:
+            prepared_row = table.prepare_row(row)
+            for line in splitter.feed(table.rows_to_ascii([prepared_row], previous_row, index)):
+                yield line
+                await pacer.checkpoint()
+            previous_row = prepared_row
+            index += 1
+    for line in splitter.feed(table.tail_to_ascii(previous_row)):
+        yield line
+
+
+async def atable2ascii(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    time_slice: float = DEFAULT_TIME_SLICE,
+    to_thread: bool = False,
+    executor: ThreadPoolExecutor | None = None,
+    **options: Any,
+) -> str:
+    """Convert a 2D Python table to ASCII text without blocking the event loop
+
+    By default, the table is rendered in the event loop's thread, yielding to the event loop
+    every ``time_slice`` seconds as with :func:`atable2ascii_lines`. If ``to_thread`` is
+    :py:obj:`True` or an ``executor`` is given, the table is rendered in the executor
+    (the event loop's default executor if none is given) instead.
+
+    If the task awaiting the table is cancelled, rendering stops at the next row,
+    including when rendering in an executor, where measuring the rows also stops
+    at the next slice of rows.
+
+    Example::
+
+        output = await atable2ascii(header, body, footer, to_thread=True)
+        await channel.send(f"```\\n{output}\\n```")
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        time_slice: The maximum number of seconds to render for without yielding
+            to the event loop. Defaults to ``0.005``.
+        to_thread: Whether to render the table in an executor. Defaults to :py:obj:`False`.
+        executor: The :class:`~concurrent.futures.ThreadPoolExecutor` to render the table in.
+            Setting this implies ``to_thread``. Defaults to :py:obj:`None`.
+        options: Keyword arguments accepted by :func:`table2ascii`
+
+    Returns:
+        The generated ASCII table
+
+    .. versionadded:: 1.3.0
+    """
+    if not to_thread and executor is None:
+        lines = [
+            line
+            async for line in atable2ascii_lines(
+                header, body, footer, time_slice=time_slice, **options
+            )
+        ]
+        return "\n".join(lines)
+    import asyncio
+    import threading
+
+    cancelled = threading.Event()
+
+    def render() -> str:
+        steps = TableToAscii.create_in_steps(header, body, footer, Options(**options))
+        try:
+            # stop laying out the table at the next pause if the task is cancelled
+            while not cancelled.is_set():
+                next(steps)
+            return ""
+        except StopIteration as done:
+            table = done.value
+        lines = []
+        for line in table.iter_lines():
+            if cancelled.is_set():
+                break
+            lines.append(line)
+        return "\n".join(lines)
+
+    try:
+        return await asyncio.get_running_loop().run_in_executor(executor, render)
+    except asyncio.CancelledError:
+        cancelled.set()
+        raise
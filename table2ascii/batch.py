@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import sys
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import repeat
+from typing import TYPE_CHECKING, Any, Optional, Sequence as SequenceType, Tuple
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# concurrent.futures is imported by the functions that use it since importing it is slow
+
+# the alias is evaluated at runtime, where collections.abc.Sequence cannot be subscripted
+# on Python 3.8
+TableParts = Tuple[
+    Optional[SequenceType[SupportsStr]],
+    Optional[SequenceType[SequenceType[SupportsStr]]],
+    Optional[SequenceType[SupportsStr]],
+]
+"""A ``(header, body, footer)`` tuple describing a single table"""
+
+
+def _render_table(
+    header: Sequence[SupportsStr] | None,
+    body: Sequence[Sequence[SupportsStr]] | None,
+    footer: Sequence[SupportsStr] | None,
+    options: Options,
+) -> str:
+    """Render a single table of a batch"""
+    return TableToAscii(header, body, footer, options).to_ascii()
+
+
+def _gil_disabled() -> bool:
+    """Returns True if running on a free-threaded build of CPython with the GIL disabled"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _map(executor: Executor, tables: Iterable[TableParts], options: Options) -> list[str]:
+    """Render tables using an executor, returning the results in order"""
+    headers: list[Sequence[SupportsStr] | None] = []
+    bodies: list[Sequence[Sequence[SupportsStr]] | None] = []
+    footers: list[Sequence[SupportsStr] | None] = []
+    for header, body, footer in tables:
+        headers.append(header)
+        bodies.append(body)
+        footers.append(footer)
+    return list(executor.map(_render_table, headers, bodies, footers, repeat(options)))
+
+
+def _as_completed(
+    executor: Executor, tables: Iterable[TableParts], options: Options
+) -> Iterator[tuple[int, str]]:
+    """Render tables using an executor, yielding the results as they finish"""
+    from concurrent.futures import as_completed
+
+    futures = {
+        executor.submit(_render_table, *table, options): index for index, table in enumerate(tables)
+    }
+    for future in as_completed(futures):
+        yield futures[future], future.result()
+
+
+def table2ascii_many(
+    tables: Iterable[TableParts],
+    *,
+    executor: Executor | None = None,
+    **options: Any,
+) -> list[str]:
+    """Convert many independent 2D Python tables to ASCII text
+
+    All tables share the same options. The tables are distributed over ``executor``
+    if one is given, otherwise they are rendered using a thread pool on free-threaded
+    builds of CPython with the GIL disabled, or one after another in the current thread.
+
+    Example::
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        from table2ascii import PresetStyle, table2ascii_many
+
+        with ProcessPoolExecutor() as executor:
+            outputs = table2ascii_many(
+                [
+                    (["Name", "Score"], [["Alice", 10], ["Bob", 8]], None),
+                    (["Name", "Score"], [["Carol", 7]], ["Total", 7]),
+                ],
+                executor=executor,
+                style=PresetStyle.ascii_box,
+            )
+
+    Args:
+        tables: The ``(header, body, footer)`` tuples of the tables to convert.
+            Any of the parts may be :py:obj:`None`, as in :func:`table2ascii`.
+        executor: The :class:`~concurrent.futures.Executor` to render the tables with.
+            When using a :class:`~concurrent.futures.ProcessPoolExecutor`, all cell values
+            and options must be picklable. Defaults to :py:obj:`None`.
+        options: Keyword arguments accepted by :func:`table2ascii` to apply to every table
+
+    Returns:
+        The generated ASCII tables in the same order as ``tables``
+
+    .. versionadded:: 1.3.0
+    """
+    shared_options = Options(**options)
+    if executor is not None:
+        return _map(executor, tables, shared_options)
+    if _gil_disabled():
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as thread_executor:
+            return _map(thread_executor, tables, shared_options)
+    return [_render_table(*table, shared_options) for table in tables]
+
+
+def table2ascii_as_completed(
+    tables: Iterable[TableParts],
+    *,
+    executor: Executor | None = None,
+    **options: Any,
+) -> Iterator[tuple[int, str]]:
+    """Convert many independent 2D Python tables to ASCII text, yielding each
+    table as soon as it has been rendered
+
+    Accepts the same arguments as :func:`table2ascii_many`.
+
+    Example::
+
+        for index, output in table2ascii_as_completed(tables, executor=executor):
+            print(f"Table {index}:\\n{output}")
+
+    Args:
+        tables: The ``(header, body, footer)`` tuples of the tables to convert
+        executor: The :class:`~concurrent.futures.Executor` to render the tables with.
+            Defaults to :py:obj:`None`.
+        options: Keyword arguments accepted by :func:`table2ascii` to apply to every table
+
+    Returns:
+        An iterator of tuples of the index of the table in ``tables``
+        and the generated ASCII table, in the order the tables finish rendering
+
+    .. versionadded:: 1.3.0
+    """
+    shared_options = Options(**options)
+    if executor is not None:
+        yield from _as_completed(executor, tables, shared_options)
+    elif _gil_disabled():
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor() as thread_executor:
+            yield from _as_completed(thread_executor, tables, shared_options)
+    else:
+        for index, table in enumerate(tables):
+            yield index, _render_table(*table, shared_options)
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from functools import wraps
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from .annotations import SupportsStr
+from .merge import Merge
+
+if TYPE_CHECKING:
+    from hashlib import blake2b
+
+# hashlib is imported by the functions that use it since importing it is slow
+
+# options that do not change the rendered text, so they are left out of the cache key
+_IGNORED_OPTIONS = frozenset({"stats", "workers"})
+
+
+class RenderCacheInfo(NamedTuple):
+    """Statistics about the usage of a :class:`RenderCache`
+
+    .. versionadded:: 1.3.0
+    """
+
+    hits: int
+    """The number of renders whose output was found in the cache"""
+    misses: int
+    """The number of renders whose output was not found in the cache"""
+    evictions: int
+    """The number of outputs removed from the cache to stay within the size limit"""
+    entries: int
+    """The number of outputs currently in the cache"""
+    current_bytes: int
+    """The approximate memory used by the outputs currently in the cache"""
+    max_bytes: int
+    """The size limit of the cache"""
+
+
+class RenderCache:
+    """A bounded cache of rendered tables, for applications that render the same tables repeatedly
+
+    The cache is keyed on a hash of the text of every cell in the header, body, and footer
+    together with the options, so a table with the same contents and options is only rendered
+    once while it stays in the cache. When the total size of the cached outputs would exceed
+    ``max_bytes``, the least recently used outputs are evicted.
+
+    Call :meth:`table2ascii` to render a table using the cache, or use the cache as a decorator
+    on a function that accepts the same arguments as :func:`~table2ascii.table2ascii`.
+
+    Rendering statistics passed with the ``stats`` option are only recorded when the table is
+    actually rendered, not when its output is found in the cache.
+
+    Example::
+
+        from table2ascii import RenderCache, table2ascii
+
+        cache = RenderCache(max_bytes=1_000_000)
+        cached_table2ascii = cache(table2ascii)
+
+        output = cached_table2ascii(header=["Name", "Score"], body=[["Alice", 10], ["Bob", 8]])
+
+        print(cache.cache_info())
+
+    .. versionadded:: 1.3.0
+
+    Args:
+        max_bytes: The maximum approximate memory in bytes to use for cached outputs.
+            Outputs larger than this are never cached. Defaults to 16 MiB.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.__max_bytes = max_bytes
+        self.__entries: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self.__current_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+        self.__lock = threading.Lock()
+
+    def __call__(self, render: Callable[..., str]) -> Callable[..., str]:
+        """Wrap a function that renders tables so that its outputs are cached
+
+        Args:
+            render: A function that accepts the same arguments as :func:`~table2ascii.table2ascii`
+
+        Returns:
+            A function that returns the cached output if there is one,
+            or calls ``render`` and caches its output otherwise
+        """
+
+        @wraps(render)
+        def cached_render(
+            header: Sequence[SupportsStr] | None = None,
+            body: Sequence[Sequence[SupportsStr]] | None = None,
+            footer: Sequence[SupportsStr] | None = None,
+            **options: Any,
+        ) -> str:
+            key = (render, _content_digest(header, body, footer), _options_key(options))
+            output = self.__get(key)
+            if output is None:
+                output = render(header, body, footer, **options)
+                self.__put(key, output)
+            return output
+
+        return cached_render
+
+    def table2ascii(
+        self,
+        header: Sequence[SupportsStr] | None = None,
+        body: Sequence[Sequence[SupportsStr]] | None = None,
+        footer: Sequence[SupportsStr] | None = None,
+        **options: Any,
+    ) -> str:
+        """Convert a 2D Python table to ASCII text, using the cached output if there is one
+
+        Args:
+            header: The values in the header of the table
+            body: The rows of values in the body of the table
+            footer: The values in the footer of the table
+            options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+        Returns:
+            The generated ASCII table
+        """
+        from .table_to_ascii import table2ascii
+
+        return self(table2ascii)(header, body, footer, **options)
+
+    def cache_info(self) -> RenderCacheInfo:
+        """Get statistics about the usage of the cache
+
+        Returns:
+            The number of hits, misses, and evictions, and the current size of the cache
+        """
+        with self.__lock:
+            return RenderCacheInfo(
+                hits=self.__hits,
+                misses=self.__misses,
+                evictions=self.__evictions,
+                entries=len(self.__entries),
+                current_bytes=self.__current_bytes,
+                max_bytes=self.__max_bytes,
+            )
+
+    def clear(self) -> None:
+        """Remove all outputs from the cache and reset the statistics"""
+        with self.__lock:
+            self.__entries.clear()
+            self.__current_bytes = 0
+            self.__hits = self.__misses = self.__evictions = 0
+
+    def __get(self, key: tuple[Any, ...]) -> str | None:
+        """Get the cached output for a key and mark it as recently used"""
+        with self.__lock:
+            output = self.__entries.get(key)
+            if output is None:
+                self.__misses += 1
+                return None
+            self.__hits += 1
+            self.__entries.move_to_end(key)
+            return output
+
+    def __put(self, key: tuple[Any, ...], output: str) -> None:
+        """Add an output to the cache, evicting the least recently used outputs to make room"""
+        size = sys.getsizeof(output)
+        if size > self.__max_bytes:
+            return
+        with self.__lock:
+            # another thread may have rendered the same table in the meantime
+            if key in self.__entries:
+                return
+            while self.__current_bytes + size > self.__max_bytes:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__current_bytes -= sys.getsizeof(evicted)
+                self.__evictions += 1
+            self.__entries[key] = output
+            self.__current_bytes += size
+
+
+def _update_digest(digest: blake2b, row: Sequence[SupportsStr] | None) -> None:
+    """Add the text of a row to a digest
+
+    Each row is prefixed with its length and each cell with the length of its text so that
+    different tables never produce the same sequence of bytes.
+    """
+    if row is None:
+        digest.update(b"-")
+        return
+    parts = [f"{len(row)}["]
+    for cell in row:
+        if cell is Merge.LEFT:
+            parts.append("|")
+        else:
+            text = str(cell)
+            parts.append(f"{len(text)}:")
+            parts.append(text)
+    digest.update("".join(parts).encode("utf-8", "surrogatepass"))
+
+
+def _content_digest(
+    header: Sequence[SupportsStr] | None,
+    body: Sequence[Sequence[SupportsStr]] | None,
+    footer: Sequence[SupportsStr] | None,
+) -> bytes:
+    """Hash the text of every cell in a table
+
+    Returns:
+        A 128-bit digest of the header, body, and footer
+    """
+    from hashlib import blake2b
+
+    digest = blake2b(digest_size=16)
+    _update_digest(digest, header)
+    _update_digest(digest, footer)
+    if body is None:
+        digest.update(b"-")
+    else:
+        digest.update(f"{len(body)}[".encode())
+        for row in body:
+            _update_digest(digest, row)
+    return digest.digest()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert lists in an option value to tuples so that it can be used in a cache key"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _options_key(options: dict[str, Any]) -> tuple[tuple[str, Any], ...]:
+    """Get a hashable key for the options that affect the rendered text"""
+    return tuple(
+        (name, _freeze(value))
+        for name, value in sorted(options.items())
+        if name not in _IGNORED_OPTIONS
+    )
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii
+
+
+def table2ascii_chunks(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    max_chars: int,
+    **options: Any,
+) -> list[str]:
+    """Convert a 2D Python table to ASCII text split into chunks of a maximum size,
+    such as for sending in chat messages with a character limit
+
+    The body is split between rows, so no row is cut in half. Each chunk is a complete
+    table with its own top and bottom edges and a copy of the header, and the footer
+    is included in the last chunk. All chunks use the same column widths.
+
+    Example::
+
+        from table2ascii import table2ascii_chunks
+
+        # leave room for the code block around each message
+        for chunk in table2ascii_chunks(header, body, max_chars=2000 - 8):
+            send_message(f"```\\n{chunk}\\n```")
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        max_chars: The maximum number of characters in each chunk
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+    Returns:
+        The chunks of the table, without trailing newlines
+
+    Raises:
+        ChunkSizeTooSmallError: If a row does not fit in a chunk along with the lines
+            above and below it
+
+    .. versionadded:: 1.3.0
+    """
+    return list(TableToAscii(header, body, footer, Options(**options)).iter_chunks(max_chars))
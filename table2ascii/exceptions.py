@@ -63,26 +63,41 @@ class BodyColumnCountMismatchError(ColumnCountMismatchError):
 
     This class is a subclass of :class:`ColumnCountMismatchError`.
 
+    .. versionchanged:: 1.3.0
+
+        The error no longer keeps a reference to the body, which is found while the body is
+        validated instead of being scanned again. Added ``row_index`` and ``row_length``
+        attributes, and the message is only generated when the error is converted to a string.
+
     Attributes:
-        body (:class:`Sequence <collections.abc.Sequence>` [ :class:`Sequence <collections.abc.Sequence>` [:class:`SupportsStr`]]):
-            The body that caused the error
-        expected_columns (:class:`int`): The number of columns that were expected
         first_invalid_row (:class:`Sequence <collections.abc.Sequence>` [:class:`SupportsStr`]):
             The first row with an invalid column count
+        expected_columns (:class:`int`): The number of columns that were expected
+        row_index (:data:`Optional <typing.Optional>` [:class:`int`]): The index of the row
+            in the body, or :py:obj:`None` if the row was not part of a body
+        row_length (:class:`int`): The number of columns in the row
     """
 
-    def __init__(self, body: Sequence[Sequence[SupportsStr]], expected_columns: int):
-        self.body = body
+    def __init__(
+        self,
+        first_invalid_row: Sequence[SupportsStr],
+        expected_columns: int,
+        row_index: int | None = None,
+    ):
+        self.first_invalid_row = first_invalid_row
         self.expected_columns = expected_columns
-        self.first_invalid_row = next(
-            (row for row in self.body if len(row) != self.expected_columns)
-        )
-        super().__init__(self._message())
+        self.row_index = row_index
+        self.row_length = len(first_invalid_row)
+        super().__init__(first_invalid_row, expected_columns, row_index)
+
+    def __str__(self) -> str:
+        return self._message()
 
     def _message(self) -> str:
+        location = f" at index {self.row_index}" if self.row_index is not None else ""
         return (
-            f"Body column count mismatch: A row with {len(self.first_invalid_row)} "
-            f"columns was found, expected {self.expected_columns}."
+            f"Body column count mismatch: A row with {self.row_length} "
+            f"columns was found{location}, expected {self.expected_columns}."
         )
 
 
@@ -167,6 +182,102 @@ class InvalidCellPaddingError(TableOptionError):
         )
 
 
+class InvalidWorkersError(TableOptionError):
+    """Exception raised when the number of workers is invalid
+
+    This class is a subclass of :class:`TableOptionError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        workers (:class:`int`): The number of workers that caused the error
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Invalid workers: The number of workers provided was {self.workers} "
+            f"but it must be a positive integer."
+        )
+
+
+class InvalidRepeatHeaderEveryError(TableOptionError):
+    """Exception raised when the number of rows between repeated headers is invalid
+
+    This class is a subclass of :class:`TableOptionError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        repeat_header_every (:class:`int`): The number of rows that caused the error
+    """
+
+    def __init__(self, repeat_header_every: int):
+        self.repeat_header_every = repeat_header_every
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Invalid repeat_header_every: The number of rows provided was "
+            f"{self.repeat_header_every} but it must be a positive integer."
+        )
+
+
+class InvalidColumnsError(TableOptionError):
+    """Exception raised when the columns selected to show, or to repeat in every panel
+    with :func:`~table2ascii.table2ascii_panels`, are invalid
+
+    This class is a subclass of :class:`TableOptionError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        columns (:class:`Sequence <collections.abc.Sequence>` [:class:`int`]): The column indices
+            that caused the error
+        source_columns (:class:`int`): The number of columns in the rows of the table
+    """
+
+    def __init__(self, columns: Sequence[int], source_columns: int):
+        self.columns = columns
+        self.source_columns = source_columns
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Invalid columns: The columns provided were {list(self.columns)} but at least one "
+            f"column must be selected and each must be an index of one of the "
+            f"{self.source_columns} columns in the rows of the table."
+        )
+
+
+class ChunkSizeTooSmallError(TableOptionError):
+    """Exception raised when the maximum size of a chunk is too small to fit a single row
+    of the table along with the lines above and below it
+
+    This class is a subclass of :class:`TableOptionError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        max_chars (:class:`int`): The maximum number of characters in a chunk
+        min_chars (:class:`int`): The number of characters needed for the row that did not fit
+    """
+
+    def __init__(self, max_chars: int, min_chars: int):
+        self.max_chars = max_chars
+        self.min_chars = min_chars
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Chunk size too small: The maximum number of characters in a chunk is "
+            f"{self.max_chars} but at least {self.min_chars} are needed to fit a row."
+        )
+
+
 class ColumnWidthTooSmallError(TableOptionError):
     """Exception raised when the column width is smaller than the minimum
     number of characters that are required to display the content
@@ -193,6 +304,30 @@ class ColumnWidthTooSmallError(TableOptionError):
         )
 
 
+class MaxWidthTooSmallError(TableOptionError):
+    """Exception raised when the table cannot be narrowed to fit in the maximum width
+
+    This class is a subclass of :class:`TableOptionError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        max_width (:class:`int`): The maximum width that caused the error
+        min_width (:class:`int`): The minimum width the table can be narrowed to
+    """
+
+    def __init__(self, max_width: int, min_width: int):
+        self.max_width = max_width
+        self.min_width = min_width
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Max width too small: The maximum width of the table is {self.max_width}, "
+            f"but the minimum width required to display the content is {self.min_width}."
+        )
+
+
 class InvalidColumnWidthError(ColumnWidthTooSmallError):
     """Exception raised when the column width is invalid
 
@@ -251,6 +386,31 @@ class TableStyleTooLongError(Table2AsciiError, ValueError):
         )
 
 
+class BufferTooSmallError(Table2AsciiError, ValueError):
+    """Exception raised when the output of a table does not fit in the buffer
+    it is being written to
+
+    This class is a subclass of :class:`Table2AsciiError` and :class:`ValueError`.
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        buffer_size (:class:`int`): The size of the buffer in bytes
+        required_size (:class:`int`): The size of the output in bytes
+    """
+
+    def __init__(self, buffer_size: int, required_size: int):
+        self.buffer_size = buffer_size
+        self.required_size = required_size
+        super().__init__(self._message())
+
+    def _message(self) -> str:
+        return (
+            f"Buffer too small: the table needs {self.required_size} bytes, "
+            f"but the buffer has {self.buffer_size} bytes."
+        )
+
+
 class TableStyleTooShortWarning(UserWarning):
     """Warning raised when the number of characters passed in the string
     for creating the table style is fewer than the number of parameters
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from itertools import zip_longest
+from typing import Any, Union
+
+from .annotations import SupportsStr
+from .live import LiveTable
+from .options import Options
+from .rendered_table import RenderedTable
+from .table_to_ascii import TableToAscii
+
+GridItem = Union[RenderedTable, LiveTable, None]
+
+
+def render_table(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    lazy: bool = False,
+    **options: Any,
+) -> RenderedTable:
+    """Convert a 2D Python table to ASCII text along with the display width of its lines
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        lazy: Whether to render the lines only as they are consumed, one body row at a time,
+            such as by :func:`iter_grid_lines`. The lines of a lazy table can only be
+            consumed once, so it cannot be used as a cell value. Defaults to :py:obj:`False`.
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+    Returns:
+        The lines of the table and their width
+
+    .. versionadded:: 1.3.0
+    """
+    table = TableToAscii(header, body, footer, Options(**options))
+    lines = table.iter_lines() if lazy else table.to_ascii().split("\n")
+    return RenderedTable(lines=lines, width=table.width())
+
+
+def iter_grid_lines(
+    grid: Sequence[Sequence[GridItem]], *, column_gap: int = 2, row_gap: int = 1
+) -> Iterator[str]:
+    """Place tables side by side in rows of a grid, generating the lines of the grid one at a time
+
+    Each column of the grid is as wide as its widest table, and each row of the grid is as
+    tall as its tallest table. Tables are padded using the widths they were rendered with,
+    so no text is measured. The lines of the tables in a row of the grid are consumed
+    together, so tables rendered with ``lazy=True`` are only rendered as the grid is.
+
+    Example::
+
+        from table2ascii import iter_grid_lines, render_table
+
+        summary = render_table(["Region", "Sales"], sales, lazy=True)
+        errors = render_table(["Code", "Count"], error_counts, lazy=True)
+        for line in iter_grid_lines([[summary, errors]]):
+            print(line)
+
+    Args:
+        grid: The rows of the grid, each a sequence of tables from :func:`render_table`,
+            :class:`RenderedTable` instances, or :class:`LiveTable` instances. Use
+            :py:obj:`None` to leave a space in the grid.
+        column_gap: The number of spaces between the tables in a row. Defaults to ``2``.
+        row_gap: The number of empty lines between the rows of the grid. Defaults to ``1``.
+
+    Returns:
+        An iterator of the lines of the grid without trailing newlines
+
+    .. versionadded:: 1.3.0
+    """
+    items = [[_as_rendered(item) for item in row] for row in grid]
+    column_widths = [0] * max((len(row) for row in items), default=0)
+    for row in items:
+        for col_index, item in enumerate(row):
+            if item is not None:
+                column_widths[col_index] = max(column_widths[col_index], item.width)
+    gap = " " * column_gap
+    for row_index, row in enumerate(items):
+        if row_index > 0:
+            yield from [""] * row_gap
+        # padding after each table to the width of its column and the gap to the next column
+        paddings = [
+            " " * (column_widths[col_index] - (item.width if item is not None else 0)) + gap
+            for col_index, item in enumerate(row)
+        ]
+        blanks = [" " * width + gap for width in column_widths]
+        columns = [item.lines if item is not None else () for item in row]
+        for lines in zip_longest(*columns):
+            # leave out the tables that have no more lines at the end of the line
+            last = len(lines) - 1
+            while last >= 0 and lines[last] is None:
+                last -= 1
+            parts = [
+                blanks[col_index] if line is None else line + paddings[col_index]
+                for col_index, line in enumerate(lines[:last])
+            ]
+            if last >= 0:
+                parts.append(lines[last])
+            yield "".join(parts)
+
+
+def compose_grid(
+    grid: Sequence[Sequence[GridItem]], *, column_gap: int = 2, row_gap: int = 1
+) -> str:
+    """Place tables side by side in rows of a grid
+
+    The tables are padded using the widths they were rendered with, so no text is measured.
+    See :func:`iter_grid_lines` to generate the lines one at a time.
+
+    Example::
+
+        from table2ascii import compose_grid, render_table
+
+        tables = [render_table(header, body) for header, body in reports]
+        print(compose_grid([tables[:3], tables[3:]]))
+
+    Args:
+        grid: The rows of the grid, each a sequence of tables from :func:`render_table`,
+            :class:`RenderedTable` instances, or :class:`LiveTable` instances. Use
+            :py:obj:`None` to leave a space in the grid.
+        column_gap: The number of spaces between the tables in a row. Defaults to ``2``.
+        row_gap: The number of empty lines between the rows of the grid. Defaults to ``1``.
+
+    Returns:
+        The lines of the grid joined with newlines
+
+    .. versionadded:: 1.3.0
+    """
+    return "\n".join(iter_grid_lines(grid, column_gap=column_gap, row_gap=row_gap))
+
+
+def _as_rendered(item: GridItem) -> RenderedTable | None:
+    """Get the lines and width of a table in a grid"""
+    if isinstance(item, LiveTable):
+        return RenderedTable(lines=item.lines, width=item.width)
+    return item
@@ -0,0 +1,494 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from time import monotonic
+from typing import TYPE_CHECKING, Any, List, NamedTuple
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from typing import TextIO
+
+
+class LiveTableUpdate(NamedTuple):
+    """The lines of a :class:`LiveTable` that changed after adding rows
+
+    The lines of the table before the update up to ``start`` are unchanged, and ``lines``
+    replaces everything after them.
+
+    .. versionadded:: 1.3.0
+    """
+
+    start: int
+    """The index of the first line that changed"""
+    lines: List[str]
+    """The new lines of the table from ``start`` to the end, without trailing newlines"""
+    relayout: bool
+    """Whether the column widths changed, so the whole table was rendered again"""
+
+
+class LineChange(NamedTuple):
+    """A range of lines of a :class:`LiveTable` that changed after updating the body
+
+    .. versionadded:: 1.3.0
+    """
+
+    start: int
+    """The index of the first line that changed, in the lines of the table before the update"""
+    stop: int
+    """The index after the last line that changed, in the lines of the table before the update"""
+    lines: List[str]
+    """The lines that replace the lines from ``start`` to ``stop``, without trailing newlines"""
+
+
+def _split_lines(section: str) -> list[str]:
+    """Split a newline-terminated section of a table into lines"""
+    return section.split("\n")[:-1]
+
+
+def _changed_lines(offset: int, old_lines: list[str], new_lines: list[str]) -> LineChange:
+    """Describe the difference between two lists of lines, leaving out the lines at the start
+    and end that are the same
+
+    Args:
+        offset: The index of the first of the old lines in the table
+        old_lines: The lines before the change
+        new_lines: The lines after the change
+
+    Returns:
+        The range of the old lines that changed and the lines that replace them
+    """
+    start = 0
+    end = min(len(old_lines), len(new_lines))
+    while start < end and old_lines[start] == new_lines[start]:
+        start += 1
+    old_stop, new_stop = len(old_lines), len(new_lines)
+    while (
+        old_stop > start and new_stop > start and old_lines[old_stop - 1] == new_lines[new_stop - 1]
+    ):
+        old_stop -= 1
+        new_stop -= 1
+    return LineChange(offset + start, offset + old_stop, new_lines[start:new_stop])
+
+
+class LiveTable:
+    """A table that is rendered once and then updated, rendering only the rows that changed
+
+    The rendered lines of the head, each body row (with the separator above it), and the
+    tail of the table are kept along with the column widths and decimal positions of the
+    last render.
+
+    - :meth:`append` and :meth:`extend` render only the new rows and the lines below the body.
+    - :meth:`update` replaces the body, rendering only the rows that differ from the previous
+      body and their neighbouring separators, and returns the ranges of lines that changed.
+
+    If new rows do not fit within the current column widths and decimal positions, the layout
+    is recalculated from all rows and the whole table is rendered again. Columns do not get
+    narrower when the rows that made them wide are changed by :meth:`update`, so that the
+    table does not jump around while it is being watched. With the ``transpose`` option, each
+    row of the body is a column of the table, so the whole table is rendered again whenever
+    the rows change.
+
+    Example::
+
+        from table2ascii import LiveTable
+
+        table = LiveTable(header=["Step", "Loss"], column_widths=[8, 10])
+        for step, loss in enumerate(losses):
+            update = table.append([step, f"{loss:.3f}"])
+            # update.lines replaces the lines of the table from update.start onwards
+
+        print(table.to_ascii())
+
+    .. versionadded:: 1.3.0
+
+    Args:
+        header: The values in the header of the table
+        body: The initial rows of the body of the table
+        footer: The values in the footer of the table
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+    """
+
+    def __init__(
+        self,
+        header: Sequence[SupportsStr] | None = None,
+        body: Iterable[Sequence[SupportsStr]] | None = None,
+        footer: Sequence[SupportsStr] | None = None,
+        **options: Any,
+    ):
+        self.__header = header
+        self.__footer = footer
+        self.__options = Options(**options)
+        # rows of the body as prepared by the layout
+        self.__rows: list[list[SupportsStr]] = []
+        self.__layout: TableToAscii | None = None
+        # rendered lines of the table, split into the head, the lines of each row including
+        # the separator above it, and the tail
+        self.__head: list[str] = []
+        self.__row_lines: list[list[str]] = []
+        self.__tail: list[str] = []
+        # total number of lines in __row_lines, so that appending does not need to count them
+        self.__body_line_count = 0
+        rows = list(body) if body else []
+        if self.__header or self.__footer or rows:
+            self.__render_all(rows)
+
+    def __len__(self) -> int:
+        """The number of rows in the body"""
+        return len(self.__rows)
+
+    @property
+    def lines(self) -> list[str]:
+        """The lines of the table as last rendered, without trailing newlines"""
+        return list(chain(self.__head, *self.__row_lines, self.__tail))
+
+    @property
+    def width(self) -> int:
+        """The display width of the lines of the table as last rendered, or ``0`` if the table
+        has no lines"""
+        return self.__layout.width() if self.__layout is not None else 0
+
+    def to_ascii(self) -> str:
+        """Get the rendered table
+
+        Returns:
+            The rendered table. This is the same text as :func:`~table2ascii.table2ascii` would
+            generate for the current rows, unless :meth:`update` has removed the widest values
+            from a column.
+        """
+        return "\n".join(chain(self.__head, *self.__row_lines, self.__tail))
+
+    def append(self, row: Sequence[SupportsStr]) -> LiveTableUpdate:
+        """Add a row to the end of the body
+
+        Args:
+            row: The values in the row
+
+        Returns:
+            The lines of the table that changed
+
+        Raises:
+            BodyColumnCountMismatchError: If the row has a different number of columns
+        """
+        return self.extend((row,))
+
+    def extend(self, rows: Iterable[Sequence[SupportsStr]]) -> LiveTableUpdate:
+        """Add rows to the end of the body
+
+        Args:
+            rows: The rows to add
+
+        Returns:
+            The lines of the table that changed
+
+        Raises:
+            BodyColumnCountMismatchError: If any row has a different number of columns
+        """
+        layout = self.__layout
+        if layout is None or not self.__rows or self.__options.transpose:
+            return self.__relayout_update([*self.__rows, *rows])
+        prepared = [layout.prepare_row(row) for row in rows]
+        if not layout.fits_layout(prepared):
+            return self.__relayout_update([*self.__rows, *prepared])
+        start = len(self.__head) + self.__body_line_count
+        previous_row = self.__rows[-1]
+        for index, row in enumerate(prepared, len(self.__rows)):
+            lines = _split_lines(layout.rows_to_ascii((row,), previous_row, index))
+            self.__row_lines.append(lines)
+            self.__body_line_count += len(lines)
+            previous_row = row
+        self.__rows.extend(prepared)
+        self.__tail = _split_lines(layout.tail_to_ascii(previous_row))
+        new_lines = list(chain(*self.__row_lines[len(self.__row_lines) - len(prepared) :]))
+        return LiveTableUpdate(start=start, lines=new_lines + self.__tail, relayout=False)
+
+    def update(self, body: Sequence[Sequence[SupportsStr]]) -> list[LineChange]:
+        """Replace the rows of the body, rendering only the rows that changed
+
+        Rows are compared by position with the previous body using ``==``. A changed row is
+        rendered again along with the separators above and below it, and the lines above
+        and below the body if it is the first or last row. Rendered lines of other rows
+        are reused.
+
+        Example::
+
+            previous_lines = table.lines
+            changes = table.update(new_body)
+            for change in reversed(changes):
+                previous_lines[change.start : change.stop] = change.lines
+            assert previous_lines == table.lines
+
+        Args:
+            body: The new rows of the body
+
+        Returns:
+            The ranges of lines that changed, in order and without overlaps. The ranges refer to
+            the lines of the table before the update, so applying them from last to first
+            turns the previous lines into the new lines.
+
+        Raises:
+            BodyColumnCountMismatchError: If any row has a different number of columns
+        """
+        layout = self.__layout
+        old_line_count = len(self.__head) + self.__body_line_count + len(self.__tail)
+        if layout is None or not self.__rows or not body or self.__options.transpose:
+            return self.__relayout_changes(body, old_line_count)
+        prepared = [layout.prepare_row(row) for row in body]
+        old_rows = self.__rows
+        dirty = [
+            index
+            for index, row in enumerate(prepared)
+            if index >= len(old_rows) or row != old_rows[index]
+        ]
+        if not layout.fits_layout([prepared[index] for index in dirty]):
+            return self.__relayout_changes(prepared, old_line_count)
+        # a changed row affects the separator above the row after it
+        rerender = set(dirty)
+        rerender.update(index + 1 for index in dirty if index + 1 < len(prepared))
+        new_row_lines = [
+            (
+                _split_lines(
+                    layout.rows_to_ascii((row,), prepared[index - 1] if index > 0 else None, index)
+                )
+                if index in rerender
+                else self.__row_lines[index]
+            )
+            for index, row in enumerate(prepared)
+        ]
+        new_head = (
+            _split_lines(layout.head_to_ascii(prepared[0]))
+            if prepared[0] != old_rows[0]
+            else self.__head
+        )
+        new_tail = (
+            _split_lines(layout.tail_to_ascii(prepared[-1]))
+            if len(prepared) != len(old_rows) or prepared[-1] != old_rows[-1]
+            else self.__tail
+        )
+        # compare the head, the rows both bodies have, and the remaining rows with the tail
+        common = min(len(prepared), len(old_rows))
+        old_pieces = [self.__head, *self.__row_lines[:common]]
+        old_pieces.append(list(chain(*self.__row_lines[common:], self.__tail)))
+        new_pieces = [new_head, *new_row_lines[:common]]
+        new_pieces.append(list(chain(*new_row_lines[common:], new_tail)))
+        changes: list[LineChange] = []
+        offset = 0
+        for old_lines, new_lines in zip(old_pieces, new_pieces):
+            if old_lines is not new_lines and old_lines != new_lines:
+                change = _changed_lines(offset, old_lines, new_lines)
+                # merge with the previous change if they are adjacent
+                if changes and changes[-1].stop == change.start:
+                    previous = changes.pop()
+                    change = LineChange(previous.start, change.stop, previous.lines + change.lines)
+                changes.append(change)
+            offset += len(old_lines)
+        self.__rows = prepared
+        self.__head = new_head
+        self.__row_lines = new_row_lines
+        self.__tail = new_tail
+        self.__body_line_count = sum(len(lines) for lines in new_row_lines)
+        return changes
+
+    def __render_all(self, rows: Sequence[Sequence[SupportsStr]]) -> None:
+        """Calculate the layout from all rows and render the whole table
+
+        The rows replace the body only once the layout has been calculated, so that the
+        table is left unchanged if any row is invalid.
+        """
+        if not self.__header and not self.__footer and not rows:
+            self.__rows = []
+            self.__layout = None
+            self.__head, self.__row_lines, self.__tail = [], [], []
+            self.__body_line_count = 0
+            return
+        layout = TableToAscii(self.__header, rows, self.__footer, self.__options)
+        self.__layout = layout
+        if self.__options.transpose:
+            self.__rows = [list(row) for row in rows]
+            # the rows of the body are the columns of the table, so the lines are all in the head
+            self.__head = layout.to_ascii().split("\n")
+            self.__row_lines, self.__tail = [], []
+            self.__body_line_count = 0
+            return
+        # use the rows as prepared by the layout so that they compare equal in later updates
+        self.__rows = [layout.prepare_row(row) for row in rows]
+        rows = self.__rows
+        self.__head = _split_lines(layout.head_to_ascii(rows[0] if rows else None))
+        self.__row_lines = []
+        previous_row = None
+        for index, row in enumerate(rows):
+            self.__row_lines.append(_split_lines(layout.rows_to_ascii((row,), previous_row, index)))
+            previous_row = row
+        self.__tail = _split_lines(layout.tail_to_ascii(previous_row))
+        self.__body_line_count = sum(len(lines) for lines in self.__row_lines)
+
+    def __relayout_update(self, rows: Sequence[Sequence[SupportsStr]]) -> LiveTableUpdate:
+        """Render the whole table and describe the update as a change to every line"""
+        self.__render_all(rows)
+        return LiveTableUpdate(start=0, lines=self.lines, relayout=True)
+
+    def __relayout_changes(
+        self, rows: Sequence[Sequence[SupportsStr]], old_line_count: int
+    ) -> list[LineChange]:
+        """Render the whole table and describe the update as a change to every line"""
+        self.__render_all(rows)
+        return [LineChange(0, old_line_count, self.lines)]
+
+
+class LiveTableWriter:
+    """Keeps a :class:`LiveTable` on a terminal, redrawing only the lines that changed
+
+    Each frame compares the lines of the table with the lines on the screen and moves the
+    cursor with ANSI escape sequences to rewrite only the lines that differ, so that large
+    tables update without flickering or resending the whole table. Each frame is written
+    with a single call to ``stream.write``.
+
+    Frames are drawn at most once every ``min_interval`` seconds. Changes made sooner are
+    drawn by the next frame, so :meth:`close` (or leaving the ``with`` block) should be called
+    to draw the final state. Nothing else should be written to the stream while the writer
+    is in use, and the table should fit within the height of the terminal, since lines
+    scrolled out of view cannot be redrawn.
+
+    Example::
+
+        import sys
+
+        from table2ascii import LiveTable, LiveTableWriter
+
+        with LiveTableWriter(sys.stdout, LiveTable(header=["Job", "Status"])) as writer:
+            for job in jobs:
+                writer.append([job.name, job.status])
+            ...
+            writer.update([[job.name, job.status] for job in jobs])
+
+    .. versionadded:: 1.3.0
+
+    Args:
+        stream: The terminal to write to, such as :data:`sys.stdout`
+        table: The table to display
+        min_interval: The minimum number of seconds between frames. Defaults to ``0.1``.
+    """
+
+    def __init__(self, stream: TextIO, table: LiveTable, *, min_interval: float = 0.1):
+        self.__stream = stream
+        self.__table = table
+        self.__min_interval = min_interval
+        # lines currently on the screen; the cursor is at the start of the line below them
+        self.__screen: list[str] = []
+        self.__last_frame = float("-inf")
+
+    @property
+    def table(self) -> LiveTable:
+        """The table being displayed"""
+        return self.__table
+
+    def __enter__(self) -> LiveTableWriter:
+        self.refresh(force=True)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def append(self, row: Sequence[SupportsStr]) -> None:
+        """Add a row to the end of the body of the table and draw a frame if one is due
+
+        Args:
+            row: The values in the row
+        """
+        self.__table.append(row)
+        self.refresh()
+
+    def extend(self, rows: Iterable[Sequence[SupportsStr]]) -> None:
+        """Add rows to the end of the body of the table and draw a frame if one is due
+
+        Args:
+            rows: The rows to add
+        """
+        self.__table.extend(rows)
+        self.refresh()
+
+    def update(self, body: Sequence[Sequence[SupportsStr]]) -> None:
+        """Replace the rows of the body of the table and draw a frame if one is due
+
+        Args:
+            body: The new rows of the body
+        """
+        self.__table.update(body)
+        self.refresh()
+
+    def refresh(self, force: bool = False) -> bool:
+        """Draw the lines of the table that differ from the screen
+
+        Args:
+            force: Whether to draw a frame even if the previous frame was drawn less than
+                ``min_interval`` seconds ago
+
+        Returns:
+            Whether a frame was drawn
+        """
+        now = monotonic()
+        if not force and now - self.__last_frame < self.__min_interval:
+            return False
+        self.__last_frame = now
+        lines = self.__table.lines
+        frame = _frame(self.__screen, lines)
+        self.__screen = lines
+        if frame:
+            self.__stream.write(frame)
+            self.__stream.flush()
+        return True
+
+    def close(self) -> None:
+        """Draw the final state of the table"""
+        self.refresh(force=True)
+
+
+def _frame(screen: list[str], lines: list[str]) -> str:
+    """Get the text and escape sequences to turn the lines on the screen into new lines
+
+    The cursor is expected to be at the start of the line below the lines on the screen,
+    and is left at the start of the line below the new lines.
+
+    Args:
+        screen: The lines currently on the screen
+        lines: The lines to display
+
+    Returns:
+        The text to write to the terminal
+    """
+    parts = []
+    cursor = len(screen)
+
+    def move_to(row: int) -> None:
+        """Move the cursor to the start of a row that is on the screen"""
+        if cursor > row:
+            parts.append(f"\x1b[{cursor - row}A")
+        elif cursor < row:
+            parts.append(f"\x1b[{row - cursor}B")
+        parts.append("\r")
+
+    for index in range(min(len(screen), len(lines))):
+        if screen[index] != lines[index]:
+            # rewrite the line and erase the rest of the old line
+            move_to(index)
+            parts.append(f"{lines[index]}\x1b[K")
+            cursor = index
+    if len(lines) < len(screen):
+        # erase the lines that are no longer needed
+        move_to(len(lines))
+        parts.append("\x1b[J")
+    else:
+        move_to(len(screen))
+        # new lines at the bottom are written with newlines so that the terminal scrolls
+        parts.extend(f"{line}\x1b[K\n" for line in lines[len(screen) :])
+    # nothing to write if the cursor did not need to leave the line below the table
+    return "" if parts == ["\r"] else "".join(parts)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, NamedTuple
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii
+
+
+class OutputSize(NamedTuple):
+    """The size of the output of :func:`~table2ascii.table2ascii`
+
+    .. versionadded:: 1.3.0
+    """
+
+    characters: int
+    """The number of characters in the output"""
+    bytes: int
+    """The number of bytes in the encoded output"""
+    lines: int
+    """The number of lines in the output"""
+
+
+def measure_table(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    encoding: str = "utf-8",
+    **options: Any,
+) -> OutputSize:
+    """Calculate the exact size of the output of :func:`~table2ascii.table2ascii` without
+    generating it
+
+    This can be used to reject or paginate tables that would be too large for a message
+    or request before spending the time to render them.
+
+    Example::
+
+        from table2ascii import measure_table, table2ascii
+
+        if measure_table(header, body).characters <= 2000:
+            message = table2ascii(header, body)
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        encoding: The encoding to count the bytes of the output in. Defaults to ``"utf-8"``.
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+    Returns:
+        The number of characters, bytes, and lines in the output
+
+    .. versionadded:: 1.3.0
+    """
+    characters, size, lines = TableToAscii(header, body, footer, Options(**options)).measure_output(
+        encoding
+    )
+    return OutputSize(characters=characters, bytes=size, lines=lines)
+
+
+def table2ascii_into(
+    buffer: bytearray | memoryview,
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    encoding: str = "utf-8",
+    **options: Any,
+) -> int:
+    """Convert a 2D Python table to ASCII text, writing the encoded text into a buffer
+
+    The output is encoded one row at a time, so the text of the whole table is never held
+    in memory at once. Use :func:`measure_table` to find the size of buffer needed.
+
+    Example::
+
+        from table2ascii import measure_table, table2ascii_into
+
+        buffer = bytearray(measure_table(header, body).bytes)
+        table2ascii_into(buffer, header, body)
+
+    Args:
+        buffer: A writable buffer, such as a :class:`bytearray`, to write the output to,
+            starting at the beginning of the buffer
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        encoding: The encoding to write the output in. Defaults to ``"utf-8"``.
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+    Returns:
+        The number of bytes written
+
+    Raises:
+        BufferTooSmallError: If the output does not fit in the buffer
+
+    .. versionadded:: 1.3.0
+    """
+    return TableToAscii(header, body, footer, Options(**options)).render_into(buffer, encoding)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from .alignment import Alignment
+from .preset_style import PresetStyle
+from .stats import RenderStats
 from .table_style import TableStyle
 
 
@@ -11,6 +13,12 @@ from .table_style import TableStyle
 class Options:
     """Class for storing options that the user sets
 
+    The defaults match the defaults of :func:`~table2ascii.table2ascii`.
+
+    .. versionchanged:: 1.3.0
+
+        Added ``workers``, ``stats``, ``validate``, ``repeat_header_every``, ``max_width``, ``columns``, and ``transpose`` options and default values for all options
+
     .. versionchanged:: 1.1.0
 
         Added ``number_alignments`` option
@@ -20,11 +28,18 @@ class Options:
         Added ``use_wcwidth`` option
     """
 
-    first_col_heading: bool
-    last_col_heading: bool
-    column_widths: Sequence[int | None] | None
-    alignments: Sequence[Alignment] | Alignment | None
-    number_alignments: Sequence[Alignment] | Alignment | None
-    cell_padding: int
-    style: TableStyle
-    use_wcwidth: bool
+    first_col_heading: bool = False
+    last_col_heading: bool = False
+    column_widths: Sequence[int | None] | None = None
+    alignments: Sequence[Alignment] | Alignment | None = None
+    number_alignments: Sequence[Alignment] | Alignment | None = None
+    cell_padding: int = 1
+    style: TableStyle = field(default_factory=lambda: PresetStyle.double_thin_compact)
+    use_wcwidth: bool = True
+    workers: int | None = None
+    stats: RenderStats | None = None
+    validate: bool = True
+    repeat_header_every: int | None = None
+    max_width: int | None = None
+    columns: Sequence[int] | None = None
+    transpose: bool = False
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from .annotations import SupportsStr
+from .options import Options
+from .table_to_ascii import TableToAscii
+
+
+def table2ascii_panels(
+    header: Sequence[SupportsStr] | None = None,
+    body: Sequence[Sequence[SupportsStr]] | None = None,
+    footer: Sequence[SupportsStr] | None = None,
+    *,
+    panel_width: int,
+    key_columns: Sequence[int] | None = None,
+    **options: Any,
+) -> list[str]:
+    """Convert a 2D Python table with many columns to ASCII text split into panels of
+    columns that each fit in a maximum width, such as the width of a terminal or page
+
+    The columns are split between panels in their original order, and the key columns are
+    repeated in every panel so that each row can still be identified. The cells are measured
+    once for the whole table, so a column has the same width in every panel. Each panel is a
+    complete table with its own edges, header, and footer.
+
+    Example::
+
+        import shutil
+
+        from table2ascii import table2ascii_panels
+
+        width = shutil.get_terminal_size().columns
+        for panel in table2ascii_panels(header, body, panel_width=width, first_col_heading=True):
+            print(panel)
+
+    Args:
+        header: The values in the header of the table
+        body: The rows of values in the body of the table
+        footer: The values in the footer of the table
+        panel_width: The maximum width of each panel in characters
+        key_columns: The indices of the columns to repeat in every panel. Defaults to the
+            first column if ``first_col_heading`` is set and the last column if
+            ``last_col_heading`` is set, or no columns otherwise.
+        options: Keyword arguments accepted by :func:`~table2ascii.table2ascii`
+
+    Returns:
+        The panels of the table, without trailing newlines
+
+    Raises:
+        MaxWidthTooSmallError: If a column does not fit in a panel along with the key columns
+        InvalidColumnsError: If an index of a key column is out of range
+
+    .. versionadded:: 1.3.0
+    """
+    table = TableToAscii(header, body, footer, Options(**options))
+    return list(table.iter_panels(panel_width, key_columns))
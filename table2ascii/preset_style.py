@@ -1,6 +1,31 @@
+from __future__ import annotations
+
 from .table_style import TableStyle
 
 
+class _LazyStyle:
+    """Descriptor that creates a preset :class:`TableStyle` the first time it is accessed
+    so that importing the package does not create every preset style"""
+
+    __slots__ = ("__string", "__overrides", "__name")
+
+    def __init__(self, string: str, **overrides: str):
+        self.__string = string
+        self.__overrides = overrides
+        self.__name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.__name = name
+
+    def __get__(self, instance: object, owner: type) -> TableStyle:
+        style = TableStyle.from_string(self.__string)
+        if self.__overrides:
+            style = style.set(**self.__overrides)
+        # replace the descriptor with the style so that later lookups are plain attribute lookups
+        setattr(owner, self.__name, style)
+        return style
+
+
 class PresetStyle:
     """Importable preset styles for more easily selecting a :ref:`TableStyle`.
 
@@ -25,34 +50,34 @@ class PresetStyle:
         \"\"\"
     """
 
-    thin = TableStyle.from_string("┌─┬─┐││ ├─┼─┤├─┼─┤└┴─┘────┬┴┬┴")
-    thin_box = TableStyle.from_string("┌─┬┬┐│││├─┼┼┤├─┼┼┤└┴┴┘┬┴┬┴┬┴┬┴")
-    thin_rounded = TableStyle.from_string("╭─┬─╮││ ├─┼─┤├─┼─┤╰┴─╯────┬┴┬┴")
-    thin_compact = TableStyle.from_string("┌─┬─┐││ ├─┼─┤     └┴─┘  ──  ┬┴")
-    thin_compact_rounded = TableStyle.from_string("╭─┬─╮││ ├─┼─┤     ╰┴─╯  ──  ┬┴")
-    thin_thick = TableStyle.from_string("┌─┬─┐││ ┝━┿━┥├─┼─┤└┴─┘──━━┬┴┯┷")
-    thin_thick_rounded = TableStyle.from_string("╭─┬─╮││ ┝━┿━┥├─┼─┤╰┴─╯──━━┬┴┯┷")
-    thin_double = TableStyle.from_string("┌─┬─┐││ ╞═╪═╡├─┼─┤└┴─┘──══┬┴╤╧")
-    thin_double_rounded = TableStyle.from_string("╭─┬─╮││ ╞═╪═╡├─┼─┤╰┴─╯──══┬┴╤╧")
-    thick = TableStyle.from_string("┏━┳━┓┃┃ ┣━╋━┫┣━╋━┫┗┻━┛━━━━┳┻┳┻")
-    thick_box = TableStyle.from_string("┏━┳┳┓┃┃┃┣━╋╋┫┣━╋╋┫┗┻┻┛┳┻┳┻┳┻┳┻")
-    thick_compact = TableStyle.from_string("┏━┳━┓┃┃ ┣━╋━┫     ┗┻━┛  ━━  ┳┻")
-    double = TableStyle.from_string("╔═╦═╗║║ ╠═╬═╣╠═╬═╣╚╩═╝════╦╩╦╩")
-    double_box = TableStyle.from_string("╔═╦╦╗║║║╠═╬╬╣╠═╬╬╣╚╩╩╝╦╩╦╩╦╩╦╩")
-    double_compact = TableStyle.from_string("╔═╦═╗║║ ╠═╬═╣     ╚╩═╝  ══  ╦╩")
-    double_thin_box = TableStyle.from_string("╔═╦╤╗║║│╠═╬╪╣╟─╫┼╢╚╩╧╝┬┴╤╧╥╨╦╩")
-    double_thin_compact = TableStyle.from_string("╔═╦═╗║║ ╟─╫─╢     ╚╩═╝  ──  ╥╨")
-    minimalist = TableStyle.from_string(" ───  │  ━━━  ───  ── ──━━┬┴┯┷")
-    borderless = TableStyle.from_string("      ┃  ━              ━━  ━━")
-    simple = TableStyle.from_string(" ═    ║  ═              ══  ╦╩")
-    ascii = TableStyle.from_string("+-+-+|| +-+-++-+-+++-+----++++")
-    ascii_box = TableStyle.from_string("+-+++|||+-++++-+++++++++++++++")
-    ascii_compact = TableStyle.from_string("+-+-+|| +-+-+     ++-+  --  --")
-    ascii_double = TableStyle.from_string("+-+-+|| +=+=++-+-+++-+--==--==")
-    ascii_minimalist = TableStyle.from_string(" ---  |  ===  ---  -- --==--==")
-    ascii_borderless = TableStyle.from_string("      |  -              --  --")
-    ascii_simple = TableStyle.from_string(" =    |  =              ==  ==")
-    ascii_rounded = TableStyle.from_string(r"/===\|| |=|=||-|-|\|=/--==--==")
-    ascii_rounded_box = TableStyle.from_string(r"/===\||||=||||-|||\||/--==--==")
-    markdown = TableStyle.from_string("     ||||-|||           --  --")
-    plain = TableStyle.from_string(" " * 30).set(left_and_right_edge="")
+    thin = _LazyStyle("┌─┬─┐││ ├─┼─┤├─┼─┤└┴─┘────┬┴┬┴")
+    thin_box = _LazyStyle("┌─┬┬┐│││├─┼┼┤├─┼┼┤└┴┴┘┬┴┬┴┬┴┬┴")
+    thin_rounded = _LazyStyle("╭─┬─╮││ ├─┼─┤├─┼─┤╰┴─╯────┬┴┬┴")
+    thin_compact = _LazyStyle("┌─┬─┐││ ├─┼─┤     └┴─┘  ──  ┬┴")
+    thin_compact_rounded = _LazyStyle("╭─┬─╮││ ├─┼─┤     ╰┴─╯  ──  ┬┴")
+    thin_thick = _LazyStyle("┌─┬─┐││ ┝━┿━┥├─┼─┤└┴─┘──━━┬┴┯┷")
+    thin_thick_rounded = _LazyStyle("╭─┬─╮││ ┝━┿━┥├─┼─┤╰┴─╯──━━┬┴┯┷")
+    thin_double = _LazyStyle("┌─┬─┐││ ╞═╪═╡├─┼─┤└┴─┘──══┬┴╤╧")
+    thin_double_rounded = _LazyStyle("╭─┬─╮││ ╞═╪═╡├─┼─┤╰┴─╯──══┬┴╤╧")
+    thick = _LazyStyle("┏━┳━┓┃┃ ┣━╋━┫┣━╋━┫┗┻━┛━━━━┳┻┳┻")
+    thick_box = _LazyStyle("┏━┳┳┓┃┃┃┣━╋╋┫┣━╋╋┫┗┻┻┛┳┻┳┻┳┻┳┻")
+    thick_compact = _LazyStyle("┏━┳━┓┃┃ ┣━╋━┫     ┗┻━┛  ━━  ┳┻")
+    double = _LazyStyle("╔═╦═╗║║ ╠═╬═╣╠═╬═╣╚╩═╝════╦╩╦╩")
+    double_box = _LazyStyle("╔═╦╦╗║║║╠═╬╬╣╠═╬╬╣╚╩╩╝╦╩╦╩╦╩╦╩")
+    double_compact = _LazyStyle("╔═╦═╗║║ ╠═╬═╣     ╚╩═╝  ══  ╦╩")
+    double_thin_box = _LazyStyle("╔═╦╤╗║║│╠═╬╪╣╟─╫┼╢╚╩╧╝┬┴╤╧╥╨╦╩")
+    double_thin_compact = _LazyStyle("╔═╦═╗║║ ╟─╫─╢     ╚╩═╝  ──  ╥╨")
+    minimalist = _LazyStyle(" ───  │  ━━━  ───  ── ──━━┬┴┯┷")
+    borderless = _LazyStyle("      ┃  ━              ━━  ━━")
+    simple = _LazyStyle(" ═    ║  ═              ══  ╦╩")
+    ascii = _LazyStyle("+-+-+|| +-+-++-+-+++-+----++++")
+    ascii_box = _LazyStyle("+-+++|||+-++++-+++++++++++++++")
+    ascii_compact = _LazyStyle("+-+-+|| +-+-+     ++-+  --  --")
+    ascii_double = _LazyStyle("+-+-+|| +=+=++-+-+++-+--==--==")
+    ascii_minimalist = _LazyStyle(" ---  |  ===  ---  -- --==--==")
+    ascii_borderless = _LazyStyle("      |  -              --  --")
+    ascii_simple = _LazyStyle(" =    |  =              ==  ==")
+    ascii_rounded = _LazyStyle(r"/===\|| |=|=||-|-|\|=/--==--==")
+    ascii_rounded_box = _LazyStyle(r"/===\||||=||||-|||\||/--==--==")
+    markdown = _LazyStyle("     ||||-|||           --  --")
+    plain = _LazyStyle(" " * 30, left_and_right_edge="")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Iterable, NamedTuple
+
+
+class RenderedTable(NamedTuple):
+    """A rendered table and the display width of its lines, for composing with
+    :func:`~table2ascii.compose_grid` and :func:`~table2ascii.iter_grid_lines`
+    or nesting inside a cell of another table
+
+    Use :func:`~table2ascii.render_table` to render a table along with its width, which is
+    known from its layout, so that the lines never need to be measured again.
+
+    A table rendered without ``lazy=True`` can be used as a cell value. The outer table
+    uses its lines and width as they are instead of converting it to a string and
+    measuring each line.
+
+    Example::
+
+        from table2ascii import render_table, table2ascii
+
+        scores = render_table(["Round", "Score"], [[1, 10], [2, 8]])
+        print(table2ascii(["Player", "Scores"], [["Alice", scores]]))
+
+    .. versionadded:: 1.3.0
+    """
+
+    lines: Iterable[str]
+    """The lines of the table, without trailing newlines"""
+    width: int
+    """The display width of every line of the table"""
+
+    def __str__(self) -> str:
+        return "\n".join(self.lines)
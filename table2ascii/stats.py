@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+
+@dataclass
+class RenderStats:
+    """Timings and counters collected while rendering tables
+
+    Pass an instance as the ``stats`` argument of :func:`table2ascii` to record how long each
+    phase of rendering takes. The values accumulate over every table rendered with the same
+    instance, so a single instance can be used to collect totals over many renders.
+
+    When ``stats`` is not specified, nothing is recorded.
+
+    Example::
+
+        from table2ascii import RenderStats, table2ascii
+
+        stats = RenderStats()
+        table2ascii(header=["Name", "Score"], body=[["Alice", 10], ["Bob", 8]], stats=stats)
+
+        print(stats.phase_seconds["column_widths"], stats.lines, stats.output_bytes)
+
+    .. versionadded:: 1.3.0
+
+    Attributes:
+        renders (:class:`int`): The number of tables rendered
+        phase_seconds (:class:`dict` [:class:`str`, :class:`float`]): The wall time in seconds
+            spent in each phase of rendering:
+
+            - ``"validation"``: checking the options and the number of columns in each row
+            - ``"decimal_widths"``: finding the decimal point positions for decimal alignment
+            - ``"column_widths"``: measuring the cells to calculate the column widths
+            - ``"wrapping"``: wrapping cells that are wider than their (merged) column
+            - ``"assembly"``: padding the cells and assembling the lines of the table
+        cells_measured (:class:`int`): The number of cells measured to calculate column widths
+        wcwidth_calls (:class:`int`): The number of calls made to :func:`wcwidth.width`
+        width_cache_hits (:class:`int`): The number of text widths found in the width cache
+        width_cache_misses (:class:`int`): The number of text widths not found in the width cache
+        lines (:class:`int`): The number of lines of output produced
+        output_bytes (:class:`int`): The size of the output produced in bytes when encoded as UTF-8
+    """
+
+    renders: int = 0
+    phase_seconds: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(
+            ("validation", "decimal_widths", "column_widths", "wrapping", "assembly"), 0.0
+        )
+    )
+    cells_measured: int = 0
+    wcwidth_calls: int = 0
+    width_cache_hits: int = 0
+    width_cache_misses: int = 0
+    lines: int = 0
+    output_bytes: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        """The total wall time in seconds spent in all phases"""
+        return sum(self.phase_seconds.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats as a dictionary, for exporting to a metrics system
+
+        Returns:
+            A dictionary mapping the attribute names to their values
+        """
+        return asdict(self)
+
+    def reset(self) -> None:
+        """Reset all timings and counters to zero"""
+        fresh = RenderStats()
+        for name, value in asdict(fresh).items():
+            setattr(self, name, value)
@@ -1,10 +1,45 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
+from typing import Any, NamedTuple, Tuple, Type
 import warnings
+from weakref import WeakValueDictionary
 
 from .exceptions import TableStyleTooShortWarning, TableStyleTooLongError
 
 
-@dataclass
+class SeparatorGlyphs(NamedTuple):
+    """The parts of a :class:`TableStyle` used to draw one kind of separator line
+
+    .. versionadded:: 1.3.0
+    """
+
+    left_edge: str
+    """The character at the start of the line"""
+    heading_col_sep: str
+    """The character after the first or before the last column when it is a heading column"""
+    column_separator: str
+    """The character between columns"""
+    right_edge: str
+    """The character at the end of the line"""
+    filler: str
+    """The character repeated for the width of each column"""
+    top_tee: str
+    """The column separator when the cell below the line is merged with the cell to its left"""
+    bottom_tee: str
+    """The column separator when the cell above the line is merged with the cell to its left"""
+    heading_col_top_tee: str
+    """The heading column separator when the cell below the line is merged"""
+    heading_col_bottom_tee: str
+    """The heading column separator when the cell above the line is merged"""
+
+
+# interned styles by class and glyphs, so that equal styles are usually the same object,
+# holding only weak references so that styles that are no longer used can be freed
+_interned: "WeakValueDictionary[Tuple[Type[TableStyle], Tuple[str, ...]], TableStyle]" = (
+    WeakValueDictionary()
+)
+
+
+@dataclass(frozen=True)
 class TableStyle:
     """Class for storing information about a table style
 
@@ -59,6 +94,16 @@ class TableStyle:
         [W] = ┬ [X] = ┴ [Y] = ╤ [Z] = ╧
         [0] = ╥ [1] = ╨ [2] = ╦ [3] = ╩
 
+    Table styles are immutable and hashable, so they can be shared between threads and used
+    as dictionary keys. :meth:`from_string` and :meth:`set` return the same object for styles
+    with the same characters.
+
+    .. versionchanged:: 1.3.0
+
+        Table styles are now immutable. :meth:`set` returns a new table style instead of
+        modifying the existing one. Added :attr:`top_edge_glyphs`, :attr:`heading_row_glyphs`,
+        :attr:`body_row_glyphs`, and :attr:`bottom_edge_glyphs`.
+
     .. versionchanged:: 1.0.0
 
         Added fields for edges of merged cells:
@@ -101,6 +146,150 @@ class TableStyle:
     heading_col_heading_row_top_tee: str  # 2
     heading_col_heading_row_bottom_tee: str  # 3
 
+    __slots__ = (
+        "top_left_corner",
+        "top_and_bottom_edge",
+        "heading_col_top_tee",
+        "top_tee",
+        "top_right_corner",
+        "left_and_right_edge",
+        "heading_col_sep",
+        "col_sep",
+        "heading_row_left_tee",
+        "heading_row_sep",
+        "heading_col_heading_row_cross",
+        "heading_row_cross",
+        "heading_row_right_tee",
+        "row_left_tee",
+        "row_sep",
+        "heading_col_row_cross",
+        "col_row_cross",
+        "row_right_tee",
+        "bottom_left_corner",
+        "heading_col_bottom_tee",
+        "bottom_tee",
+        "bottom_right_corner",
+        "col_row_top_tee",
+        "col_row_bottom_tee",
+        "heading_row_top_tee",
+        "heading_row_bottom_tee",
+        "heading_col_body_row_top_tee",
+        "heading_col_body_row_bottom_tee",
+        "heading_col_heading_row_top_tee",
+        "heading_col_heading_row_bottom_tee",
+        "__glyphs",
+        "__hash",
+        "__top_edge_glyphs",
+        "__heading_row_glyphs",
+        "__body_row_glyphs",
+        "__bottom_edge_glyphs",
+        "__weakref__",
+    )
+
+    def __post_init__(self) -> None:
+        # declared for type checkers, the values are set below since the dataclass is frozen
+        self.__glyphs: Tuple[str, ...]
+        self.__hash: int
+        self.__top_edge_glyphs: SeparatorGlyphs
+        self.__heading_row_glyphs: SeparatorGlyphs
+        self.__body_row_glyphs: SeparatorGlyphs
+        self.__bottom_edge_glyphs: SeparatorGlyphs
+        # precompute the hash and the glyphs for each kind of separator since styles are immutable
+        glyphs = tuple(getattr(self, field.name) for field in fields(self))
+        object.__setattr__(self, "_TableStyle__glyphs", glyphs)
+        object.__setattr__(self, "_TableStyle__hash", hash(glyphs))
+        object.__setattr__(
+            self,
+            "_TableStyle__top_edge_glyphs",
+            SeparatorGlyphs(
+                left_edge=self.top_left_corner,
+                heading_col_sep=self.heading_col_top_tee,
+                column_separator=self.top_tee,
+                right_edge=self.top_right_corner,
+                filler=self.top_and_bottom_edge,
+                top_tee=self.col_row_top_tee,
+                bottom_tee=self.top_and_bottom_edge,
+                heading_col_top_tee=self.heading_col_top_tee,
+                heading_col_bottom_tee=self.top_and_bottom_edge,
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_TableStyle__heading_row_glyphs",
+            SeparatorGlyphs(
+                left_edge=self.heading_row_left_tee,
+                heading_col_sep=self.heading_col_heading_row_cross,
+                column_separator=self.heading_row_cross,
+                right_edge=self.heading_row_right_tee,
+                filler=self.heading_row_sep,
+                top_tee=self.heading_row_top_tee,
+                bottom_tee=self.heading_row_bottom_tee,
+                heading_col_top_tee=self.heading_col_heading_row_top_tee,
+                heading_col_bottom_tee=self.heading_col_heading_row_bottom_tee,
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_TableStyle__body_row_glyphs",
+            SeparatorGlyphs(
+                left_edge=self.row_left_tee,
+                heading_col_sep=self.heading_col_row_cross,
+                column_separator=self.col_row_cross,
+                right_edge=self.row_right_tee,
+                filler=self.row_sep,
+                top_tee=self.col_row_top_tee,
+                bottom_tee=self.col_row_bottom_tee,
+                heading_col_top_tee=self.heading_col_body_row_top_tee,
+                heading_col_bottom_tee=self.heading_col_body_row_bottom_tee,
+            ),
+        )
+        object.__setattr__(
+            self,
+            "_TableStyle__bottom_edge_glyphs",
+            SeparatorGlyphs(
+                left_edge=self.bottom_left_corner,
+                heading_col_sep=self.heading_col_bottom_tee,
+                column_separator=self.bottom_tee,
+                right_edge=self.bottom_right_corner,
+                filler=self.top_and_bottom_edge,
+                top_tee=self.top_and_bottom_edge,
+                bottom_tee=self.col_row_bottom_tee,
+                heading_col_top_tee=self.top_and_bottom_edge,
+                heading_col_bottom_tee=self.heading_col_bottom_tee,
+            ),
+        )
+
+    @property
+    def top_edge_glyphs(self) -> SeparatorGlyphs:
+        """The parts used to draw the top edge of the table"""
+        return self.__top_edge_glyphs
+
+    @property
+    def heading_row_glyphs(self) -> SeparatorGlyphs:
+        """The parts used to draw the separator below the header and above the footer"""
+        return self.__heading_row_glyphs
+
+    @property
+    def body_row_glyphs(self) -> SeparatorGlyphs:
+        """The parts used to draw the separators between rows of the body"""
+        return self.__body_row_glyphs
+
+    @property
+    def bottom_edge_glyphs(self) -> SeparatorGlyphs:
+        """The parts used to draw the bottom edge of the table"""
+        return self.__bottom_edge_glyphs
+
+    def __hash__(self) -> int:
+        return self.__hash
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # frozen dataclasses with slots cannot be unpickled by setting their attributes
+        return (_unpickle_style, (self.__class__, self.__glyphs))
+
+    def _intern(self) -> "TableStyle":
+        """Return the existing style with the same class and characters, if any"""
+        return _interned.setdefault((self.__class__, self.__glyphs), self)
+
     @classmethod
     def from_string(cls, string: str) -> "TableStyle":
         """Create a TableStyle from a string
@@ -115,7 +304,7 @@ class TableStyle:
             string: The string to create the TableStyle from
 
         Returns:
-            A TableStyle object
+            A TableStyle object. The same object is returned for the same string.
 
         Example::
 
@@ -124,7 +313,7 @@ class TableStyle:
         Raises:
             TableStyleTooLongError: If the string is too long
         """
-        num_params = len(cls.__dataclass_fields__)
+        num_params = len(fields(cls))
         # if the string is too long, raise an error
         if len(string) > num_params:
             raise TableStyleTooLongError(string, num_params)
@@ -132,10 +321,15 @@ class TableStyle:
         elif len(string) < num_params:
             warnings.warn(TableStyleTooShortWarning(string, num_params), stacklevel=2)
             string += " " * (num_params - len(string))
-        return cls(*string)
+        interned = _interned.get((cls, tuple(string)))
+        return interned if interned is not None else cls(*string)._intern()
 
     def set(self, **kwargs: str) -> "TableStyle":
-        """Set attributes of the TableStyle
+        """Create a copy of the TableStyle with some attributes changed
+
+        .. versionchanged:: 1.3.0
+
+            A new TableStyle is returned instead of modifying the existing one.
 
         Args:
             kwargs: The attributes to set
@@ -147,6 +341,9 @@ class TableStyle:
 
             TableStyle.from_string("~" * 30).set(left_and_right_edge="", col_sep="")
         """
-        for key, value in kwargs.items():
-            setattr(self, key, value)
-        return self
+        return replace(self, **kwargs)._intern()
+
+
+def _unpickle_style(cls: Type[TableStyle], glyphs: Tuple[str, ...]) -> TableStyle:
+    """Recreate a pickled table style, reusing the interned style if there is one"""
+    return cls(*glyphs)._intern()
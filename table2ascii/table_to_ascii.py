@@ -1,28 +1,50 @@
 from __future__ import annotations
 
-import textwrap
-from math import ceil, floor
-from collections.abc import Sequence
-
-from wcwidth import width
+import copy
+from collections.abc import Callable, Generator, Iterator, Sequence
+from functools import lru_cache
+from math import ceil
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict
 
 from .alignment import Alignment
 from .annotations import SupportsStr
 from .exceptions import (
     AlignmentCountMismatchError,
     BodyColumnCountMismatchError,
+    BufferTooSmallError,
+    ChunkSizeTooSmallError,
     ColumnWidthTooSmallError,
     ColumnWidthsCountMismatchError,
     FooterColumnCountMismatchError,
     InvalidAlignmentError,
     InvalidCellPaddingError,
+    InvalidColumnsError,
     InvalidColumnWidthError,
+    InvalidRepeatHeaderEveryError,
+    InvalidWorkersError,
+    MaxWidthTooSmallError,
     NoHeaderBodyOrFooterError,
 )
 from .merge import Merge
 from .options import Options
 from .preset_style import PresetStyle
-from .table_style import TableStyle
+from .rendered_table import RenderedTable
+from .stats import RenderStats
+from .table_style import SeparatorGlyphs, TableStyle
+
+if TYPE_CHECKING:
+    from functools import _lru_cache_wrapper
+
+# number of chunks the body is split into per worker when rendering in parallel
+_CHUNKS_PER_WORKER = 4
+# minimum number of body rows rendered by a single task when rendering in parallel
+_MIN_ROWS_PER_CHUNK = 1000
+# maximum number of text widths remembered when measuring with wcwidth
+_WIDTH_CACHE_SIZE = 4096
+# number of rows, or columns of a wide table, validated or measured between the points
+# where laying out a table can pause
+_STEP_SIZE = 256
 
 
 class TableToAscii:
@@ -43,25 +65,89 @@ class TableToAscii:
             footer: The values in the footer of the table
             options: The options for the table
         """
+        for _ in self.__layout(header, body, footer, options):
+            pass
+
+    @classmethod
+    def create_in_steps(
+        cls,
+        header: Sequence[SupportsStr] | None,
+        body: Sequence[Sequence[SupportsStr]] | None,
+        footer: Sequence[SupportsStr] | None,
+        options: Options,
+    ) -> Generator[None, None, TableToAscii]:
+        """Create a table, pausing after each slice of rows that is validated or measured
+        so that the caller can do other work while a large table is laid out
+
+        Tables with fewer rows than a slice are laid out without pausing.
+
+        Args:
+            header: The values in the header of the table
+            body: The rows of values in the body of the table
+            footer: The values in the footer of the table
+            options: The options for the table
+
+        Returns:
+            A generator that yields :py:obj:`None` at each pause and returns the table
+        """
+        table = cls.__new__(cls)
+        yield from table.__layout(header, body, footer, options)
+        return table
+
+    def __layout(
+        self,
+        header: Sequence[SupportsStr] | None,
+        body: Sequence[Sequence[SupportsStr]] | None,
+        footer: Sequence[SupportsStr] | None,
+        options: Options,
+    ) -> Iterator[None]:
+        """Validate arguments and initialize fields, yielding after each slice of rows
+        that is validated or measured"""
         # initialize fields
+        self.__validate = options.validate
+        first_col_heading, last_col_heading = options.first_col_heading, options.last_col_heading
+        if options.transpose:
+            # the header and footer become the first and last columns, and the first and last
+            # columns become the header and footer
+            first_col_heading, last_col_heading = bool(header), bool(footer)
+            header, body, footer = yield from self.__transpose(header, body, footer, options)
         self.__header = list(header) if header else None
-        self.__body = list([list(row) for row in body]) if body else None
         self.__footer = list(footer) if footer else None
         self.__style = options.style
-        self.__first_col_heading = options.first_col_heading
-        self.__last_col_heading = options.last_col_heading
+        self.__first_col_heading = first_col_heading
+        self.__last_col_heading = last_col_heading
         self.__cell_padding = options.cell_padding
         self.__use_wcwidth = options.use_wcwidth
+        self.__workers = options.workers
+        self.__repeat_header_every = options.repeat_header_every
+        self.__stats = options.stats
+        self.__phase_start = perf_counter() if self.__stats is not None else 0.0
+        # time spent wrapping cells during the current render, for the render stats
+        self.__wrapping_seconds = 0.0
+        # remember the widths of recently measured text since cells are measured more than once
+        self.__cached_width = _new_width_cache() if self.__use_wcwidth else None
 
         # calculate number of columns
-        self.__columns = self.__count_columns()
+        self.__columns = self.__count_columns(self.__header, body, self.__footer)
+        # the number of columns in the rows, which differs if only some columns are shown
+        self.__source_column_count = self.__columns
+        # the column of the rows shown in each column of the table, or None to show every column
+        self.__source_columns: list[int] | None = None
 
         # check if footer has a different number of columns
-        if footer and len(footer) != self.__columns:
+        if self.__validate and footer and len(footer) != self.__columns:
             raise FooterColumnCountMismatchError(footer, self.__columns)
-        # check if any rows in body have a different number of columns
-        if body and any(len(row) != self.__columns for row in body):
-            raise BodyColumnCountMismatchError(body, self.__columns)
+        self.__body: Sequence[Sequence[SupportsStr]] | None
+        if options.columns is None and not options.transpose:
+            # copy the body, checking the number of columns in each row in the same pass
+            self.__body = (yield from self.__copy_body(body)) if body else None
+        else:
+            # the rows of the body are read through the selected columns, or are views of the
+            # columns of a transposed body, instead of being copied
+            yield from self.__check_body(body or [], self.__columns)
+            self.__body = body if body else None
+            if options.columns is not None:
+                self.__select_source_columns(self.__check_columns(options.columns))
 
         # check that at least one of header, body, or footer is not None
         if not header and not body and not footer:
@@ -73,36 +159,289 @@ class TableToAscii:
         self.__number_alignments = self.__determine_alignments(
             options.number_alignments, default=self.__alignments
         )
+        self.__end_phase("validation")
 
         # keep track of the number widths and positions of the decimal points for decimal alignment
-        decimal_widths, decimal_positions = self.__calculate_decimal_widths_and_positions()
+        decimal_widths, decimal_positions = (
+            yield from self.__calculate_decimal_widths_and_positions()
+        )
         self.__decimal_widths: list[int] = decimal_widths
         self.__decimal_positions: list[int] = decimal_positions
+        self.__end_phase("decimal_widths")
 
         # calculate or use given column widths
-        self.__column_widths = self.__calculate_column_widths(options.column_widths)
+        self.__column_widths = yield from self.__calculate_column_widths(options.column_widths)
+        # narrow the columns if the table is wider than the maximum width
+        natural_widths = self.__column_widths
+        if options.max_width is not None:
+            self.__column_widths = yield from self.__fit_column_widths(
+                natural_widths, options.column_widths, options.max_width
+            )
+        self.__narrowed = self.__column_widths != natural_widths
+        self.__end_phase("column_widths")
+        if self.__stats is not None:
+            measured_rows = len(self.__body or []) + bool(self.__header) + bool(self.__footer)
+            self.__stats.cells_measured += measured_rows * self.__columns
 
         # check if the cell padding is valid
         if self.__cell_padding < 0:
             raise InvalidCellPaddingError(self.__cell_padding)
 
-        # if any row starts with Merge.LEFT, replace it with an empty string
+        # check if the number of workers is valid
+        if self.__workers is not None and self.__workers < 1:
+            raise InvalidWorkersError(self.__workers)
+
+        # check if the header repeat interval is valid
+        if self.__repeat_header_every is not None and self.__repeat_header_every < 1:
+            raise InvalidRepeatHeaderEveryError(self.__repeat_header_every)
+
+        # if the header or footer starts with Merge.LEFT, replace it with an empty string
         self.__fix_rows_beginning_with_merge()
 
-    def __count_columns(self) -> int:
+        # alignment is resolved once per column instead of for every cell
+        self.__spaces = _Spaces()
+        self.__pad_functions = self.__compile_pad_functions()
+
+        # rows without merged or multi-line cells are formatted with a precompiled template
+        self.__row_template = self.__compile_row_template()
+        self.__inner_widths = [width - self.__cell_padding * 2 for width in self.__column_widths]
+
+        # the header is rendered once to be repeated in the body
+        self.__repeated_header = (
+            self.__content_row_to_ascii(self.__header)
+            if self.__header and self.__repeat_header_every
+            else None
+        )
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the state of the table for pickling, leaving out the width cache
+        and the padding functions"""
+        state = self.__dict__.copy()
+        del state["_TableToAscii__cached_width"]
+        del state["_TableToAscii__pad_functions"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore the state of the table after unpickling with an empty width cache
+        and recompiled padding functions"""
+        self.__dict__.update(state)
+        self.__cached_width = _new_width_cache() if self.__use_wcwidth else None
+        self.__pad_functions = self.__compile_pad_functions()
+
+    def __end_phase(self, phase: str) -> None:
+        """Add the time elapsed since the end of the previous phase to the render stats
+
+        Args:
+            phase: The name of the phase that ended
+        """
+        if self.__stats is None:
+            return
+        now = perf_counter()
+        self.__stats.phase_seconds[phase] += now - self.__phase_start
+        self.__phase_start = now
+
+    def __record_render(self, seconds: float, lines: int, output_bytes: int) -> None:
+        """Add the time spent rendering and the size of the output to the render stats
+
+        Args:
+            seconds: The time spent rendering, including wrapping cells
+            lines: The number of lines rendered
+            output_bytes: The size of the rendered output in bytes
+        """
+        if self.__stats is None:
+            return
+        self.__stats.renders += 1
+        self.__stats.phase_seconds["wrapping"] += self.__wrapping_seconds
+        self.__stats.phase_seconds["assembly"] += seconds - self.__wrapping_seconds
+        self.__wrapping_seconds = 0.0
+        if self.__cached_width is not None:
+            cache_info = self.__cached_width.cache_info()
+            self.__stats.width_cache_hits += cache_info.hits
+            self.__stats.width_cache_misses += cache_info.misses
+            self.__stats.wcwidth_calls += cache_info.misses
+            self.__cached_width.cache_clear()
+        self.__stats.lines += lines
+        self.__stats.output_bytes += output_bytes
+
+    @staticmethod
+    def __count_columns(
+        header: Sequence[SupportsStr] | None,
+        body: Sequence[Sequence[SupportsStr]] | None,
+        footer: Sequence[SupportsStr] | None,
+    ) -> int:
         """Get the number of columns in the table based on the provided header, footer, and body lists.
 
+        Args:
+            header: The values in the header of the table
+            body: The rows of values in the body of the table
+            footer: The values in the footer of the table
+
         Returns:
             The number of columns in the table
         """
-        if self.__header:
-            return len(self.__header)
-        if self.__footer:
-            return len(self.__footer)
-        if self.__body and len(self.__body) > 0:
-            return len(self.__body[0])
+        if header:
+            return len(header)
+        if footer:
+            return len(footer)
+        if body and len(body) > 0:
+            return len(body[0])
         return 0
 
+    def __copy_body(
+        self, body: Sequence[Sequence[SupportsStr]]
+    ) -> Generator[None, None, list[list[SupportsStr]]]:
+        """Copy the rows of the body into lists, replacing a leading :attr:`Merge.LEFT` in each row
+        with an empty string
+
+        Args:
+            body: The rows of values in the body of the table
+
+        Returns:
+            The copied rows
+
+        Raises:
+            BodyColumnCountMismatchError: If validation is enabled and any row has a different
+                number of columns
+        """
+        columns = self.__columns
+        validate = self.__validate
+        copied = []
+        for index, row in enumerate(body):
+            if validate and len(row) != columns:
+                raise BodyColumnCountMismatchError(row, columns, index)
+            row = list(row)
+            if row and row[0] is Merge.LEFT:
+                row[0] = ""
+            copied.append(row)
+            if not (index + 1) % _STEP_SIZE:
+                yield
+        return copied
+
+    def __check_body(self, body: Sequence[Sequence[SupportsStr]], columns: int) -> Iterator[None]:
+        """Check the number of columns in each row of the body without copying the rows
+
+        Args:
+            body: The rows of values in the body of the table
+            columns: The number of columns each row should have
+
+        Raises:
+            BodyColumnCountMismatchError: If validation is enabled and any row has a different
+                number of columns
+        """
+        if not self.__validate:
+            return
+        for index, row in enumerate(body):
+            if len(row) != columns:
+                raise BodyColumnCountMismatchError(row, columns, index)
+            if not (index + 1) % _STEP_SIZE:
+                yield
+
+    def __transpose(
+        self,
+        header: Sequence[SupportsStr] | None,
+        body: Sequence[Sequence[SupportsStr]] | None,
+        footer: Sequence[SupportsStr] | None,
+        options: Options,
+    ) -> Generator[
+        None, None, tuple[list[SupportsStr] | None, list[_TransposedRow], list[SupportsStr] | None]
+    ]:
+        """Swap the rows and columns of a table without copying the cells of the body
+
+        Args:
+            header: The values in the header of the table
+            body: The rows of values in the body of the table
+            footer: The values in the footer of the table
+            options: The options for the table
+
+        Returns:
+            The header, body, and footer of the transposed table
+
+        Raises:
+            FooterColumnCountMismatchError: If validation is enabled and the footer has a
+                different number of columns
+            BodyColumnCountMismatchError: If validation is enabled and any row has a different
+                number of columns
+        """
+        columns = self.__count_columns(header, body, footer)
+        if self.__validate and footer and len(footer) != columns:
+            raise FooterColumnCountMismatchError(footer, columns)
+        yield from self.__check_body(body or [], columns)
+        rows: list[Sequence[SupportsStr]] = [header] if header else []
+        rows += body or []
+        rows += [footer] if footer else []
+        transposed = [_TransposedRow(rows, column) for column in range(columns)]
+        new_header = list(transposed.pop(0)) if options.first_col_heading and transposed else None
+        new_footer = list(transposed.pop()) if options.last_col_heading and transposed else None
+        return new_header, transposed, new_footer
+
+    def __check_columns(self, columns: Sequence[int]) -> list[int]:
+        """Check the indices of the columns to show and convert negative indices
+
+        Args:
+            columns: The indices of the columns of the rows to show, in order
+
+        Returns:
+            The non-negative indices of the columns to show
+
+        Raises:
+            InvalidColumnsError: If no columns are selected or an index is out of range
+        """
+        try:
+            # support negative indices and raise IndexError for invalid ones
+            selected = [range(self.__columns)[i] for i in columns]
+        except IndexError:
+            raise InvalidColumnsError(columns, self.__columns) from None
+        if not selected:
+            raise InvalidColumnsError(columns, self.__columns)
+        return selected
+
+    def __select_source_columns(self, columns: list[int]) -> None:
+        """Show a selection of the columns of the rows as the columns of the table
+
+        Args:
+            columns: The non-negative indices of the columns of the rows to show, in order
+        """
+        self.__source_columns = columns
+        self.__columns = len(columns)
+        # cells are only merged with the cell to their left if it is still next to them
+        self.__unmerged_columns = [
+            col_index
+            for col_index, column in enumerate(columns)
+            if col_index == 0 or columns[col_index - 1] != column - 1
+        ]
+
+    def __select_cells(self, row: Sequence[SupportsStr]) -> Sequence[SupportsStr]:
+        """Get the cells of a row in the columns that are shown
+
+        Args:
+            row: The values in all of the columns of the row
+
+        Returns:
+            The values in the columns of the table, which is the row itself if every column
+            is shown
+        """
+        if self.__source_columns is None:
+            return row
+        selected = [row[i] for i in self.__source_columns]
+        for col_index in self.__unmerged_columns:
+            if selected[col_index] is Merge.LEFT:
+                selected[col_index] = ""
+        return selected
+
+    def __measured_columns(self) -> list[tuple[int, bool]]:
+        """Get the column of the rows shown in each column of the table, and whether the
+        cells merged with it from the right are also shown next to it
+
+        Returns:
+            A key for measuring each column of the table, which is the same for columns
+            that are shown more than once
+        """
+        columns = self.__source_columns or range(self.__columns)
+        return [
+            (column, col_index + 1 < len(columns) and columns[col_index + 1] == column + 1)
+            for col_index, column in enumerate(columns)
+        ]
+
     def __determine_alignments(
         self,
         user_alignments: Sequence[Alignment] | Alignment | None,
@@ -125,45 +464,91 @@ class TableToAscii:
             alignments = [alignments] * self.__columns
 
         # check if alignments specified have a different number of columns
-        if len(alignments) != self.__columns:
+        if self.__validate and len(alignments) != self.__columns:
             raise AlignmentCountMismatchError(alignments, self.__columns)
 
         return list(alignments)
 
     def __widest_line(self, value: SupportsStr) -> int:
         """Returns the width of the longest line in a multi-line string"""
+        # nested tables know their own width
+        if isinstance(value, RenderedTable):
+            return value.width
         text = str(value)
         return max(self.__str_width(line) for line in text.splitlines()) if len(text) else 0
 
-    def __auto_column_widths(self) -> list[int]:
+    @staticmethod
+    def __cell_lines(value: SupportsStr) -> Sequence[str]:
+        """Get the lines of text in a cell, using the lines of a nested table as they are"""
+        if isinstance(value, RenderedTable):
+            return value.lines  # type: ignore[return-value]
+        return str(value).splitlines()
+
+    def __line_widths(self, value: SupportsStr, lines: Sequence[str]) -> list[int]:
+        """Get the width of each line of text in a cell
+
+        Args:
+            value: The value of the cell
+            lines: The lines of text in the cell from :meth:`__cell_lines`
+        """
+        if isinstance(value, RenderedTable):
+            return [value.width] * len(lines)
+        return [self.__str_width(line) for line in lines]
+
+    def __cell_width(self, row: Sequence[SupportsStr], column: int, merged_with_next: bool) -> int:
+        """Get the width of a cell in a column of the rows, or 0 if it is merged with a
+        neighbouring cell
+
+        Args:
+            row: The values in all of the columns of the row
+            column: The index of the column in the row
+            merged_with_next: Whether a cell merged with it from the right is shown next to it
+        """
+        value = row[column]
+        if value is Merge.LEFT or (merged_with_next and row[column + 1] is Merge.LEFT):
+            return 0
+        return self.__widest_line(value)
+
+    def __all_rows(self) -> list[Sequence[SupportsStr]]:
+        """Get the header, the rows of the body, and the footer, whichever the table has"""
+        rows: list[Sequence[SupportsStr]] = [self.__header] if self.__header else []
+        rows += self.__body or []
+        rows += [self.__footer] if self.__footer else []
+        return rows
+
+    def __auto_column_widths(self) -> Generator[None, None, list[int]]:
         """Get the minimum number of characters needed for the values in each column in the table
         with 1 space of padding on each side.
 
         Returns:
             The minimum number of characters needed for each column
         """
-
-        def get_column_width(row: Sequence[SupportsStr], column: int) -> int:
-            """Get the width of a cell in a column"""
-            value = row[column]
-            next_value = row[column + 1] if column < self.__columns - 1 else None
-            if value is Merge.LEFT or next_value is Merge.LEFT:
-                return 0
-            return self.__widest_line(value)
-
+        get_column_width = self.__cell_width
+        rows = self.__all_rows()
+        # columns that are shown more than once are only measured once
+        text_widths: dict[tuple[int, bool], int] = {}
         column_widths = []
         # get the width necessary for each column
-        for i in range(self.__columns):
-            # number of characters in column of i of header, each body row, and footer
-            header_size = get_column_width(self.__header, i) if self.__header else 0
-            body_size = max(get_column_width(row, i) for row in self.__body) if self.__body else 0
-            footer_size = get_column_width(self.__footer, i) if self.__footer else 0
-            min_text_width = max(header_size, body_size, footer_size, self.__decimal_widths[i])
+        for i, key in enumerate(self.__measured_columns()):
+            # number of characters in the column of the header, each body row, and footer
+            if key not in text_widths:
+                text_widths[key] = 0
+                for rows_slice in _row_slices(rows):
+                    text_widths[key] = max(
+                        text_widths[key], *(get_column_width(row, *key) for row in rows_slice)
+                    )
+                    if len(rows_slice) == _STEP_SIZE:
+                        yield
+            if not (i + 1) % _STEP_SIZE:
+                yield
+            min_text_width = max(text_widths[key], self.__decimal_widths[i])
             # get the max and add 2 for padding each side with a space depending on cell padding
             column_widths.append(min_text_width + self.__cell_padding * 2)
         return column_widths
 
-    def __calculate_decimal_widths_and_positions(self) -> tuple[list[int], list[int]]:
+    def __calculate_decimal_widths_and_positions(
+        self,
+    ) -> Generator[None, None, tuple[list[int], list[int]]]:
         """Calculate the positions of the decimal points for decimal alignment.
 
         Returns:
@@ -172,35 +557,60 @@ class TableToAscii:
         """
         decimal_widths: list[int] = [0] * self.__columns
         decimal_positions: list[int] = [0] * self.__columns
-        for i in range(self.__columns):
+        rows = self.__all_rows()
+        # columns that are shown more than once are only measured once
+        measured: dict[int, tuple[int, int]] = {}
+        for i, (column, _) in enumerate(self.__measured_columns()):
+            if i and not i % _STEP_SIZE:
+                yield
             # skip if the column is not decimal aligned
             if self.__number_alignments[i] != Alignment.DECIMAL:
                 continue
-            # list all values in the i-th column of header, body, and footer
-            values = [str(self.__header[i])] if self.__header else []
-            values += [str(row[i]) for row in self.__body] if self.__body else []
-            values += [str(self.__footer[i])] if self.__footer else []
-            # filter out values that are not numbers and split at the decimal point
-            split_values = [
-                self.__split_decimal(value) for value in values if self.__is_number(value)
-            ]
-            # skip if there are no decimal values
-            if len(split_values) == 0:
-                continue
-            # get the max number of digits before and after the decimal point
-            max_before_decimal = max(self.__str_width(parts[0]) for parts in split_values)
-            max_after_decimal = max(self.__str_width(parts[1]) for parts in split_values)
-            # add 1 for the decimal point if there are any decimal point values
-            has_decimal = any(self.__is_number(value) and "." in value for value in values)
-            # store the total width of the decimal numbers in the column
-            decimal_widths[i] = max_before_decimal + max_after_decimal + int(has_decimal)
-            # store the max digits before the decimal point for decimal alignment
-            decimal_positions[i] = max_before_decimal
+            if column not in measured:
+                measured[column] = yield from self.__decimal_width_and_position(rows, column)
+            decimal_widths[i], decimal_positions[i] = measured[column]
         return decimal_widths, decimal_positions
 
+    def __decimal_width_and_position(
+        self, rows: list[Sequence[SupportsStr]], column: int
+    ) -> Generator[None, None, tuple[int, int]]:
+        """Calculate the width of the decimal numbers in a column and the position of the
+        decimal point
+
+        Args:
+            rows: The header, each body row, and footer
+            column: The column of the rows to measure
+
+        Returns:
+            The width of the decimal numbers and the number of digits before the decimal point,
+            or zeros if there are no numbers
+        """
+        has_numbers = has_decimal = False
+        max_before_decimal = max_after_decimal = 0
+        for rows_slice in _row_slices(rows):
+            for row in rows_slice:
+                value = str(row[column])
+                # skip values that are not numbers
+                if not self.__is_number(value):
+                    continue
+                has_numbers = True
+                has_decimal = has_decimal or "." in value
+                # get the max number of digits before and after the decimal point
+                before, after = self.__split_decimal(value)
+                max_before_decimal = max(max_before_decimal, self.__str_width(before))
+                max_after_decimal = max(max_after_decimal, self.__str_width(after))
+            if len(rows_slice) == _STEP_SIZE:
+                yield
+        # skip if there are no decimal values
+        if not has_numbers:
+            return 0, 0
+        # the total width of the decimal numbers, with 1 for the decimal point if there are
+        # any decimal point values, and the max digits before the decimal point
+        return max_before_decimal + max_after_decimal + int(has_decimal), max_before_decimal
+
     def __calculate_column_widths(
         self, user_column_widths: Sequence[int | None] | None
-    ) -> list[int]:
+    ) -> Generator[None, None, list[int]]:
         """Calculate the width of each column in the table based on the cell values and provided column widths.
 
         Args:
@@ -209,10 +619,10 @@ class TableToAscii:
         Returns:
             The width of each column in the table
         """
-        column_widths = self.__auto_column_widths()
+        column_widths = yield from self.__auto_column_widths()
         if user_column_widths:
             # check that the right number of columns were specified
-            if len(user_column_widths) != self.__columns:
+            if self.__validate and len(user_column_widths) != self.__columns:
                 raise ColumnWidthsCountMismatchError(user_column_widths, self.__columns)
             # check that each column is at least as large as the minimum size
             for i in range(len(user_column_widths)):
@@ -227,61 +637,318 @@ class TableToAscii:
                 column_widths[i] = option
         return column_widths
 
+    def __fit_column_widths(
+        self,
+        column_widths: list[int],
+        user_column_widths: Sequence[int | None] | None,
+        max_width: int,
+    ) -> Generator[None, None, list[int]]:
+        """Narrow the columns so that the table fits in a maximum width, choosing all of the
+        widths at once from statistics about the text in each column
+
+        Each column is first given enough room for its longest word, or if the table is too
+        narrow for that, for its decimal numbers, nested tables, or a single character. The
+        remaining width is then shared out in stages: first until the median cell of every
+        column fits on one line, then the 75th and 90th percentile cells, then the widest cells.
+        Within the stage that runs out of width, each column gets a share proportional to what
+        it still needs. Cells that are wider than their column are wrapped when the table is
+        rendered.
+
+        Args:
+            column_widths: The width each column needs to fit its text without wrapping
+            user_column_widths: The user specified column widths, which are not changed
+            max_width: The maximum width of the table
+
+        Returns:
+            The width of each column in the table
+
+        Raises:
+            MaxWidthTooSmallError: If the table cannot fit in the maximum width
+        """
+        border_width = self.__border_width(range(self.__columns))
+        budget = max_width - border_width
+        if sum(column_widths) <= budget:
+            return column_widths
+        padding = self.__cell_padding * 2
+        fixed = [
+            user_column_widths is not None
+            and i < len(user_column_widths)
+            and user_column_widths[i] is not None
+            for i in range(self.__columns)
+        ]
+        # the widths needed for the text of each cell, and the longest word in each column
+        cell_widths: list[list[int]] = [[] for _ in range(self.__columns)]
+        longest_words = [0] * self.__columns
+        # the widest single character or nested table in each column, which cannot be wrapped
+        widest_characters = [0] * self.__columns
+        rows = self.__all_rows()
+        # columns that are shown more than once are only measured once
+        measured: dict[tuple[int, bool], int] = {}
+        for i, key in enumerate(self.__measured_columns()):
+            if fixed[i]:
+                continue
+            if key in measured:
+                cell_widths[i] = cell_widths[measured[key]]
+                longest_words[i] = longest_words[measured[key]]
+                widest_characters[i] = widest_characters[measured[key]]
+                continue
+            measured[key] = i
+            column = key[0]
+            for rows_slice in _row_slices(rows):
+                for row in rows_slice:
+                    # merged cells are wrapped to the width of all of the columns they span
+                    width = self.__cell_width(row, *key)
+                    if not width:
+                        continue
+                    cell_widths[i].append(width)
+                    # nested tables cannot be wrapped, so their columns are never narrower
+                    if isinstance(row[column], RenderedTable):
+                        longest_word = width
+                        widest_characters[i] = max(widest_characters[i], width)
+                    else:
+                        text = str(row[column])
+                        words = text.split()
+                        longest_word = max(self.__str_width(word) for word in words) if words else 0
+                        if not text.isascii():
+                            widest_characters[i] = max(
+                                widest_characters[i], *map(self.__str_width, text)
+                            )
+                    longest_words[i] = max(longest_words[i], longest_word)
+                if len(rows_slice) == _STEP_SIZE:
+                    yield
+            cell_widths[i].sort()
+            if not (i + 1) % _STEP_SIZE:
+                yield
+
+        def limit(i: int, text_width: int) -> int:
+            """Get the width of a column that fits text of a given width, within its bounds"""
+            if fixed[i]:
+                return column_widths[i]
+            minimum = max(text_width, self.__decimal_widths[i], widest_characters[i], 1)
+            return min(minimum + padding, column_widths[i])
+
+        def percentile(i: int, percent: int) -> int:
+            """Get the width of the text in the cell at a percentile of a column"""
+            if not cell_widths[i]:
+                return 0
+            return cell_widths[i][-((-len(cell_widths[i]) * percent) // 100) - 1]
+
+        widths = [limit(i, 0) for i in range(self.__columns)]
+        if sum(widths) > budget:
+            raise MaxWidthTooSmallError(max_width, sum(widths) + border_width)
+        stages = [[limit(i, longest_words[i]) for i in range(self.__columns)]]
+        stages += [
+            [limit(i, percentile(i, percent)) for i in range(self.__columns)]
+            for percent in (50, 75, 90)
+        ]
+        stages.append(column_widths)
+        remaining = budget - sum(widths)
+        for stage in stages:
+            needed = [max(target - width, 0) for target, width in zip(stage, widths)]
+            total_needed = sum(needed)
+            if total_needed <= remaining:
+                widths = [width + extra for width, extra in zip(widths, needed)]
+                remaining -= total_needed
+                continue
+            # share the remaining width in proportion to what each column needs,
+            # giving the characters left over from rounding down to the largest remainders
+            shares = [extra * remaining // total_needed for extra in needed]
+            by_remainder = sorted(
+                range(self.__columns),
+                key=lambda i: (needed[i] * remaining) % total_needed,
+                reverse=True,
+            )
+            for i in by_remainder[: remaining - sum(shares)]:
+                shares[i] += 1
+            widths = [width + share for width, share in zip(widths, shares)]
+            break
+        return widths
+
     def __fix_rows_beginning_with_merge(self) -> None:
-        """Fix rows that begin with Merge.LEFT by replacing the cell with an empty string."""
-        if self.__body:
-            for row_index, row in enumerate(self.__body):
-                if row and row[0] == Merge.LEFT:
-                    self.__body[row_index][0] = ""
+        """Fix a header or footer that begins with Merge.LEFT by replacing the cell with an empty string.
+
+        Rows of the body are fixed when they are copied, or when their cells are selected
+        if only some of the columns are shown.
+        """
         if self.__header and self.__header[0] == Merge.LEFT:
             self.__header[0] = ""
         if self.__footer and self.__footer[0] == Merge.LEFT:
             self.__footer[0] = ""
 
-    def __pad(self, cell_value: SupportsStr, width: int, col_index: int) -> str:
-        """Pad a string of text to a given width with specified alignment
+    def prepare_row(self, row: Sequence[SupportsStr]) -> list[SupportsStr]:
+        """Validate a row that was not part of the body when the table was created
+        and prepare it for :meth:`rows_to_ascii`
 
         Args:
-            cell_value: The text in the cell to pad
-            width: The width in characters to pad to
-            col_index: The index of the column
+            row: The values in the row
+
+        Returns:
+            The row as a list, with a leading :attr:`Merge.LEFT` replaced by an empty string
+
+        Raises:
+            BodyColumnCountMismatchError: If validation is enabled and the row has a different
+                number of columns
+        """
+        if self.__validate and len(row) != self.__source_column_count:
+            raise BodyColumnCountMismatchError(row, self.__source_column_count)
+        prepared = list(row)
+        if prepared and prepared[0] is Merge.LEFT:
+            prepared[0] = ""
+        return prepared
+
+    def fits_layout(self, rows: Sequence[Sequence[SupportsStr]]) -> bool:
+        """Check whether rows can be added to the body without changing the layout of the table
+
+        The layout is unchanged if no cell is wider than its column and no number in a
+        decimal-aligned column needs more digits before or after the decimal point than
+        the column already allows for. If the columns were narrowed to fit ``max_width``,
+        their widths depend on every row, so no rows can be added.
+
+        Args:
+            rows: Rows prepared with :meth:`prepare_row`
 
         Returns:
-            The padded text
-        """
-        alignment = self.__alignments[col_index]
-        text = str(cell_value)
-        # set alignment for numeric values
-        if self.__is_number(text):
-            # if the number alignment is decimal, pad such that the decimal point
-            # is aligned to the column's decimal position and use the default alignment
-            if self.__number_alignments[col_index] == Alignment.DECIMAL:
-                decimal_position = self.__decimal_positions[col_index]
-                decimal_max_width = self.__decimal_widths[col_index]
-                text_before_decimal = self.__split_decimal(text)[0]
-                before = " " * (decimal_position - self.__str_width(text_before_decimal))
-                after = " " * (decimal_max_width - self.__str_width(text) - len(before))
-                text = f"{before}{text}{after}"
-            # otherwise use the number alignment as the alignment for the cell
+            Whether the rows can be rendered with :meth:`rows_to_ascii` using the current
+            column widths and decimal positions
+        """
+        if self.__narrowed and rows:
+            return False
+        padding = self.__cell_padding * 2
+        measured_columns = self.__measured_columns()
+        for row in rows:
+            for i, (column, merged_with_next) in enumerate(measured_columns):
+                if (
+                    self.__cell_width(row, column, merged_with_next) + padding
+                    > self.__column_widths[i]
+                ):
+                    return False
+                if self.__number_alignments[i] != Alignment.DECIMAL:
+                    continue
+                text = str(row[column])
+                if not self.__is_number(text):
+                    continue
+                before = self.__str_width(self.__split_decimal(text)[0])
+                after = self.__str_width(text) - before
+                if (
+                    before > self.__decimal_positions[i]
+                    or after > self.__decimal_widths[i] - self.__decimal_positions[i]
+                ):
+                    return False
+        return True
+
+    def __compile_pad_functions(self) -> list[Callable[[str, int, int], str]]:
+        """Compile a function for each column that pads a line of text to a given width
+        using the alignment of the column
+
+        Returns:
+            A function for each column that takes the text, the width of the text, and the
+            width to pad to, and returns the padded text
+        """
+        pad_functions = []
+        # columns with the same alignments share a function unless numbers are decimal aligned,
+        # so that tables with many columns, such as transposed tables, compile only a few
+        shared: dict[tuple[Alignment, Alignment], Callable[[str, int, int], str]] = {}
+        for col_index in range(self.__columns):
+            alignment = self.__alignments[col_index]
+            number_alignment = self.__number_alignments[col_index]
+            key = (alignment, number_alignment)
+            shareable = (
+                isinstance(alignment, Alignment)
+                and isinstance(number_alignment, Alignment)
+                and number_alignment != Alignment.DECIMAL
+            )
+            if shareable and key in shared:
+                pad_functions.append(shared[key])
+                continue
+            pad_text = self.__compile_pad_function(alignment)
+            # if the number alignment is decimal, pad such that the decimal point is aligned
+            # to the column's decimal position and use the default alignment
+            if number_alignment == Alignment.DECIMAL:
+                pad_number = self.__compile_decimal_pad_function(col_index, pad_text)
+                pad_function = _pad_numbers_separately(pad_text, pad_number)
+            # numbers do not need to be detected if they are aligned like other text
+            elif number_alignment == alignment:
+                pad_function = pad_text
+            # otherwise use the number alignment as the alignment for numbers
             else:
-                alignment = self.__number_alignments[col_index]
+                pad_number = self.__compile_pad_function(number_alignment)
+                pad_function = _pad_numbers_separately(pad_text, pad_number)
+            if shareable:
+                shared[key] = pad_function
+            pad_functions.append(pad_function)
+        return pad_functions
+
+    def __compile_pad_function(self, alignment: Alignment) -> Callable[[str, int, int], str]:
+        """Compile a function that pads a line of text to a given width with an alignment
+
+        Args:
+            alignment: The alignment to pad the text with
+
+        Returns:
+            A function that takes the text, the width of the text, and the width to pad to,
+            and returns the padded text
+        """
         # add minimum cell padding around the text
         padding = " " * self.__cell_padding
-        padded_text = f"{padding}{text}{padding}"
-        text_width = self.__str_width(padded_text)
-        # pad the text based on the alignment
-        if alignment == Alignment.LEFT:
+        extra_width = self.__cell_padding * 2
+        spaces = self.__spaces
+
+        def pad_left(text: str, text_width: int, width: int) -> str:
             # pad with spaces on the end
-            return padded_text + (" " * (width - text_width))
-        elif alignment in (Alignment.CENTER, Alignment.DECIMAL):
+            return f"{padding}{text}{padding}{spaces[width - text_width - extra_width]}"
+
+        def pad_center(text: str, text_width: int, width: int) -> str:
             # pad with spaces, half on each side
-            before = " " * floor((width - text_width) / 2)
-            after = " " * ceil((width - text_width) / 2)
-            return before + padded_text + after
-        elif alignment == Alignment.RIGHT:
+            remaining = width - text_width - extra_width
+            before = spaces[remaining // 2]
+            after = spaces[remaining - remaining // 2]
+            return f"{before}{padding}{text}{padding}{after}"
+
+        def pad_right(text: str, text_width: int, width: int) -> str:
             # pad with spaces at the beginning
-            return (" " * (width - text_width)) + padded_text
-        raise InvalidAlignmentError(alignment)
+            return f"{spaces[width - text_width - extra_width]}{padding}{text}{padding}"
+
+        def invalid_alignment(text: str, text_width: int, width: int) -> str:
+            raise InvalidAlignmentError(alignment)
+
+        if alignment == Alignment.LEFT:
+            return pad_left
+        if alignment in (Alignment.CENTER, Alignment.DECIMAL):
+            return pad_center
+        if alignment == Alignment.RIGHT:
+            return pad_right
+        return invalid_alignment
+
+    def __compile_decimal_pad_function(
+        self, col_index: int, pad_text: Callable[[str, int, int], str]
+    ) -> Callable[[str, int, int], str]:
+        """Compile a function that pads numbers so that their decimal points are aligned
+
+        Args:
+            col_index: The index of the column
+            pad_text: The function to pad the number with once its decimal point is aligned
+
+        Returns:
+            A function that takes the text, the width of the text, and the width to pad to,
+            and returns the padded text
+        """
+        decimal_position = self.__decimal_positions[col_index]
+        decimal_max_width = self.__decimal_widths[col_index]
+        extra_width = self.__cell_padding * 2
+        spaces = self.__spaces
+        str_width = self.__str_width
+
+        def pad_decimal(text: str, text_width: int, width: int) -> str:
+            before = spaces[decimal_position - str_width(text.split(".", 1)[0])]
+            after = spaces[decimal_max_width - text_width - len(before)]
+            aligned_width = len(before) + text_width + len(after)
+            # numbers that would not fit once aligned, such as the lines of wrapped text
+            # or multi-line cells, are padded like other text
+            if aligned_width > width - extra_width:
+                return pad_text(text, text_width, width)
+            return pad_text(f"{before}{text}{after}", aligned_width, width)
+
+        return pad_decimal
 
     def __wrap_long_lines_in_merged_cells(
         self, row: Sequence[SupportsStr], column_separator: str
@@ -306,15 +973,66 @@ class TableToAscii:
                 if row[other_col_index] is not Merge.LEFT:
                     break
                 merged_width += self.__column_widths[other_col_index] + len(column_separator)
-            cell = str(cell)
             # if the text is too wide, wrap it
             inner_cell_width = merged_width - self.__cell_padding * 2
             if self.__widest_line(cell) > inner_cell_width:
-                cell = textwrap.fill(cell, inner_cell_width)
+                cell = str(cell)
+                # wrap each line separately so that line breaks in the cell are kept
+                cell = "\n".join(
+                    (
+                        self.__wrap_line(line, inner_cell_width)
+                        if self.__str_width(line) > inner_cell_width
+                        else line
+                    )
+                    for line in cell.splitlines()
+                )
             # add the wrapped cell to the row
             wrapped_row.append(cell)
         return wrapped_row
 
+    def __wrap_line(self, line: str, width: int) -> str:
+        """Wrap a line of text so that each line fits in a display width
+
+        Args:
+            line: The line of text to wrap
+            width: The maximum display width of each line
+
+        Returns:
+            The wrapped lines joined with newlines
+        """
+        import textwrap
+
+        wrapped = textwrap.wrap(line, width)
+        if all(self.__str_width(part) <= width for part in wrapped):
+            return "\n".join(wrapped)
+        # textwrap counts characters, so text with double-width characters is wrapped again
+        # by measuring the width of each word and character
+        str_width = self.__str_width
+        lines: list[str] = []
+        current, current_width = "", 0
+        for word in line.split():
+            word_width = str_width(word)
+            if current and current_width + 1 + word_width <= width:
+                current += " " + word
+                current_width += 1 + word_width
+                continue
+            if current:
+                lines.append(current)
+            # break words that are too wide for a line of their own, at least one character
+            # per line, adding up the widths of the characters as an upper bound
+            while word_width > width:
+                end, piece_width = 1, str_width(word[0])
+                while end < len(word) and piece_width + str_width(word[end]) <= width:
+                    piece_width += str_width(word[end])
+                    end += 1
+                lines.append(word[:end])
+                word = word[end:]
+                word_width = str_width(word)
+            current, current_width = word, word_width
+        if current:
+            lines.append(current)
+        return "\n".join(lines)
+
     def __row_to_ascii(
         self,
         left_edge: str,
@@ -336,10 +1054,15 @@ class TableToAscii:
         """
         output = ""
         # wrap long lines in merged cells
-        if isinstance(filler, list):
-            filler = self.__wrap_long_lines_in_merged_cells(filler, column_separator)
+        if not isinstance(filler, str):
+            if self.__stats is None:
+                filler = self.__wrap_long_lines_in_merged_cells(filler, column_separator)
+            else:
+                wrapping_started = perf_counter()
+                filler = self.__wrap_long_lines_in_merged_cells(filler, column_separator)
+                self.__wrapping_seconds += perf_counter() - wrapping_started
         # find the maximum number of lines a single cell in the column has (minimum of 1)
-        num_lines = max(len(str(cell).splitlines()) for cell in filler) or 1
+        num_lines = max(len(self.__cell_lines(cell)) for cell in filler) or 1
         # repeat for each line of text in the cell
         for line_index in range(num_lines):
             output += self.__line_in_row_to_ascii(
@@ -438,7 +1161,7 @@ class TableToAscii:
         # check for merged cells
         next_value = prev_row_next_value = next_row_next_value = None
         if col_index < self.__columns - 1:
-            next_value = filler[col_index + 1] if isinstance(filler, list) else None
+            next_value = filler[col_index + 1] if not isinstance(filler, str) else None
             prev_row_next_value = (
                 previous_content_row[col_index + 1] if previous_content_row else None
             )
@@ -482,8 +1205,14 @@ class TableToAscii:
             return ""
         # get the text of the current line in the cell
         # if there are fewer lines in the current cell than others, empty string is used
-        col_lines = str(filler[col_index]).splitlines()
+        cell = filler[col_index]
+        col_lines = self.__cell_lines(cell)
         col_content = col_lines[line_index] if line_index < len(col_lines) else ""
+        # the lines of nested tables are all as wide as the table
+        if isinstance(cell, RenderedTable) and col_content:
+            content_width = cell.width
+        else:
+            content_width = self.__str_width(col_content)
         pad_width = self.__column_widths[col_index]
         # if the columns to the right are Merge.LEFT, add their width to the padding
         for other_col_index in range(col_index + 1, self.__columns):
@@ -491,60 +1220,173 @@ class TableToAscii:
                 break
             pad_width += self.__column_widths[other_col_index] + len(column_separator)
         # pad the text to the width of the column using the alignment
-        return self.__pad(
-            cell_value=col_content,
-            width=pad_width,
-            col_index=col_index,
+        return self.__pad_functions[col_index](col_content, content_width, pad_width)
+
+    def __separator_to_ascii(
+        self,
+        glyphs: SeparatorGlyphs,
+        previous_content_row: Sequence[SupportsStr] | None = None,
+        next_content_row: Sequence[SupportsStr] | None = None,
+    ) -> str:
+        """Assembles a separator line of the ascii table from the glyphs of the style
+
+        Returns:
+            The separator line
+        """
+        if self.__source_columns is not None:
+            if previous_content_row is not None:
+                previous_content_row = self.__select_cells(previous_content_row)
+            if next_content_row is not None:
+                next_content_row = self.__select_cells(next_content_row)
+        return self.__row_to_ascii(
+            left_edge=glyphs.left_edge,
+            heading_col_sep=glyphs.heading_col_sep,
+            column_separator=glyphs.column_separator,
+            right_edge=glyphs.right_edge,
+            filler=glyphs.filler,
+            previous_content_row=previous_content_row,
+            next_content_row=next_content_row,
+            top_tee=glyphs.top_tee,
+            bottom_tee=glyphs.bottom_tee,
+            heading_col_top_tee=glyphs.heading_col_top_tee,
+            heading_col_bottom_tee=glyphs.heading_col_bottom_tee,
         )
 
-    def __top_edge_to_ascii(self) -> str:
+    def __top_edge_to_ascii(self, first_body_row: Sequence[SupportsStr] | None) -> str:
         """Assembles the top edge of the ascii table
 
+        Args:
+            first_body_row: The first row of the body, if any
+
         Returns:
             The top edge of the ascii table
         """
-        first_row = self.__body[0] if self.__body else None
-        first_row = self.__header if self.__header else first_row
-        return self.__row_to_ascii(
-            left_edge=self.__style.top_left_corner,
-            heading_col_sep=self.__style.heading_col_top_tee,
-            column_separator=self.__style.top_tee,
-            right_edge=self.__style.top_right_corner,
-            filler=self.__style.top_and_bottom_edge,
-            next_content_row=first_row,
-            top_tee=self.__style.col_row_top_tee,
-            bottom_tee=self.__style.top_and_bottom_edge,
-            heading_col_top_tee=self.__style.heading_col_top_tee,
-            heading_col_bottom_tee=self.__style.top_and_bottom_edge,
-        )
+        first_row = self.__header if self.__header else first_body_row
+        return self.__separator_to_ascii(self.__style.top_edge_glyphs, next_content_row=first_row)
 
-    def __bottom_edge_to_ascii(self) -> str:
+    def __bottom_edge_to_ascii(self, last_body_row: Sequence[SupportsStr] | None) -> str:
         """Assembles the bottom edge of the ascii table
 
+        Args:
+            last_body_row: The last row of the body, if any
+
         Returns:
             The bottom edge of the ascii table
         """
-        last_row = self.__body[-1] if self.__body else None
-        last_row = self.__footer if self.__footer else last_row
-        return self.__row_to_ascii(
-            left_edge=self.__style.bottom_left_corner,
-            heading_col_sep=self.__style.heading_col_bottom_tee,
-            column_separator=self.__style.bottom_tee,
-            right_edge=self.__style.bottom_right_corner,
-            filler=self.__style.top_and_bottom_edge,
-            previous_content_row=last_row,
-            top_tee=self.__style.top_and_bottom_edge,
-            bottom_tee=self.__style.col_row_bottom_tee,
-            heading_col_top_tee=self.__style.top_and_bottom_edge,
-            heading_col_bottom_tee=self.__style.heading_col_bottom_tee,
+        last_row = self.__footer if self.__footer else last_body_row
+        return self.__separator_to_ascii(
+            self.__style.bottom_edge_glyphs, previous_content_row=last_row
         )
 
+    def __compile_row_template(self) -> str:
+        """Compiles a :meth:`str.format` template for a line of a content row with no merged
+        cells, with a replacement field for the padded text of each cell
+
+        Returns:
+            The template for the line, including the edges, column separators, and newline
+        """
+
+        def escape(glyph: str) -> str:
+            return glyph.replace("{", "{{").replace("}", "}}")
+
+        # joined at the end since adding to the template repeatedly is slow for wide tables
+        fields = [
+            f"{{{col_index}}}{escape(sep)}"
+            for col_index, sep in enumerate(self.__column_separators(range(self.__columns)))
+        ]
+        return escape(self.__style.left_and_right_edge) + "".join(fields) + "\n"
+
+    def __heading_columns(self, columns: Sequence[int]) -> tuple[bool, bool]:
+        """Get whether a selection of the columns of the table starts with the first column
+        as a heading column and ends with the last column as a heading column
+
+        Args:
+            columns: The indices of the selected columns, in order
+
+        Returns:
+            Whether to add a heading column separator after the first and before the last
+            of the selected columns
+        """
+        first_col_heading = self.__first_col_heading and columns[0] == 0
+        last_col_heading = self.__last_col_heading and columns[-1] == self.__columns - 1
+        return first_col_heading, last_col_heading
+
+    def __column_separators(self, columns: Sequence[int]) -> list[str]:
+        """Get the separator after each of a selection of columns in a content row with no
+        merged cells, the last of which is the right edge
+
+        Args:
+            columns: The indices of the selected columns, in order
+
+        Returns:
+            The separator after each column
+        """
+        first_col_heading, last_col_heading = self.__heading_columns(columns)
+        separators = []
+        for col_index in range(len(columns)):
+            # use column heading if first or last column option is specified
+            if (col_index == 0 and first_col_heading) or (
+                col_index == len(columns) - 2 and last_col_heading
+            ):
+                separators.append(self.__style.heading_col_sep)
+            # replace last separator with symbol for edge of the row
+            elif col_index == len(columns) - 1:
+                separators.append(self.__style.left_and_right_edge)
+            else:
+                separators.append(self.__style.col_sep)
+        return separators
+
+    def __border_width(self, columns: Sequence[int]) -> int:
+        """Get the width of the edges and separators of a row with a selection of columns
+
+        Args:
+            columns: The indices of the selected columns, in order
+
+        Returns:
+            The width of a row not counting the widths of the columns
+        """
+        separators_width = sum(self.__str_width(sep) for sep in self.__column_separators(columns))
+        return self.__str_width(self.__style.left_and_right_edge) + separators_width
+
+    def __compiled_content_row_to_ascii(self, row: Sequence[SupportsStr]) -> str | None:
+        """Assembles a row of cell values using the precompiled row template
+
+        Returns:
+            The row of the ascii table, or :py:obj:`None` if the row has merged cells,
+            multi-line cells, nested tables, or cells too wide for their column,
+            which need the general path
+        """
+        if len(row) != self.__columns:
+            return None
+        str_width = self.__str_width
+        cells = []
+        for cell, pad, column_width, inner_width in zip(
+            row, self.__pad_functions, self.__column_widths, self.__inner_widths
+        ):
+            # nested tables are padded using their own width by the general path
+            if cell is Merge.LEFT or isinstance(cell, RenderedTable):
+                return None
+            lines = str(cell).splitlines()
+            if len(lines) > 1:
+                return None
+            text = lines[0] if lines else ""
+            text_width = str_width(text)
+            # text wider than the column is wrapped by the general path
+            if text_width > inner_width:
+                return None
+            cells.append(pad(text, text_width, column_width))
+        return self.__row_template.format(*cells)
+
     def __content_row_to_ascii(self, row: Sequence[SupportsStr]) -> str:
         """Assembles a row of cell values into a single line of the ascii table
 
         Returns:
             The row of the ascii table
         """
+        row = self.__select_cells(row)
+        compiled = self.__compiled_content_row_to_ascii(row)
+        if compiled is not None:
+            return compiled
         return self.__row_to_ascii(
             left_edge=self.__style.left_and_right_edge,
             heading_col_sep=self.__style.heading_col_sep,
@@ -563,47 +1405,133 @@ class TableToAscii:
         Returns:
             The separator line
         """
-        return self.__row_to_ascii(
-            left_edge=self.__style.heading_row_left_tee,
-            heading_col_sep=self.__style.heading_col_heading_row_cross,
-            column_separator=self.__style.heading_row_cross,
-            right_edge=self.__style.heading_row_right_tee,
-            filler=self.__style.heading_row_sep,
-            previous_content_row=previous_content_row,
-            next_content_row=next_content_row,
-            top_tee=self.__style.heading_row_top_tee,
-            bottom_tee=self.__style.heading_row_bottom_tee,
-            heading_col_top_tee=self.__style.heading_col_heading_row_top_tee,
-            heading_col_bottom_tee=self.__style.heading_col_heading_row_bottom_tee,
+        return self.__separator_to_ascii(
+            self.__style.heading_row_glyphs, previous_content_row, next_content_row
         )
 
-    def __body_to_ascii(self, body: Sequence[Sequence[SupportsStr]]) -> str:
-        """Assembles the body of the ascii table
+    def __row_sep_to_ascii(
+        self, previous_content_row: Sequence[SupportsStr], next_content_row: Sequence[SupportsStr]
+    ) -> str:
+        """Assembles the separator between two rows in the body of the ascii table
 
         Returns:
-            The body of the ascii table
+            The separator line
         """
-        # first content row
-        output = self.__content_row_to_ascii(body[0]) if len(body) else ""
-        for row_index, row in enumerate(body[1:], 1):
+        return self.__separator_to_ascii(
+            self.__style.body_row_glyphs, previous_content_row, next_content_row
+        )
+
+    def rows_to_ascii(
+        self,
+        rows: Sequence[Sequence[SupportsStr]],
+        previous_row: Sequence[SupportsStr] | None = None,
+        start_index: int = 0,
+    ) -> str:
+        """Assembles a contiguous run of body rows using the layout of this table
+
+        Args:
+            rows: The rows to assemble
+            previous_row: The body row preceding the first row in ``rows``, if any.
+                If specified, the separator between it and the first row is included.
+            start_index: The index in the body of the first row in ``rows``, which is used
+                to find where to repeat the header
+
+        Returns:
+            The assembled rows, including the separators between them
+        """
+        output = ""
+        for row_index, row in enumerate(rows):
+            previous = rows[row_index - 1] if row_index > 0 else previous_row
             # separator between rows
-            output += self.__row_to_ascii(
-                left_edge=self.__style.row_left_tee,
-                heading_col_sep=self.__style.heading_col_row_cross,
-                column_separator=self.__style.col_row_cross,
-                right_edge=self.__style.row_right_tee,
-                filler=self.__style.row_sep,
-                previous_content_row=body[row_index - 1],
-                next_content_row=row,
-                top_tee=self.__style.col_row_top_tee,
-                bottom_tee=self.__style.col_row_bottom_tee,
-                heading_col_top_tee=self.__style.heading_col_body_row_top_tee,
-                heading_col_bottom_tee=self.__style.heading_col_body_row_bottom_tee,
-            )
+            if previous is not None:
+                output += self.__separator_above_row(start_index + row_index, previous, row)
             # content row
             output += self.__content_row_to_ascii(row)
         return output
 
+    def __is_header_repeated_above(self, row_index: int) -> bool:
+        """Returns True if the header is repeated above the body row at the given index"""
+        return (
+            self.__repeated_header is not None
+            and row_index > 0
+            and row_index % self.__repeat_header_every == 0  # type: ignore[operator]
+        )
+
+    def __separator_above_row(
+        self,
+        row_index: int,
+        previous_row: Sequence[SupportsStr],
+        row: Sequence[SupportsStr],
+    ) -> str:
+        """Assembles the lines between a body row and the row before it, which are either
+        a row separator or a repeat of the header between heading separators
+
+        Args:
+            row_index: The index of the row in the body
+            previous_row: The row before the row
+            row: The row
+
+        Returns:
+            The lines between the rows
+        """
+        if not self.__is_header_repeated_above(row_index):
+            return self.__row_sep_to_ascii(previous_row, row)
+        assert self.__header is not None and self.__repeated_header is not None
+        return (
+            self.__heading_sep_to_ascii(previous_row, self.__header)
+            + self.__repeated_header
+            + self.__heading_sep_to_ascii(self.__header, row)
+        )
+
+    def __body_to_ascii(self, body: Sequence[Sequence[SupportsStr]]) -> str:
+        """Assembles the body of the ascii table
+
+        Returns:
+            The body of the ascii table
+        """
+        if self.__workers is None or self.__workers == 1:
+            return self.rows_to_ascii(body)
+        chunk_size = max(
+            ceil(len(body) / (self.__workers * _CHUNKS_PER_WORKER)), _MIN_ROWS_PER_CHUNK
+        )
+        # not worth starting worker processes if the body fits in a single chunk
+        if len(body) <= chunk_size:
+            return self.rows_to_ascii(body)
+        return self.__parallel_body_to_ascii(body, chunk_size)
+
+    def __parallel_body_to_ascii(
+        self, body: Sequence[Sequence[SupportsStr]], chunk_size: int
+    ) -> str:
+        """Assembles the body of the ascii table by rendering contiguous chunks of rows
+        in worker processes
+
+        Args:
+            body: The rows of the body
+            chunk_size: The number of rows to render in each task
+
+        Returns:
+            The body of the ascii table
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        # the layout is sent to each worker once, without the body
+        layout = copy.copy(self)
+        layout.__body = None
+        layout.__stats = None
+        starts = range(0, len(body), chunk_size)
+        with ProcessPoolExecutor(
+            max_workers=self.__workers, initializer=_init_body_worker, initargs=(layout,)
+        ) as executor:
+            # each chunk is given the row before it so that the separator
+            # at the chunk boundary accounts for merged cells in both rows
+            chunks = executor.map(
+                _render_body_chunk,
+                (body[start : start + chunk_size] for start in starts),
+                (body[start - 1] if start > 0 else None for start in starts),
+                starts,
+            )
+            return "".join(chunks)
+
     def __str_width(self, text: str) -> int:
         """
         Returns the width of the string in characters for the purposes of monospace
@@ -618,7 +1546,7 @@ class TableToAscii:
         Returns:
             The width of the string in characters
         """
-        return width(text) if self.__use_wcwidth else len(text)
+        return self.__cached_width(text) if self.__cached_width is not None else len(text)
 
     @staticmethod
     def __is_number(text: str) -> bool:
@@ -633,35 +1561,447 @@ class TableToAscii:
             return before, after
         return text, ""
 
-    def to_ascii(self) -> str:
-        """Generates a formatted ASCII table
+    def head_to_ascii(self, first_body_row: Sequence[SupportsStr] | None = None) -> str:
+        """Assembles the top edge, header, and heading separator of the ascii table
+
+        Args:
+            first_body_row: The first row of the body, if any
 
         Returns:
-            The generated ASCII table
+            The lines above the body of the ascii table
         """
         # top row of table
-        table = self.__top_edge_to_ascii()
+        table = self.__top_edge_to_ascii(first_body_row)
         # add table header
         if self.__header:
             table += self.__content_row_to_ascii(self.__header)
             table += self.__heading_sep_to_ascii(
                 previous_content_row=self.__header,
-                next_content_row=self.__body[0] if self.__body else None,
+                next_content_row=first_body_row,
             )
-        # add table body
-        if self.__body:
-            table += self.__body_to_ascii(self.__body)
+        return table
+
+    def tail_to_ascii(self, last_body_row: Sequence[SupportsStr] | None = None) -> str:
+        """Assembles the footer separator, footer, and bottom edge of the ascii table
+
+        Args:
+            last_body_row: The last row of the body, if any
+
+        Returns:
+            The lines below the body of the ascii table
+        """
+        table = ""
         # add table footer
         if self.__footer:
             table += self.__heading_sep_to_ascii(
-                previous_content_row=self.__body[-1] if self.__body else None,
+                previous_content_row=last_body_row,
                 next_content_row=self.__footer,
             )
             table += self.__content_row_to_ascii(self.__footer)
         # bottom row of table
-        table += self.__bottom_edge_to_ascii()
+        table += self.__bottom_edge_to_ascii(last_body_row)
+        return table
+
+    def to_ascii(self) -> str:
+        """Generates a formatted ASCII table
+
+        Returns:
+            The generated ASCII table
+        """
+        started = perf_counter() if self.__stats is not None else 0.0
+        first_body_row = self.__body[0] if self.__body else None
+        last_body_row = self.__body[-1] if self.__body else None
+        table = self.head_to_ascii(first_body_row)
+        # add table body
+        if self.__body:
+            table += self.__body_to_ascii(self.__body)
+        table += self.tail_to_ascii(last_body_row)
+        table = table.strip("\n")
+        if self.__stats is not None:
+            lines = table.count("\n") + 1 if table else 0
+            self.__record_render(perf_counter() - started, lines, len(table.encode("utf-8")))
         # reurn ascii table
-        return table.strip("\n")
+        return table
+
+    def width(self) -> int:
+        """Get the display width of the lines of the table, which is known from the layout
+        without measuring the rendered text
+
+        Returns:
+            The width of each line of the output of :meth:`to_ascii`
+        """
+        return self.__border_width(range(self.__columns)) + sum(self.__column_widths)
+
+    def iter_lines(self) -> Iterator[str]:
+        """Generates the lines of the formatted ASCII table one body row at a time
+
+        Joining the lines with newlines gives the same result as :meth:`to_ascii`.
+
+        Returns:
+            An iterator of the lines of the table without trailing newlines
+        """
+        splitter = _LineSplitter()
+        section: str | None
+        if self.__stats is None:
+            for section in self.__iter_sections():
+                yield from splitter.feed(section)
+            return
+        # only the time spent rendering sections counts, not the time spent by the consumer
+        rendering_seconds = 0.0
+        lines = output_bytes = 0
+        sections = self.__iter_sections()
+        while True:
+            started = perf_counter()
+            section = next(sections, None)
+            rendering_seconds += perf_counter() - started
+            if section is None:
+                break
+            for line in splitter.feed(section):
+                lines += 1
+                output_bytes += len(line.encode("utf-8")) + 1
+                yield line
+        # the last line has no trailing newline
+        self.__record_render(rendering_seconds, lines, max(output_bytes - 1, 0))
+
+    def __iter_sections(self) -> Iterator[str]:
+        """Generates the head of the table, each body row with the separator above it,
+        and the tail of the table
+
+        Returns:
+            An iterator of newline-terminated sections of the table
+        """
+        body = self.__body or []
+        yield self.head_to_ascii(body[0] if body else None)
+        previous_row = None
+        for index, row in enumerate(body):
+            yield self.rows_to_ascii((row,), previous_row, index)
+            previous_row = row
+        yield self.tail_to_ascii(previous_row)
+
+    def __project(self, columns: Sequence[int]) -> TableToAscii:
+        """Create the layout of a table with a selection of the columns of this table,
+        reusing the measurements of this table instead of measuring the cells again
+
+        Args:
+            columns: The indices of the selected columns, in order
+
+        Returns:
+            The layout of the table with only the selected columns
+        """
+        projected = copy.copy(self)
+
+        def select(values: Sequence[Any]) -> list[Any]:
+            return [values[i] for i in columns]
+
+        # share the rows, the width cache, and the compiled padding functions of this table
+        projected.__cached_width = self.__cached_width
+        projected.__pad_functions = select(projected.__pad_functions)
+        projected.__select_source_columns(
+            select(self.__source_columns) if self.__source_columns is not None else list(columns)
+        )
+        projected.__first_col_heading, projected.__last_col_heading = self.__heading_columns(
+            columns
+        )
+        projected.__alignments = select(self.__alignments)
+        projected.__number_alignments = select(self.__number_alignments)
+        projected.__decimal_widths = select(self.__decimal_widths)
+        projected.__decimal_positions = select(self.__decimal_positions)
+        projected.__column_widths = self.__selected_column_widths(columns)
+        projected.__inner_widths = [
+            width - self.__cell_padding * 2 for width in projected.__column_widths
+        ]
+        projected.__row_template = projected.__compile_row_template()
+        if self.__repeated_header is not None and projected.__header is not None:
+            projected.__repeated_header = projected.__content_row_to_ascii(projected.__header)
+        return projected
+
+    def __selected_column_widths(self, columns: Sequence[int]) -> list[int]:
+        """Get the widths of a selection of the columns of this table
+
+        A cell merged with cells to its right that are not selected next to it is shown on its
+        own, so if its column has no room for text it is widened to fit one character per line.
+
+        Args:
+            columns: The indices of the selected columns, in order
+
+        Returns:
+            The width of each of the selected columns
+        """
+        widths = [self.__column_widths[i] for i in columns]
+        padding = self.__cell_padding * 2
+        for col_index, column in enumerate(columns):
+            if widths[col_index] > padding or column == self.__columns - 1:
+                continue
+            if col_index + 1 < len(columns) and columns[col_index + 1] == column + 1:
+                continue
+            if any(self.__select_cells(row)[column + 1] is Merge.LEFT for row in self.__all_rows()):
+                widths[col_index] = padding + 1
+        return widths
+
+    def iter_panels(
+        self, max_width: int, key_columns: Sequence[int] | None = None
+    ) -> Iterator[str]:
+        """Splits the columns of the table into panels that each fit in a maximum width
+
+        The columns are measured once for the whole table, so the same column has the same
+        width in every panel. Each panel is a complete table with the key columns followed
+        by as many of the other columns as fit, in their original order.
+
+        Args:
+            max_width: The maximum width of each panel
+            key_columns: The indices of the columns to repeat in every panel. Defaults to the
+                first column if ``first_col_heading`` is set and the last column if
+                ``last_col_heading`` is set.
+
+        Returns:
+            An iterator of the panels, without trailing newlines
+
+        Raises:
+            MaxWidthTooSmallError: If a column does not fit in a panel along with the key columns
+            InvalidColumnsError: If an index of a key column is out of range
+        """
+        if key_columns is None:
+            key_columns = [0] if self.__first_col_heading else []
+            key_columns += [self.__columns - 1] if self.__last_col_heading else []
+        keys = set(self.__check_columns(key_columns)) if key_columns else set()
+        others = [i for i in range(self.__columns) if i not in keys]
+        if not others:
+            # every column is a key column, so the whole table is the only panel
+            if self.width() > max_width:
+                raise MaxWidthTooSmallError(max_width, self.width())
+            yield self.to_ascii()
+            return
+
+        def panel_width(columns: list[int]) -> int:
+            return self.__border_width(columns) + sum(self.__selected_column_widths(columns))
+
+        # choose the columns of every panel before rendering any of them
+        panels: list[list[int]] = []
+        for column in others:
+            if panels:
+                wider_panel = sorted([*panels[-1], column])
+                if panel_width(wider_panel) <= max_width:
+                    panels[-1] = wider_panel
+                    continue
+            panel = sorted(keys | {column})
+            if panel_width(panel) > max_width:
+                raise MaxWidthTooSmallError(max_width, panel_width(panel))
+            panels.append(panel)
+        for panel in panels:
+            yield self.__project(panel).to_ascii()
+
+    def iter_chunks(self, max_chars: int) -> Iterator[str]:
+        """Generates the table split into chunks of at most ``max_chars`` characters
+
+        The body is split between rows. Each chunk is a complete table with a top edge, the
+        header, and a bottom edge, and the footer is only included in the last chunk.
+        Each row is rendered once, and the edges and separators are reused between chunks.
+
+        Args:
+            max_chars: The maximum number of characters in each chunk
+
+        Returns:
+            An iterator of the chunks, without trailing newlines
+
+        Raises:
+            ChunkSizeTooSmallError: If a row does not fit in a chunk along with the
+                lines above and below it
+        """
+        body = self.__body or []
+        if not body:
+            table = self.to_ascii()
+            if len(table) > max_chars:
+                raise ChunkSizeTooSmallError(max_chars, len(table))
+            yield table
+            return
+        # edges and separators only depend on which cells of the adjacent rows are merged
+        heads: dict[tuple[bool, ...], str] = {}
+        bottom_edges: dict[tuple[bool, ...], str] = {}
+        row_seps: dict[tuple[tuple[bool, ...], tuple[bool, ...], bool], str] = {}
+
+        def merged(row: Sequence[SupportsStr]) -> tuple[bool, ...]:
+            return tuple(cell is Merge.LEFT for cell in row)
+
+        def head(row: Sequence[SupportsStr]) -> str:
+            key = merged(row)
+            if key not in heads:
+                heads[key] = self.head_to_ascii(row)
+            return heads[key]
+
+        def tail(row: Sequence[SupportsStr], is_last: bool) -> str:
+            # only the last chunk has the footer
+            if is_last:
+                return self.tail_to_ascii(row)
+            key = merged(row)
+            if key not in bottom_edges:
+                bottom_edges[key] = self.__separator_to_ascii(
+                    self.__style.bottom_edge_glyphs, previous_content_row=row
+                )
+            return bottom_edges[key]
+
+        def row_sep(index: int, previous: Sequence[SupportsStr], row: Sequence[SupportsStr]) -> str:
+            key = (merged(previous), merged(row), self.__is_header_repeated_above(index))
+            if key not in row_seps:
+                row_seps[key] = self.__separator_above_row(index, previous, row)
+            return row_seps[key]
+
+        parts: list[str] = []
+        length = 0
+        index = 0
+        while index < len(body):
+            row = body[index]
+            is_last = index == len(body) - 1
+            content = self.__content_row_to_ascii(row)
+            # the output does not end with a newline
+            if not parts:
+                parts = [head(row), content]
+                length = len(parts[0]) + len(content)
+                needed = length + len(tail(row, is_last)) - 1
+                if needed > max_chars:
+                    raise ChunkSizeTooSmallError(max_chars, needed)
+            else:
+                separator = row_sep(index, body[index - 1], row)
+                new_length = length + len(separator) + len(content)
+                if new_length + len(tail(row, is_last)) - 1 > max_chars:
+                    # close the chunk and start the next one with this row
+                    parts.append(tail(body[index - 1], False))
+                    yield "".join(parts).strip("\n")
+                    parts = []
+                    continue
+                parts += [separator, content]
+                length = new_length
+            index += 1
+        parts.append(tail(body[-1], True))
+        yield "".join(parts).strip("\n")
+
+    def measure_output(self, encoding: str = "utf-8") -> tuple[int, int, int]:
+        """Calculates the size of the output of :meth:`to_ascii` without assembling it
+
+        Rows without merged cells, and the separators between them, are measured from the
+        column widths and the widths of the text in each cell. Rows with merged cells
+        (and the separators next to them) are rendered and measured, since merged cells
+        may be wrapped onto multiple lines, as are rows below a repeated header and rows with
+        cells wider than their column.
+
+        Args:
+            encoding: The encoding to count the bytes of the output in
+
+        Returns:
+            The number of characters, the number of bytes when encoded, and the number of lines
+        """
+        # a byte order mark is written once for the whole output, not for each part
+        bom_bytes = len("".encode(encoding))
+        space_bytes = len(" ".encode(encoding)) - bom_bytes
+        newline_bytes = len("\n".encode(encoding)) - bom_bytes
+        chars = size = lines = 0
+
+        def add_section(section: str) -> None:
+            nonlocal chars, size, lines
+            lines += section.count("\n")
+            chars += len(section)
+            size += len(section.encode(encoding)) - bom_bytes
+
+        body = self.__body or []
+        add_section(self.head_to_ascii(body[0] if body else None))
+        # separators and cell padding that are the same for every row without merged cells
+        row_sep = content_chars = content_bytes = None
+        previous_row = None
+        previous_cells = None
+        for index, row in enumerate(body):
+            cells = self.__select_cells(row)
+            if (
+                any(cell is Merge.LEFT for cell in cells)
+                or (
+                    previous_cells is not None
+                    and any(cell is Merge.LEFT for cell in previous_cells)
+                )
+                or self.__is_header_repeated_above(index)
+            ):
+                add_section(self.rows_to_ascii((row,), previous_row, index))
+                previous_row, previous_cells = row, cells
+                continue
+            if previous_row is not None:
+                if row_sep is None:
+                    row_sep = self.__row_sep_to_ascii(row, row)
+                add_section(row_sep)
+            if content_chars is None or content_bytes is None:
+                # measure a line of empty cells, which is all padding apart from the separators
+                empty_line = self.__content_row_to_ascii([""] * self.__source_column_count)
+                content_chars = len(empty_line)
+                content_bytes = len(empty_line.encode(encoding)) - bom_bytes
+            previous_row, previous_cells = row, cells
+            cell_lines = [self.__cell_lines(cell) for cell in cells]
+            line_widths = [
+                self.__line_widths(cell, lines) for cell, lines in zip(cells, cell_lines)
+            ]
+            # cells that are wider than their column are wrapped when rendered
+            if any(
+                width > inner_width
+                for widths, inner_width in zip(line_widths, self.__inner_widths)
+                for width in widths
+            ):
+                add_section(self.__content_row_to_ascii(row))
+                continue
+            num_lines = max(len(cell) for cell in cell_lines) or 1
+            lines += num_lines
+            chars += content_chars * num_lines
+            size += content_bytes * num_lines
+            # each line of text replaces padding as wide as the text
+            for cell, widths in zip(cell_lines, line_widths):
+                for text, width in zip(cell, widths):
+                    chars += len(text) - width
+                    size += len(text.encode(encoding)) - bom_bytes - width * space_bytes
+        add_section(self.tail_to_ascii(previous_row))
+        # the output does not end with a newline
+        if lines:
+            chars -= 1
+            size -= newline_bytes
+        if chars:
+            size += bom_bytes
+        return chars, size, lines
+
+    def render_into(self, buffer: bytearray | memoryview, encoding: str = "utf-8") -> int:
+        """Encodes the output of :meth:`to_ascii` directly into a buffer
+
+        Each row is encoded into the buffer as soon as it is assembled, so the text of
+        the whole table is never held in memory at once.
+
+        Args:
+            buffer: A writable buffer, such as a :class:`bytearray`, to write the output to,
+                starting at the beginning of the buffer
+            encoding: The encoding to write the output in
+
+        Returns:
+            The number of bytes written
+
+        Raises:
+            BufferTooSmallError: If the output does not fit in the buffer
+        """
+        from codecs import getincrementalencoder
+
+        encoder = getincrementalencoder(encoding)()
+        view = memoryview(buffer).cast("B")
+        position = 0
+        newline_pending = False
+
+        def write(text: str) -> None:
+            nonlocal position
+            data = encoder.encode(text)
+            end = position + len(data)
+            if end > len(view):
+                raise BufferTooSmallError(len(view), self.measure_output(encoding)[1])
+            view[position:end] = data
+            position = end
+
+        # the newline at the end of each section is held back so the output does not end with one
+        for section in self.__iter_sections():
+            if not section:
+                continue
+            if newline_pending:
+                write("\n")
+            write(section[:-1])
+            newline_pending = True
+        return position
 
 
 def table2ascii(
@@ -677,6 +2017,13 @@ def table2ascii(
     cell_padding: int = 1,
     style: TableStyle = PresetStyle.double_thin_compact,
     use_wcwidth: bool = True,
+    workers: int | None = None,
+    stats: RenderStats | None = None,
+    validate: bool = True,
+    repeat_header_every: int | None = None,
+    max_width: int | None = None,
+    columns: Sequence[int] | None = None,
+    transpose: bool = False,
 ) -> str:
     """Convert a 2D Python table to ASCII text
 
@@ -732,6 +2079,68 @@ def table2ascii(
                 instead of :func:`wcwidth.wcswidth` to better handle terminal control codes, escape sequences,
                 certain emoji sequences, and other strings with mixed-width characters.
             .. versionadded:: 1.0.0
+        workers: Number of worker processes to use for rendering the rows of the body.
+            If greater than ``1``, large bodies are split into contiguous chunks which are
+            rendered in parallel using a :class:`~concurrent.futures.ProcessPoolExecutor`
+            and joined in order. All cell values must be picklable, and on platforms that
+            start processes by spawning, the call must be guarded by ``if __name__ == "__main__"``.
+            Bodies too small to benefit are rendered in the current process.
+            If not specified or set to :py:obj:`None`, the table is rendered in the current process.
+            Defaults to :py:obj:`None`.
+
+            .. versionadded:: 1.3.0
+        stats: A :class:`RenderStats` instance to add the timings and counters collected while
+            rendering the table to. If not specified or set to :py:obj:`None`, nothing is recorded.
+            Defaults to :py:obj:`None`.
+
+            .. versionadded:: 1.3.0
+        validate: Whether to check that the footer, each row of the body, ``alignments``,
+            ``number_alignments``, and ``column_widths`` have the same number of columns as the
+            table. Checking the rows of the body is done while they are copied, so it does not
+            add a separate pass over the body. Set to :py:obj:`False` only when the input is
+            known to have the right shape, as invalid input will then produce a malformed table
+            or an unrelated error instead of a :class:`TableOptionError`. Defaults to :py:obj:`True`.
+
+            .. versionadded:: 1.3.0
+        repeat_header_every: Number of body rows after which the header row is repeated,
+            between heading row separators, so that long tables stay readable.
+            The header is rendered once and reused each time it is repeated.
+            Ignored if the table has no header. If not specified or set to :py:obj:`None`,
+            the header is only shown at the top of the table. Defaults to :py:obj:`None`.
+
+            .. versionadded:: 1.3.0
+        max_width: Maximum width of the table in characters, such as the width of the terminal
+            from :func:`shutil.get_terminal_size`. If the table would be wider, the widths of the
+            columns that are not set in ``column_widths`` are reduced, keeping room for the longest
+            word in each column where possible, and cells that no longer fit are wrapped onto
+            multiple lines. The widths are chosen before the table is rendered, so it is only
+            rendered once. If not specified or set to :py:obj:`None`, the width is not limited.
+            Defaults to :py:obj:`None`.
+
+            .. versionadded:: 1.3.0
+        columns: The indices of the columns of the header, body, and footer to show, in the order
+            to show them. Columns can be hidden by leaving them out, reordered, or shown more than
+            once, and negative indices count from the last column. Other options that have a value
+            for each column, such as ``alignments`` and ``column_widths``, apply to the columns that
+            are shown. The rows of the body are read through the indices when the table is rendered
+            instead of being copied, and a column shown more than once is only measured once.
+            A cell merged with the cell to its left is shown as an empty cell if that cell is not
+            shown next to it. If not specified or set to :py:obj:`None`, all columns are shown
+            in order. Defaults to :py:obj:`None`.
+
+            .. versionadded:: 1.3.0
+        transpose: Whether to swap the rows and columns of the table, such as to show records as
+            key-value pairs. The header becomes the first column and the footer the last column,
+            each separated from the body like a heading column, and each row of the body becomes
+            a column. ``first_col_heading`` and ``last_col_heading`` instead make the first and
+            last columns of the data into a header row and a footer row. Other options apply to
+            the rows and columns of the transposed table, so ``alignments`` has a value for
+            each column that is shown. Cells are not merged in a transposed table, so
+            :attr:`Merge.LEFT` is shown as an empty cell. The cells of the body are read from its
+            rows when the table is rendered instead of being copied into transposed rows.
+            Defaults to :py:obj:`False`.
+
+            .. versionadded:: 1.3.0
 
     Returns:
         The generated ASCII table
@@ -749,5 +2158,143 @@ def table2ascii(
             cell_padding=cell_padding,
             style=style,
             use_wcwidth=use_wcwidth,
+            workers=workers,
+            stats=stats,
+            validate=validate,
+            repeat_header_every=repeat_header_every,
+            max_width=max_width,
+            columns=columns,
+            transpose=transpose,
         ),
     ).to_ascii()
+
+
+class _TransposedRow(Sequence):
+    """A row of a transposed table, which reads the cells of a column of the rows it was
+    transposed from when they are accessed instead of copying them
+
+    A cell merged with the cell to its left would be merged with the cell above it once
+    transposed, so :attr:`Merge.LEFT` is read as an empty string.
+    """
+
+    __slots__ = ("__rows", "__column")
+
+    def __init__(self, rows: Sequence[Sequence[SupportsStr]], column: int):
+        self.__rows = rows
+        self.__column = column
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [_unmerged(row[self.__column]) for row in self.__rows[index]]
+        return _unmerged(self.__rows[index][self.__column])
+
+    def __iter__(self) -> Iterator[SupportsStr]:
+        column = self.__column
+        return (_unmerged(row[column]) for row in self.__rows)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # pickle the cells of the row instead of all of the rows it was transposed from
+        return list, (list(self),)
+
+
+def _unmerged(cell: SupportsStr) -> SupportsStr:
+    """Replace :attr:`Merge.LEFT` with an empty string"""
+    return "" if cell is Merge.LEFT else cell
+
+
+class _Spaces(Dict[int, str]):
+    """Strings of spaces used for padding, created the first time each length is needed"""
+
+    def __missing__(self, length: int) -> str:
+        # negative lengths give empty strings, as with " " * length
+        spaces = self[length] = " " * length
+        return spaces
+
+
+def _pad_numbers_separately(
+    pad_text: Callable[[str, int, int], str], pad_number: Callable[[str, int, int], str]
+) -> Callable[[str, int, int], str]:
+    """Combine the padding functions for text and for numbers in a column
+
+    Numbers are integers and decimals, with or without a decimal point.
+    """
+
+    def pad(text: str, text_width: int, width: int) -> str:
+        if text.replace(".", "", 1).isdecimal():
+            return pad_number(text, text_width, width)
+        return pad_text(text, text_width, width)
+
+    return pad
+
+
+def _row_slices(rows: list[Sequence[SupportsStr]]) -> Iterator[list[Sequence[SupportsStr]]]:
+    """Split rows into the slices that are measured between the points where laying out
+    a table can pause"""
+    for start in range(0, len(rows), _STEP_SIZE):
+        yield rows[start : start + _STEP_SIZE]
+
+
+def _new_width_cache() -> _lru_cache_wrapper[int]:
+    """Create a cache of the widths of text measured with :func:`wcwidth.width`
+
+    :mod:`wcwidth` is imported when it is first needed since importing it is slow.
+    """
+    from wcwidth import width
+
+    return lru_cache(maxsize=_WIDTH_CACHE_SIZE)(width)
+
+
+class _LineSplitter:
+    """Splits newline-terminated sections of a table into lines, leaving out empty lines
+    at the start and end of the output like :meth:`str.strip` does"""
+
+    __slots__ = ("__started", "__blank_lines")
+
+    def __init__(self) -> None:
+        self.__started = False
+        self.__blank_lines = 0
+
+    def feed(self, section: str) -> list[str]:
+        """Split the next section of the table into lines
+
+        Args:
+            section: The newline-terminated section
+
+        Returns:
+            The lines that can be output so far
+        """
+        lines = []
+        for line in section.split("\n")[:-1]:
+            if not line:
+                if self.__started:
+                    self.__blank_lines += 1
+                continue
+            # blank lines are only output once it is known that they are not at the end
+            lines.extend([""] * self.__blank_lines)
+            self.__blank_lines = 0
+            self.__started = True
+            lines.append(line)
+        return lines
+
+
+# layout used by the current worker process when rendering the body in parallel
+_worker_layout: TableToAscii | None = None
+
+
+def _init_body_worker(layout: TableToAscii) -> None:
+    """Store the layout shared by all chunks rendered in a worker process"""
+    global _worker_layout
+    _worker_layout = layout
+
+
+def _render_body_chunk(
+    rows: Sequence[Sequence[SupportsStr]],
+    previous_row: Sequence[SupportsStr] | None,
+    start_index: int,
+) -> str:
+    """Render a chunk of body rows in a worker process"""
+    assert _worker_layout is not None
+    return _worker_layout.rows_to_ascii(rows, previous_row, start_index)
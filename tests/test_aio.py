@@ -0,0 +1,205 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from table2ascii import (
+    Merge,
+    PresetStyle,
+    atable2ascii,
+    atable2ascii_lines,
+    atable2ascii_stream,
+    table2ascii as t2a,
+)
+from table2ascii.exceptions import BodyColumnCountMismatchError
+
+HEADER = ["#", "G", "H", "R", "S"]
+BODY = [
+    [str(i), "30", "40", Merge.LEFT, "30"] if i % 3 else [str(i), "30", "40", "35", "30"]
+    for i in range(50)
+]
+FOOTER = ["SUM", "130", "140", "135", "130"]
+
+
+async def collect_lines(**kwargs):
+    return [line async for line in atable2ascii_lines(HEADER, BODY, FOOTER, **kwargs)]
+
+
+def test_lines():
+    lines = asyncio.run(collect_lines(first_col_heading=True))
+    assert "\n".join(lines) == t2a(HEADER, BODY, FOOTER, first_col_heading=True)
+
+
+def test_lines_strip_blank_edges():
+    # the top and bottom edges of this style are only whitespace
+    style = PresetStyle.plain
+    lines = asyncio.run(collect_lines(style=style))
+    assert "\n".join(lines) == t2a(HEADER, BODY, FOOTER, style=style)
+
+
+@pytest.mark.parametrize("to_thread", [False, True])
+def test_atable2ascii(to_thread):
+    text = asyncio.run(atable2ascii(HEADER, BODY, FOOTER, to_thread=to_thread))
+    assert text == t2a(HEADER, BODY, FOOTER)
+
+
+def test_yields_to_event_loop():
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        await atable2ascii(HEADER, BODY, FOOTER, time_slice=0)
+        task.cancel()
+
+    asyncio.run(main())
+    assert ticks > len(BODY)
+
+
+def test_yields_while_measuring():
+    ticks = 0
+    body = [[str(i), "a", "b", "c", "d"] for i in range(1000)]
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks_before_first_line = None
+        async for _ in atable2ascii_lines(HEADER, body, FOOTER, time_slice=0):
+            if ticks_before_first_line is None:
+                ticks_before_first_line = ticks
+        task.cancel()
+        return ticks_before_first_line
+
+    # the column widths are measured in slices of rows, yielding to the event loop in between
+    ticks_before_first_line = asyncio.run(main())
+    assert ticks_before_first_line is not None
+    assert ticks_before_first_line > 1
+
+
+def test_cancel():
+    rendered = []
+
+    async def render():
+        async for line in atable2ascii_lines(HEADER, BODY, FOOTER, time_slice=0):
+            rendered.append(line)
+
+    async def main():
+        task = asyncio.create_task(render())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert 0 < len(rendered) < len(t2a(HEADER, BODY, FOOTER).splitlines())
+
+
+def test_cancel_in_executor_stops_measuring():
+    started, resume = threading.Event(), threading.Event()
+    measured = 0
+
+    class Cell:
+        def __str__(self):
+            nonlocal measured
+            measured += 1
+            if not started.is_set():
+                started.set()
+                resume.wait()
+            return "x"
+
+    body = [[Cell(), Cell()] for _ in range(2000)]
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def main():
+        task = asyncio.create_task(atable2ascii(["a", "b"], body, executor=executor))
+        while not started.is_set():
+            await asyncio.sleep(0.001)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    resume.set()
+    executor.shutdown(wait=True)
+    # measuring stops at the end of the slice of rows that was being measured
+    assert measured < len(body)
+
+
+async def arows(rows):
+    for row in rows:
+        await asyncio.sleep(0)
+        yield row
+
+
+async def collect_stream(header, body, footer, **kwargs):
+    return [line async for line in atable2ascii_stream(header, arows(body), footer, **kwargs)]
+
+
+@pytest.mark.parametrize("sample_rows", [1, 10, 100])
+def test_stream(sample_rows):
+    body = [tuple(row) for row in BODY]
+    lines = asyncio.run(collect_stream(HEADER, body, FOOTER, sample_rows=sample_rows))
+    assert "\n".join(lines) == t2a(HEADER, BODY, FOOTER)
+
+
+def test_stream_wraps_wide_rows():
+    body = [["1", "Short"], ["2", "A much longer value"]]
+    lines = asyncio.run(collect_stream(["#", "Name"], body, None, sample_rows=1))
+    assert "\n".join(lines) == (
+        "╔═══════════╗\n"
+        "║ #   Name  ║\n"
+        "╟───────────╢\n"
+        "║ 1   Short ║\n"
+        "║ 2     A   ║\n"
+        "║     much  ║\n"
+        "║     longe ║\n"
+        "║       r   ║\n"
+        "║     value ║\n"
+        "╚═══════════╝"
+    )
+
+
+def test_stream_fixed_widths():
+    body = [["1", "Short"], ["2", "Longer"]]
+    lines = asyncio.run(
+        collect_stream(["#", "Name"], body, None, sample_rows=0, column_widths=[5, 10])
+    )
+    assert "\n".join(lines) == t2a(["#", "Name"], body, column_widths=[5, 10])
+
+
+def test_stream_consumes_rows_lazily():
+    consumed = 0
+
+    async def source():
+        nonlocal consumed
+        for row in BODY:
+            consumed += 1
+            yield row
+
+    async def main():
+        lines = atable2ascii_stream(HEADER, source(), FOOTER, sample_rows=5)
+        for _ in range(8):
+            await lines.__anext__()
+        await lines.aclose()
+
+    asyncio.run(main())
+    assert consumed < 10
+
+
+def test_stream_column_mismatch():
+    with pytest.raises(BodyColumnCountMismatchError):
+        asyncio.run(collect_stream(["a", "b"], [["1", "2"], ["3"]], None, sample_rows=1))
@@ -0,0 +1,77 @@
+import sys
+
+from table2ascii import Merge, PresetStyle, RenderCache, RenderStats, table2ascii as t2a
+
+
+def test_cached_output_matches():
+    cache = RenderCache()
+    header, footer = ["#", "Name"], ["", "Bob"]
+    body = [[1, "Alice"], [2, Merge.LEFT]]
+    assert cache.table2ascii(header, body, footer) == t2a(header, body, footer)
+    assert cache.table2ascii(header, body, footer) == t2a(header, body, footer)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+
+def test_decorator():
+    calls = []
+    cache = RenderCache()
+
+    @cache
+    def render(header=None, body=None, footer=None, **options):
+        calls.append(body)
+        return t2a(header, body, footer, **options)
+
+    assert render(body=[["a", "b"]]) == render(body=[("a", "b")])
+    assert len(calls) == 1
+    render(body=[["a", "b"]], style=PresetStyle.ascii)
+    assert len(calls) == 2
+
+
+def test_different_contents_are_not_confused():
+    cache = RenderCache()
+    first = cache.table2ascii(body=[["ab", "c"]])
+    second = cache.table2ascii(body=[["a", "bc"]])
+    third = cache.table2ascii(body=[["a", "b"], ["c", "d"]])
+    fourth = cache.table2ascii(body=[["a", "b"]], footer=["c", "d"])
+    assert len({first, second, third, fourth}) == 4
+    assert cache.cache_info().misses == 4
+
+
+def test_stats_and_workers_do_not_affect_key():
+    cache = RenderCache()
+    stats = RenderStats()
+    cache.table2ascii(body=[["a", "b"]])
+    cache.table2ascii(body=[["a", "b"]], stats=stats, workers=2)
+    assert cache.cache_info().hits == 1
+    assert stats.renders == 0
+
+
+def test_lru_eviction():
+    output = t2a(body=[["a", "b"]])
+    cache = RenderCache(max_bytes=2 * sys.getsizeof(output))
+    cache.table2ascii(body=[["a", "b"]])
+    cache.table2ascii(body=[["c", "d"]])
+    cache.table2ascii(body=[["a", "b"]])
+    cache.table2ascii(body=[["e", "f"]])
+    info = cache.cache_info()
+    assert (info.entries, info.evictions) == (2, 1)
+    assert info.current_bytes <= info.max_bytes
+    # the least recently used table was evicted
+    cache.table2ascii(body=[["a", "b"]])
+    assert cache.cache_info().hits == 2
+    cache.table2ascii(body=[["c", "d"]])
+    assert cache.cache_info().misses == 4
+
+
+def test_output_larger_than_limit_is_not_cached():
+    cache = RenderCache(max_bytes=10)
+    cache.table2ascii(body=[["a", "b"]])
+    assert cache.cache_info().entries == 0
+
+
+def test_clear():
+    cache = RenderCache()
+    cache.table2ascii(body=[["a", "b"]])
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 0, 0, 16 * 1024 * 1024)
@@ -0,0 +1,47 @@
+import pytest
+
+from table2ascii import ChunkSizeTooSmallError, PresetStyle, table2ascii as t2a, table2ascii_chunks
+
+
+def test_chunks_split_between_rows():
+    chunks = table2ascii_chunks(
+        header=["#", "Name"],
+        body=[[1, "Alice"], [2, "Bob"], [3, "Carol"]],
+        footer=["", "3"],
+        max_chars=100,
+        style=PresetStyle.ascii_box,
+    )
+    assert chunks == [
+        "+---+-------+\n"
+        "| # | Name  |\n"
+        "+---+-------+\n"
+        "| 1 | Alice |\n"
+        "+---+-------+\n"
+        "| 2 |  Bob  |\n"
+        "+---+-------+",
+        "+---+-------+\n"
+        "| # | Name  |\n"
+        "+---+-------+\n"
+        "| 3 | Carol |\n"
+        "+---+-------+\n"
+        "|   |   3   |\n"
+        "+---+-------+",
+    ]
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_single_chunk_matches_table2ascii():
+    header, footer = ["#", "Name"], ["", "2"]
+    body = [[1, "Alice"], [2, "Bob"]]
+    assert table2ascii_chunks(header, body, footer, max_chars=2000) == [t2a(header, body, footer)]
+
+
+def test_chunks_without_body():
+    assert table2ascii_chunks(header=["a", "b"], max_chars=100) == [t2a(header=["a", "b"])]
+
+
+def test_chunk_size_too_small():
+    with pytest.raises(ChunkSizeTooSmallError) as e:
+        table2ascii_chunks(header=["#", "Name"], body=[[1, "Alice"]], max_chars=20)
+    assert e.value.max_chars == 20
+    assert e.value.min_chars == len(t2a(header=["#", "Name"], body=[[1, "Alice"]]))
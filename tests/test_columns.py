@@ -0,0 +1,111 @@
+import pytest
+
+from table2ascii import (
+    Alignment,
+    InvalidColumnsError,
+    LiveTable,
+    Merge,
+    PresetStyle,
+    measure_table,
+    table2ascii as t2a,
+)
+
+HEADER = ["#", "Name", "Score"]
+BODY = [
+    [1, "Alice", 10.5],
+    [2, "Bob", 8],
+]
+
+
+def test_columns_reorder_and_hide():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        columns=[2, 1],
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+-------+-------+\n"
+        "| Score | Name  |\n"
+        "+-------+-------+\n"
+        "| 10.5  | Alice |\n"
+        "+-------+-------+\n"
+        "|   8   |  Bob  |\n"
+        "+-------+-------+"
+    )
+    assert text == expected
+
+
+def test_columns_repeated_and_negative():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        columns=[-2, 0, -2],
+        alignments=[Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT],
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+-------+---+-------+\n"
+        "| Name  | # |  Name |\n"
+        "+-------+---+-------+\n"
+        "| Alice | 1 | Alice |\n"
+        "+-------+---+-------+\n"
+        "| Bob   | 2 |   Bob |\n"
+        "+-------+---+-------+"
+    )
+    assert text == expected
+
+
+def test_columns_decimal_alignment():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        columns=[2],
+        number_alignments=Alignment.DECIMAL,
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+-------+\n"
+        "| Score |\n"
+        "+-------+\n"
+        "| 10.5  |\n"
+        "+-------+\n"
+        "|  8    |\n"
+        "+-------+"
+    )
+    assert text == expected
+
+
+def test_columns_merged_cells():
+    body = [["Merged across", Merge.LEFT, "x"], ["a", "b", "c"]]
+    # the merge is kept when both columns are shown next to each other
+    assert t2a(body=body, columns=[0, 1]) == t2a(body=[row[:2] for row in body])
+    # otherwise the cell merged into the hidden column is shown empty
+    text = t2a(body=body, columns=[1, 2], style=PresetStyle.ascii_box)
+    expected = "+---+---+\n" "|   | x |\n" "+---+---+\n" "| b | c |\n" "+---+---+"
+    assert text == expected
+
+
+def test_columns_does_not_copy_body():
+    body = [[1, "Alice", 10.5]]
+    text = t2a(body=body, columns=[1])
+    body[0][1] = "Carol"
+    assert text == t2a(body=[["Alice"]])
+    assert body == [[1, "Carol", 10.5]]
+
+
+def test_columns_measure_and_live_table():
+    text = t2a(header=HEADER, body=BODY, footer=["", "Total", 18.5], columns=[1, 2])
+    size = measure_table(header=HEADER, body=BODY, footer=["", "Total", 18.5], columns=[1, 2])
+    assert size.characters == len(text)
+    table = LiveTable(header=HEADER, footer=["", "Total", 18.5], columns=[1, 2])
+    table.extend(BODY)
+    assert table.to_ascii() == text
+
+
+@pytest.mark.parametrize("columns", [[], [3], [-4], [0, 5]])
+def test_invalid_columns(columns):
+    with pytest.raises(InvalidColumnsError) as e:
+        t2a(header=HEADER, body=BODY, columns=columns)
+    assert e.value.columns == columns
+    assert e.value.source_columns == 3
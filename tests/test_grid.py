@@ -0,0 +1,72 @@
+from table2ascii import (
+    LiveTable,
+    PresetStyle,
+    RenderedTable,
+    compose_grid,
+    iter_grid_lines,
+    render_table,
+    table2ascii as t2a,
+)
+
+
+def test_render_table():
+    table = render_table(["A", "B"], [[1, "日本"]], style=PresetStyle.ascii_box)
+    assert table.lines == t2a(["A", "B"], [[1, "日本"]], style=PresetStyle.ascii_box).split("\n")
+    assert table.width == 12
+
+
+def test_compose_grid_side_by_side():
+    left = render_table(["A", "B"], [[1, "日本"]], style=PresetStyle.ascii_box)
+    right = render_table(["Name"], [["x"], ["y"]], style=PresetStyle.ascii_box)
+    expected = (
+        "+---+------+  +------+\n"
+        "| A |  B   |  | Name |\n"
+        "+---+------+  +------+\n"
+        "| 1 | 日本 |  |  x   |\n"
+        "+---+------+  +------+\n"
+        "              |  y   |\n"
+        "              +------+"
+    )
+    assert compose_grid([[left, right]]) == expected
+
+
+def test_compose_grid_rows():
+    small = render_table(["A"], [[1]], style=PresetStyle.ascii_box)
+    wide = render_table(["Header"], style=PresetStyle.ascii_box)
+    text = compose_grid([[wide, small], [small, None, small]], column_gap=1, row_gap=0)
+    expected = (
+        "+--------+ +---+\n"
+        "| Header | | A |\n"
+        "+--------+ +---+\n"
+        "+--------+ | 1 |\n"
+        "           +---+\n"
+        "+---+            +---+\n"
+        "| A |            | A |\n"
+        "+---+            +---+\n"
+        "| 1 |            | 1 |\n"
+        "+---+            +---+"
+    )
+    assert text == expected
+
+
+def test_iter_grid_lines_lazy():
+    rendered = []
+
+    def lines():
+        for line in ["ab", "cd"]:
+            rendered.append(line)
+            yield line
+
+    grid = iter_grid_lines([[RenderedTable(lines(), 2), RenderedTable(["x"], 1)]])
+    assert next(grid) == "ab  x"
+    assert rendered == ["ab"]
+    assert list(grid) == ["cd"]
+    lazy = render_table(["A"], [[1], [2]], lazy=True)
+    assert "\n".join(iter_grid_lines([[lazy]])) == t2a(["A"], [[1], [2]])
+
+
+def test_compose_grid_live_table():
+    table = LiveTable(["A"], style=PresetStyle.ascii_box)
+    table.append([10])
+    assert table.width == 6
+    assert compose_grid([[table, table]]) == "\n".join(f"{line}  {line}" for line in table.lines)
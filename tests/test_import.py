@@ -0,0 +1,38 @@
+import subprocess
+import sys
+
+import pytest
+
+import table2ascii
+from table2ascii import PresetStyle, TableStyle
+
+
+def test_lazy_imports():
+    code = (
+        "import sys\n"
+        "before = set(sys.modules)\n"
+        "import table2ascii\n"
+        "lazy = ['asyncio', 'concurrent.futures', 'importlib.metadata', 'wcwidth']\n"
+        "print(','.join(m for m in lazy if m in sys.modules and m not in before))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_version():
+    assert isinstance(table2ascii.__version__, str)
+    assert "__version__" in vars(table2ascii)
+
+
+def test_lazy_preset_style():
+    assert isinstance(PresetStyle.thin_rounded, TableStyle)
+    assert PresetStyle.thin_rounded is PresetStyle.thin_rounded
+    assert PresetStyle.plain.left_and_right_edge == ""
+    assert PresetStyle.plain.top_and_bottom_edge == " "
+
+
+def test_missing_attribute():
+    with pytest.raises(AttributeError, match="not_an_attribute"):
+        table2ascii.not_an_attribute
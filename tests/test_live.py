@@ -0,0 +1,220 @@
+import io
+import re
+
+import pytest
+
+from table2ascii import (
+    Alignment,
+    LineChange,
+    LiveTable,
+    LiveTableWriter,
+    Merge,
+    PresetStyle,
+    table2ascii as t2a,
+)
+from table2ascii.exceptions import BodyColumnCountMismatchError
+
+
+def test_append_renders_only_new_rows():
+    table = LiveTable(header=["#", "Name"], style=PresetStyle.ascii_box)
+    first = table.append([1, "Alice"])
+    assert first.relayout
+    second = table.append([2, "Bob"])
+    assert not second.relayout
+    assert second.start == 4
+    assert second.lines == [
+        "+---+-------+",
+        "| 2 |  Bob  |",
+        "+---+-------+",
+    ]
+    assert table.to_ascii() == t2a(
+        header=["#", "Name"], body=[[1, "Alice"], [2, "Bob"]], style=PresetStyle.ascii_box
+    )
+
+
+def test_widening_column_renders_again():
+    table = LiveTable(header=["#", "Name"], body=[[1, "Bob"]])
+    update = table.append([2, "Alexander"])
+    assert update.relayout
+    assert update.start == 0
+    assert update.lines == table.lines
+    assert table.to_ascii() == t2a(header=["#", "Name"], body=[[1, "Bob"], [2, "Alexander"]])
+
+
+def test_decimal_alignment_changes_layout():
+    table = LiveTable(body=[["1.5"]], number_alignments=Alignment.DECIMAL, column_widths=[10])
+    assert table.append(["22.25"]).relayout
+    assert not table.append(["3.5"]).relayout
+    assert table.to_ascii() == t2a(
+        body=[["1.5"], ["22.25"], ["3.5"]],
+        number_alignments=Alignment.DECIMAL,
+        column_widths=[10],
+    )
+
+
+def test_footer_and_merged_cells():
+    footer = ["SUM", "10", Merge.LEFT]
+    table = LiveTable(header=["a", "b", "c"], footer=footer, style=PresetStyle.double_thin_box)
+    rows = [["1", "2", "3"], ["4", Merge.LEFT, "6"], [Merge.LEFT, "7", Merge.LEFT]]
+    before = []
+    for index, row in enumerate(rows):
+        before = table.lines
+        update = table.append(row)
+        assert before[: update.start] + update.lines == table.lines
+        expected = t2a(
+            header=["a", "b", "c"],
+            body=rows[: index + 1],
+            footer=footer,
+            style=PresetStyle.double_thin_box,
+        )
+        assert table.to_ascii() == expected
+    assert len(table) == 3
+
+
+def test_extend():
+    table = LiveTable(header=["x", "y"])
+    table.extend([["1", "2"], ["3", "4"]])
+    update = table.extend([["5", "6"], ["7", "8"]])
+    assert not update.relayout
+    assert table.to_ascii() == t2a(
+        header=["x", "y"], body=[["1", "2"], ["3", "4"], ["5", "6"], ["7", "8"]]
+    )
+
+
+def test_invalid_row_leaves_table_unchanged():
+    table = LiveTable(header=["a", "b"])
+    with pytest.raises(BodyColumnCountMismatchError):
+        table.append(["1"])
+    assert len(table) == 0
+    with pytest.raises(BodyColumnCountMismatchError):
+        table.update([["1", "2"], ["3"]])
+    assert len(table) == 0
+    table.update([["1", "2"], ["3", "4"]])
+    assert table.to_ascii() == t2a(header=["a", "b"], body=[["1", "2"], ["3", "4"]])
+    table.append(["5", "6"])
+    assert len(table) == 3
+
+
+def _apply(lines, changes):
+    for change in reversed(changes):
+        lines[change.start : change.stop] = change.lines
+    return lines
+
+
+def test_update_changed_row():
+    body = [["a", "1"], ["b", "2"], ["c", "3"]]
+    table = LiveTable(header=["x", "y"], body=body, style=PresetStyle.ascii_box)
+    previous = table.lines
+    changes = table.update([["a", "1"], ["b", "5"], ["c", "3"]])
+    assert changes == [LineChange(5, 6, ["| b | 5 |"])]
+    assert _apply(previous, changes) == table.lines
+    assert table.to_ascii() == t2a(
+        header=["x", "y"], body=[["a", "1"], ["b", "5"], ["c", "3"]], style=PresetStyle.ascii_box
+    )
+
+
+def test_update_unchanged():
+    table = LiveTable(header=["x", "y"], body=[["a", "1"]])
+    assert table.update([("a", "1")]) == []
+
+
+def test_update_rows_added_and_removed():
+    table = LiveTable(header=["x", "y"], body=[["a", "1"], ["b", "2"], ["c", "3"]])
+    for body in ([["a", "1"], ["b", "2"]], [["a", "1"], ["b", "2"], ["d", "4"], ["e", "5"]]):
+        previous = table.lines
+        changes = table.update(body)
+        assert changes[0].start > 0
+        assert _apply(previous, changes) == table.lines
+        assert table.to_ascii() == t2a(header=["x", "y"], body=body)
+
+
+def test_update_merged_cells_redraw_separators():
+    table = LiveTable(body=[["a", "b"], ["c", "d"], ["e", "f"]], style=PresetStyle.ascii_box)
+    previous = table.lines
+    changes = table.update([["a", "b"], ["c", Merge.LEFT], ["e", "f"]])
+    assert _apply(previous, changes) == table.lines
+    assert table.to_ascii() == t2a(
+        body=[["a", "b"], ["c", Merge.LEFT], ["e", "f"]], style=PresetStyle.ascii_box
+    )
+
+
+def test_update_wider_row_renders_again():
+    table = LiveTable(header=["x", "y"], body=[["a", "1"], ["b", "2"]])
+    previous = table.lines
+    changes = table.update([["a", "1"], ["b", "1000"]])
+    assert changes == [LineChange(0, len(previous), table.lines)]
+
+
+class _Terminal(io.StringIO):
+    """Minimal terminal that understands the escape sequences used by LiveTableWriter"""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = [""]
+        self.row = self.col = 0
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        for match in re.finditer(r"\x1b\[(\d*)([ABJK])|\r|\n|[^\x1b\r\n]+", text):
+            token = match.group(0)
+            if token == "\r":
+                self.col = 0
+            elif token == "\n":
+                self.row += 1
+                self.col = 0
+                if self.row == len(self.rows):
+                    self.rows.append("")
+            elif match.group(2) == "A":
+                self.row -= int(match.group(1))
+            elif match.group(2) == "B":
+                self.row += int(match.group(1))
+            elif match.group(2) == "K":
+                self.rows[self.row] = self.rows[self.row][: self.col]
+            elif match.group(2) == "J":
+                self.rows[self.row] = self.rows[self.row][: self.col]
+                del self.rows[self.row + 1 :]
+            else:
+                line = self.rows[self.row].ljust(self.col)
+                self.rows[self.row] = line[: self.col] + token + line[self.col + len(token) :]
+                self.col += len(token)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    @property
+    def text(self):
+        return "\n".join(self.rows).rstrip("\n")
+
+
+def test_writer_redraws_changed_lines():
+    terminal = _Terminal()
+    table = LiveTable(header=["x", "y"], body=[["a", "1"], ["b", "2"]])
+    with LiveTableWriter(terminal, table, min_interval=0) as writer:
+        assert terminal.text == table.to_ascii()
+        writer.append(["c", "3"])
+        assert terminal.text == table.to_ascii()
+        writer.update([["a", "1"], ["b", "5"], ["c", "3"]])
+        assert terminal.text == table.to_ascii()
+        writer.update([["a", "1"], ["b", "5"]])
+        assert terminal.text == table.to_ascii()
+        writer.update([["a", "1000"], ["b", "5"]])
+        assert terminal.text == table.to_ascii()
+        writes = terminal.writes
+        writer.update([["a", "1000"], ["b", "5"]])
+        assert terminal.writes == writes
+    assert terminal.row == len(table.lines)
+
+
+def test_writer_limits_frame_rate():
+    terminal = _Terminal()
+    table = LiveTable(header=["x", "y"])
+    writer = LiveTableWriter(terminal, table, min_interval=60)
+    writer.refresh(force=True)
+    for index in range(10):
+        writer.append([index, index])
+    assert terminal.writes == 1
+    writer.close()
+    assert terminal.writes == 2
+    assert terminal.text == table.to_ascii()
@@ -0,0 +1,50 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from table2ascii import (
+    Alignment,
+    PresetStyle,
+    table2ascii as t2a,
+    table2ascii_as_completed,
+    table2ascii_many,
+)
+from table2ascii.exceptions import BodyColumnCountMismatchError
+
+TABLES = [
+    (["#", "G", "H"], [["1", "30", "40"], ["2", "30", "40"]], ["SUM", "60", "80"]),
+    (None, [["Alice", 10], ["Bob", 8]], None),
+    (["Name", "Score"], None, ["Total", 0]),
+]
+
+
+def test_many_in_order():
+    outputs = table2ascii_many(TABLES, style=PresetStyle.ascii_box, alignments=Alignment.LEFT)
+    expected = [
+        t2a(header, body, footer, style=PresetStyle.ascii_box, alignments=Alignment.LEFT)
+        for header, body, footer in TABLES
+    ]
+    assert outputs == expected
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_many_executor(executor_class):
+    with executor_class(max_workers=2) as executor:
+        outputs = table2ascii_many(TABLES, executor=executor, first_col_heading=True)
+    assert outputs == [t2a(*table, first_col_heading=True) for table in TABLES]
+
+
+def test_as_completed():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = dict(table2ascii_as_completed(TABLES, executor=executor))
+    assert results == {index: t2a(*table) for index, table in enumerate(TABLES)}
+
+
+def test_many_error():
+    with pytest.raises(BodyColumnCountMismatchError):
+        table2ascii_many([(["a", "b"], [["1"]], None)])
+
+
+def test_many_unknown_option():
+    with pytest.raises(TypeError):
+        table2ascii_many(TABLES, not_an_option=True)
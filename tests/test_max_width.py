@@ -0,0 +1,147 @@
+import pytest
+
+from table2ascii import (
+    Alignment,
+    LiveTable,
+    MaxWidthTooSmallError,
+    Merge,
+    PresetStyle,
+    measure_table,
+    table2ascii as t2a,
+)
+
+HEADER = ["#", "Description", "Score"]
+BODY = [
+    [1, "A very long description of the first item", 10],
+    [2, "Short", 8],
+    [3, "Medium length text", 7],
+]
+
+
+def test_max_width():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        max_width=30,
+        style=PresetStyle.ascii_box,
+        alignments=Alignment.LEFT,
+    )
+    expected = (
+        "+---+----------------+-------+\n"
+        "| # | Description    | Score |\n"
+        "+---+----------------+-------+\n"
+        "| 1 | A very long    | 10    |\n"
+        "|   | description of |       |\n"
+        "|   | the first item |       |\n"
+        "+---+----------------+-------+\n"
+        "| 2 | Short          | 8     |\n"
+        "+---+----------------+-------+\n"
+        "| 3 | Medium length  | 7     |\n"
+        "|   | text           |       |\n"
+        "+---+----------------+-------+"
+    )
+    assert text == expected
+
+
+def test_max_width_keeps_column_widths():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        max_width=30,
+        column_widths=[None, None, 9],
+        style=PresetStyle.ascii_box,
+        alignments=Alignment.LEFT,
+    )
+    expected = (
+        "+---+--------------+---------+\n"
+        "| # | Description  | Score   |\n"
+        "+---+--------------+---------+\n"
+        "| 1 | A very long  | 10      |\n"
+        "|   | description  |         |\n"
+        "|   | of the first |         |\n"
+        "|   | item         |         |\n"
+        "+---+--------------+---------+\n"
+        "| 2 | Short        | 8       |\n"
+        "+---+--------------+---------+\n"
+        "| 3 | Medium       | 7       |\n"
+        "|   | length text  |         |\n"
+        "+---+--------------+---------+"
+    )
+    assert text == expected
+
+
+def test_max_width_not_reached():
+    assert t2a(header=HEADER, body=BODY, max_width=100) == t2a(header=HEADER, body=BODY)
+
+
+@pytest.mark.parametrize("max_width", [10, 12, 20, 40, 60])
+def test_max_width_fits(max_width):
+    text = t2a(header=HEADER, body=BODY, max_width=max_width, cell_padding=0)
+    assert max(len(line) for line in text.splitlines()) <= max_width
+    size = measure_table(header=HEADER, body=BODY, max_width=max_width, cell_padding=0)
+    assert size.characters == len(text)
+    assert size.lines == text.count("\n") + 1
+
+
+def test_max_width_keeps_line_breaks():
+    text = t2a(
+        header=["a", "b"],
+        body=[["x\nlong text here", Merge.LEFT]],
+        max_width=13,
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+---+---+\n"
+        "| a | b |\n"
+        "+---+---+\n"
+        "|   x   |\n"
+        "| long  |\n"
+        "| text  |\n"
+        "| here  |\n"
+        "+-------+"
+    )
+    assert text == expected
+
+
+def test_max_width_live_table():
+    table = LiveTable(header=HEADER, body=BODY[:1], max_width=30)
+    update = table.extend(BODY[1:])
+    assert update.relayout
+    assert table.to_ascii() == t2a(header=HEADER, body=BODY, max_width=30)
+
+
+def test_max_width_too_small():
+    with pytest.raises(MaxWidthTooSmallError) as e:
+        t2a(header=HEADER, body=BODY, max_width=10)
+    assert e.value.max_width == 10
+    assert e.value.min_width == 13
+
+
+def test_max_width_wide_characters():
+    text = t2a(
+        header=["name", "v"],
+        body=[["日本語テキスト", "1"], ["abc def", "2"]],
+        max_width=13,
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+-------+---+\n"
+        "| name  | v |\n"
+        "+-------+---+\n"
+        "| 日本  | 1 |\n"
+        "| 語テ  |   |\n"
+        "| キス  |   |\n"
+        "|  ト   |   |\n"
+        "+-------+---+\n"
+        "|  abc  | 2 |\n"
+        "|  def  |   |\n"
+        "+-------+---+"
+    )
+    assert text == expected
+
+
+def test_max_width_too_small_for_wide_character():
+    # a column needs room for two cells to show a double-width character
+    with pytest.raises(MaxWidthTooSmallError) as e:
+        t2a(header=["a", "b"], body=[["日", "x"]], max_width=9)
+    assert e.value.min_width == 10
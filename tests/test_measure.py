@@ -0,0 +1,64 @@
+import pytest
+
+from table2ascii import (
+    Alignment,
+    BufferTooSmallError,
+    Merge,
+    PresetStyle,
+    measure_table,
+    table2ascii as t2a,
+    table2ascii_into,
+)
+
+TABLES = [
+    dict(header=["#", "Name"], body=[[1, "Alice"], [2, "Bob"]]),
+    dict(body=[["表格", "😀"], ["a\nb\nc", ""]], style=PresetStyle.ascii_box),
+    dict(
+        header=["#", "G", "Merge", Merge.LEFT, "S"],
+        body=[[1, 5, 6, 200, Merge.LEFT], [2, "E", "Long cell", Merge.LEFT, Merge.LEFT]],
+        footer=["SUM", "100", "200", Merge.LEFT, "300"],
+        style=PresetStyle.double_thin_box,
+        first_col_heading=True,
+    ),
+    dict(
+        body=[["1.5", "a"], ["10.25", "b"]],
+        number_alignments=Alignment.DECIMAL,
+        style=PresetStyle.plain,
+    ),
+]
+
+
+@pytest.mark.parametrize("kwargs", TABLES)
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_measure_table(kwargs, encoding):
+    output = t2a(**kwargs)
+    size = measure_table(**kwargs, encoding=encoding)
+    assert size.characters == len(output)
+    assert size.bytes == len(output.encode(encoding))
+    assert size.lines == len(output.splitlines())
+
+
+@pytest.mark.parametrize("kwargs", TABLES)
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16"])
+def test_table2ascii_into(kwargs, encoding):
+    expected = t2a(**kwargs).encode(encoding)
+    buffer = bytearray(len(expected) + 10)
+    written = table2ascii_into(buffer, **kwargs, encoding=encoding)
+    assert written == len(expected)
+    assert buffer[:written] == expected
+    assert buffer[written:] == bytes(10)
+
+
+def test_table2ascii_into_memoryview():
+    expected = t2a(body=[["a", "b"]]).encode()
+    buffer = bytearray(len(expected) * 2)
+    written = table2ascii_into(memoryview(buffer)[len(expected) :], body=[["a", "b"]])
+    assert buffer[len(expected) :] == expected
+    assert written == len(expected)
+
+
+def test_buffer_too_small():
+    with pytest.raises(BufferTooSmallError) as e:
+        table2ascii_into(bytearray(10), header=["a", "b"], body=[["1", "2"]])
+    assert e.value.buffer_size == 10
+    assert e.value.required_size == len(t2a(header=["a", "b"], body=[["1", "2"]]).encode())
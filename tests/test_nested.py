@@ -0,0 +1,95 @@
+import pytest
+
+from table2ascii import (
+    MaxWidthTooSmallError,
+    PresetStyle,
+    RenderedTable,
+    measure_table,
+    render_table,
+    table2ascii as t2a,
+)
+
+
+def test_nested_table():
+    inner = render_table(["A", "B"], [[1, 2]], style=PresetStyle.ascii_box)
+    text = t2a(["Name", "Table"], [["x", inner]], style=PresetStyle.ascii_box)
+    expected = (
+        "+------+-----------+\n"
+        "| Name |   Table   |\n"
+        "+------+-----------+\n"
+        "|  x   | +---+---+ |\n"
+        "|      | | A | B | |\n"
+        "|      | +---+---+ |\n"
+        "|      | | 1 | 2 | |\n"
+        "|      | +---+---+ |\n"
+        "+------+-----------+"
+    )
+    assert text == expected
+    assert text == t2a(["Name", "Table"], [["x", str(inner)]], style=PresetStyle.ascii_box)
+
+
+def test_nested_table_width_is_not_measured():
+    # the reported width is used even though len() would measure the lines as narrower
+    inner = RenderedTable(["日本", "中文"], 4)
+    text = t2a(["Name", "Lines"], [["x", inner]], style=PresetStyle.ascii_box, use_wcwidth=False)
+    expected = (
+        "+------+-------+\n"
+        "| Name | Lines |\n"
+        "+------+-------+\n"
+        "|  x   | 日本  |\n"
+        "|      | 中文  |\n"
+        "+------+-------+"
+    )
+    assert text == expected
+
+
+def test_nested_table_kept_whole_with_max_width():
+    inner = render_table(["A", "B"], [[1, 2]], style=PresetStyle.ascii_box)
+    text = t2a(
+        ["Name", "Table"], [["some long name", inner]], style=PresetStyle.ascii_box, max_width=24
+    )
+    expected = (
+        "+----------+-----------+\n"
+        "|   Name   |   Table   |\n"
+        "+----------+-----------+\n"
+        "|   some   | +---+---+ |\n"
+        "|   long   | | A | B | |\n"
+        "|   name   | +---+---+ |\n"
+        "|          | | 1 | 2 | |\n"
+        "|          | +---+---+ |\n"
+        "+----------+-----------+"
+    )
+    assert text == expected
+
+
+def test_nested_table_is_never_wrapped_with_max_width():
+    inner = render_table(["A", "B"], [[1, 2]], style=PresetStyle.ascii_box)
+    text = t2a(["Name", "Table"], [["Bob", inner]], style=PresetStyle.ascii_box, max_width=17)
+    expected = (
+        "+---+-----------+\n"
+        "| N |   Table   |\n"
+        "| a |           |\n"
+        "| m |           |\n"
+        "| e |           |\n"
+        "+---+-----------+\n"
+        "| B | +---+---+ |\n"
+        "| o | | A | B | |\n"
+        "| b | +---+---+ |\n"
+        "|   | | 1 | 2 | |\n"
+        "|   | +---+---+ |\n"
+        "+---+-----------+"
+    )
+    assert text == expected
+    with pytest.raises(MaxWidthTooSmallError) as e:
+        t2a(["Name", "Table"], [["Bob", inner]], style=PresetStyle.ascii_box, max_width=12)
+    assert e.value.max_width == 12
+    assert e.value.min_width == 17
+
+
+def test_measure_nested_table():
+    inner = render_table(["Round", "Score"], [[1, 10], [2, 8]])
+    body = [["Alice", inner], ["Bob", "x"]]
+    size = measure_table(["Player", "Scores"], body)
+    text = t2a(["Player", "Scores"], body)
+    assert size.characters == len(text)
+    assert size.lines == len(text.splitlines())
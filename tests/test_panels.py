@@ -0,0 +1,123 @@
+import pytest
+
+from table2ascii import (
+    InvalidColumnsError,
+    MaxWidthTooSmallError,
+    Merge,
+    PresetStyle,
+    table2ascii as t2a,
+    table2ascii_panels,
+)
+
+HEADER = ["Name", "Jan", "Feb", "Mar", "Apr"]
+BODY = [["Alice", 1, 2, 3, 4], ["Bob", 10, 20, 30, 40]]
+
+
+def test_panels_repeat_key_column():
+    panels = table2ascii_panels(
+        header=HEADER,
+        body=BODY,
+        footer=["Total", 11, 22, 33, 44],
+        panel_width=24,
+        first_col_heading=True,
+        style=PresetStyle.ascii_box,
+    )
+    assert panels == [
+        "+-------+-----+-----+\n"
+        "| Name  | Jan | Feb |\n"
+        "+-------+-----+-----+\n"
+        "| Alice |  1  |  2  |\n"
+        "+-------+-----+-----+\n"
+        "|  Bob  | 10  | 20  |\n"
+        "+-------+-----+-----+\n"
+        "| Total | 11  | 22  |\n"
+        "+-------+-----+-----+",
+        "+-------+-----+-----+\n"
+        "| Name  | Mar | Apr |\n"
+        "+-------+-----+-----+\n"
+        "| Alice |  3  |  4  |\n"
+        "+-------+-----+-----+\n"
+        "|  Bob  | 30  | 40  |\n"
+        "+-------+-----+-----+\n"
+        "| Total | 33  | 44  |\n"
+        "+-------+-----+-----+",
+    ]
+
+
+def test_panels_same_column_widths():
+    panels = table2ascii_panels(
+        header=["#", "a", "b"], body=[[1, "wide value", "x"]], panel_width=18, key_columns=[0]
+    )
+    assert panels == [
+        "╔════════════════╗\n"
+        "║ #       a      ║\n"
+        "╟────────────────╢\n"
+        "║ 1   wide value ║\n"
+        "╚════════════════╝",
+        "╔═══════╗\n" "║ #   b ║\n" "╟───────╢\n" "║ 1   x ║\n" "╚═══════╝",
+    ]
+
+
+def test_single_panel_matches_table2ascii():
+    panels = table2ascii_panels(HEADER, BODY, panel_width=200, first_col_heading=True)
+    assert panels == [t2a(HEADER, BODY, first_col_heading=True)]
+
+
+def test_panels_without_key_columns():
+    panels = table2ascii_panels(header=HEADER, body=BODY, panel_width=14)
+    assert len(panels) == 3
+    assert "Name" in panels[0] and "Name" not in panels[1]
+
+
+def test_panels_merged_cell_split():
+    panels = table2ascii_panels(
+        header=["a", "b", "c"],
+        body=[[1, 2, Merge.LEFT]],
+        panel_width=9,
+        key_columns=[0],
+        style=PresetStyle.ascii_box,
+    )
+    assert panels == [
+        "+---+---+\n| a | b |\n+---+---+\n| 1 | 2 |\n+---+---+",
+        "+---+---+\n| a | c |\n+---+---+\n| 1 |   |\n+---+---+",
+    ]
+
+
+def test_panels_merged_cell_split_from_empty_column():
+    panels = table2ascii_panels(
+        body=[["long", Merge.LEFT, "x"]],
+        panel_width=9,
+        key_columns=[2],
+        style=PresetStyle.ascii_box,
+    )
+    assert panels == [
+        "+---+---+\n| l | x |\n| o |   |\n| n |   |\n| g |   |\n+---+---+",
+        "+--+---+\n|  | x |\n+--+---+",
+    ]
+
+
+def test_panels_too_narrow():
+    with pytest.raises(MaxWidthTooSmallError) as e:
+        table2ascii_panels(header=HEADER, body=BODY, panel_width=12, first_col_heading=True)
+    assert e.value.max_width == 12
+    assert e.value.min_width == 15
+
+
+def test_panels_only_key_columns_too_narrow():
+    with pytest.raises(MaxWidthTooSmallError) as e:
+        table2ascii_panels(
+            header=["Name", "Total"],
+            body=[["Alice", 10]],
+            panel_width=10,
+            first_col_heading=True,
+            last_col_heading=True,
+        )
+    assert e.value.max_width == 10
+    assert e.value.min_width == 17
+
+
+def test_panels_invalid_key_columns():
+    with pytest.raises(InvalidColumnsError) as e:
+        table2ascii_panels(header=HEADER, body=BODY, panel_width=30, key_columns=[5])
+    assert e.value.columns == [5]
+    assert e.value.source_columns == 5
@@ -0,0 +1,100 @@
+import pytest
+
+from table2ascii import (
+    InvalidRepeatHeaderEveryError,
+    LiveTable,
+    Merge,
+    PresetStyle,
+    measure_table,
+    table2ascii as t2a,
+)
+
+
+def test_repeat_header_every():
+    text = t2a(
+        header=["#", "Name"],
+        body=[[1, "Alice"], [2, "Bob"], [3, "Carol"], [4, "Dave"], [5, "Eve"]],
+        footer=["", "5"],
+        repeat_header_every=2,
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+---+-------+\n"
+        "| # | Name  |\n"
+        "+---+-------+\n"
+        "| 1 | Alice |\n"
+        "+---+-------+\n"
+        "| 2 |  Bob  |\n"
+        "+---+-------+\n"
+        "| # | Name  |\n"
+        "+---+-------+\n"
+        "| 3 | Carol |\n"
+        "+---+-------+\n"
+        "| 4 | Dave  |\n"
+        "+---+-------+\n"
+        "| # | Name  |\n"
+        "+---+-------+\n"
+        "| 5 |  Eve  |\n"
+        "+---+-------+\n"
+        "|   |   5   |\n"
+        "+---+-------+"
+    )
+    assert text == expected
+
+
+def test_repeat_header_uses_heading_separators():
+    text = t2a(
+        header=["a", "b"],
+        body=[[1, 2], [3, 4], [5, Merge.LEFT]],
+        repeat_header_every=1,
+    )
+    expected = (
+        "╔═══════╗\n"
+        "║ a   b ║\n"
+        "╟───────╢\n"
+        "║ 1   2 ║\n"
+        "╟───────╢\n"
+        "║ a   b ║\n"
+        "╟───────╢\n"
+        "║ 3   4 ║\n"
+        "╟───────╢\n"
+        "║ a   b ║\n"
+        "╟───────╢\n"
+        "║   5   ║\n"
+        "╚═══════╝"
+    )
+    assert text == expected
+
+
+def test_repeat_header_without_header():
+    body = [[1, 2], [3, 4], [5, 6]]
+    assert t2a(body=body, repeat_header_every=1) == t2a(body=body)
+
+
+def test_repeat_header_more_than_rows():
+    header, body = ["a", "b"], [[1, 2], [3, 4]]
+    assert t2a(header, body, repeat_header_every=2) == t2a(header, body)
+
+
+def test_repeat_header_measure():
+    header, body = ["#", "Name"], [[1, "Zoë"], [2, "Bob"], [3, "Carol"]]
+    text = t2a(header, body, repeat_header_every=1)
+    size = measure_table(header, body, repeat_header_every=1)
+    assert size.characters == len(text)
+    assert size.bytes == len(text.encode("utf-8"))
+    assert size.lines == text.count("\n") + 1
+
+
+def test_repeat_header_live_table():
+    header = ["#", "Name"]
+    table = LiveTable(header, [[1, "Alice"]], repeat_header_every=2)
+    table.extend([[2, "Bob"], [3, "Carol"]])
+    body = [[1, "Alice"], [2, "Bob"], [3, "Carol"]]
+    assert table.to_ascii() == t2a(header, body, repeat_header_every=2)
+
+
+@pytest.mark.parametrize("repeat_header_every", [0, -1])
+def test_invalid_repeat_header_every(repeat_header_every):
+    with pytest.raises(InvalidRepeatHeaderEveryError) as e:
+        t2a(header=["a"], body=[[1]], repeat_header_every=repeat_header_every)
+    assert e.value.repeat_header_every == repeat_header_every
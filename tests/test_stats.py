@@ -0,0 +1,55 @@
+import asyncio
+
+from table2ascii import Alignment, Merge, RenderStats, atable2ascii, table2ascii as t2a
+
+HEADER = ["#", "Name", "Price"]
+BODY = [["1", "Apple", "1.5"], ["2", "Banana split", Merge.LEFT], ["3", "Cherry", "12.25"]]
+FOOTER = ["", "Total", "13.75"]
+PHASES = {"validation", "decimal_widths", "column_widths", "wrapping", "assembly"}
+
+
+def test_stats():
+    stats = RenderStats()
+    text = t2a(HEADER, BODY, FOOTER, number_alignments=Alignment.DECIMAL, stats=stats)
+    assert stats.renders == 1
+    assert set(stats.phase_seconds) == PHASES
+    assert all(seconds >= 0 for seconds in stats.phase_seconds.values())
+    assert stats.total_seconds == sum(stats.phase_seconds.values())
+    assert stats.cells_measured == 15
+    assert stats.lines == len(text.splitlines())
+    assert stats.output_bytes == len(text.encode("utf-8"))
+    assert stats.wcwidth_calls == stats.width_cache_misses > 0
+    assert stats.width_cache_hits > 0
+
+
+def test_stats_accumulate_and_reset():
+    stats = RenderStats()
+    t2a(HEADER, BODY, FOOTER, stats=stats)
+    lines = stats.lines
+    t2a(HEADER, BODY, FOOTER, stats=stats)
+    assert stats.renders == 2
+    assert stats.lines == lines * 2
+    stats.reset()
+    assert stats == RenderStats()
+
+
+def test_stats_without_wcwidth():
+    stats = RenderStats()
+    t2a(HEADER, BODY, FOOTER, use_wcwidth=False, stats=stats)
+    assert stats.wcwidth_calls == stats.width_cache_hits == stats.width_cache_misses == 0
+
+
+def test_stats_iter_lines():
+    stats = RenderStats()
+    text = asyncio.run(atable2ascii(HEADER, BODY, FOOTER, stats=stats))
+    assert stats.renders == 1
+    assert stats.lines == len(text.splitlines())
+    assert stats.output_bytes == len(text.encode("utf-8"))
+
+
+def test_stats_as_dict():
+    stats = RenderStats()
+    t2a(HEADER, BODY, FOOTER, stats=stats)
+    exported = stats.as_dict()
+    assert exported["lines"] == stats.lines
+    assert set(exported["phase_seconds"]) == PHASES
@@ -1,3 +1,8 @@
+import gc
+import pickle
+import weakref
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from table2ascii import PresetStyle, TableStyle, table2ascii as t2a
@@ -111,3 +116,52 @@ def test_plain():
         " SUM   130   140   135   130 "
     )
     assert text == expected
+
+
+def test_style_is_hashable():
+    styles = {TableStyle.from_string("~" * 30): "tilde", PresetStyle.double_box: "double"}
+    assert styles[TableStyle.from_string("~" * 30)] == "tilde"
+    assert styles[PresetStyle.double_box] == "double"
+
+
+def test_style_is_immutable():
+    with pytest.raises(FrozenInstanceError):
+        PresetStyle.plain.col_sep = "|"  # type: ignore[misc]
+
+
+def test_set_returns_copy():
+    style = PresetStyle.plain.set(col_sep="|")
+    assert style is not PresetStyle.plain
+    assert style.col_sep == "|"
+    assert PresetStyle.plain.col_sep == " "
+
+
+def test_equal_styles_are_interned():
+    string = "+-++++|||+-++++|-+++++++++++++"
+    assert TableStyle.from_string(string) is TableStyle.from_string(string)
+    assert PresetStyle.ascii.set(col_sep="!") is PresetStyle.ascii.set(col_sep="!")
+
+
+def test_unused_interned_styles_are_freed():
+    style = PresetStyle.ascii.set(col_sep="\u2603")
+    reference = weakref.ref(style)
+    del style
+    gc.collect()
+    assert reference() is None
+
+
+def test_pickle_style():
+    style = PresetStyle.ascii_box.set(col_sep="!")
+    assert pickle.loads(pickle.dumps(style)) is style
+
+
+def test_separator_glyphs():
+    glyphs = PresetStyle.ascii_box.heading_row_glyphs
+    assert glyphs.left_edge == PresetStyle.ascii_box.heading_row_left_tee
+    assert glyphs.filler == PresetStyle.ascii_box.heading_row_sep
+
+
+def test_style_with_braces():
+    style = PresetStyle.plain.set(left_and_right_edge="{", col_sep="}", heading_col_sep="{0}")
+    text = t2a(header=["a", "b", "c"], body=[[1, 2, 3]], style=style, first_col_heading=True)
+    assert text == "{ a {0} b } c {\n{ 1 {0} 2 } 3 {"
@@ -0,0 +1,91 @@
+import pytest
+
+from table2ascii import (
+    Alignment,
+    BodyColumnCountMismatchError,
+    LiveTable,
+    Merge,
+    PresetStyle,
+    measure_table,
+    table2ascii as t2a,
+)
+
+HEADER = ["Name", "Age", "Score"]
+BODY = [["Alice", 30, 9.5], ["Bob", 4, 10]]
+
+
+def test_transpose():
+    text = t2a(header=HEADER, body=BODY, transpose=True, style=PresetStyle.ascii_box)
+    expected = (
+        "+-------+-------+-----+\n"
+        "| Name  | Alice | Bob |\n"
+        "+-------+-------+-----+\n"
+        "|  Age  |  30   |  4  |\n"
+        "+-------+-------+-----+\n"
+        "| Score |  9.5  | 10  |\n"
+        "+-------+-------+-----+"
+    )
+    assert text == expected
+
+
+def test_transpose_heading_rows_and_columns():
+    text = t2a(
+        header=HEADER,
+        body=BODY,
+        footer=["Total", 34, 19.5],
+        transpose=True,
+        first_col_heading=True,
+        alignments=[Alignment.LEFT, Alignment.RIGHT, Alignment.RIGHT, Alignment.RIGHT],
+    )
+    expected = (
+        "╔═══════╦═════════════╦═══════╗\n"
+        "║ Name  ║ Alice   Bob ║ Total ║\n"
+        "╟───────╫─────────────╫───────╢\n"
+        "║ Age   ║    30     4 ║    34 ║\n"
+        "║ Score ║   9.5    10 ║  19.5 ║\n"
+        "╚═══════╩═════════════╩═══════╝"
+    )
+    assert text == expected
+
+
+def test_transpose_matches_transposed_data():
+    rows = [HEADER, *BODY]
+    transposed = [list(column) for column in zip(*rows)]
+    assert t2a(header=HEADER, body=BODY, transpose=True, last_col_heading=True) == t2a(
+        body=transposed[:-1], footer=transposed[-1], first_col_heading=True
+    )
+
+
+def test_transpose_measure_and_live_table():
+    text = t2a(header=HEADER, body=BODY, transpose=True)
+    assert measure_table(header=HEADER, body=BODY, transpose=True).characters == len(text)
+    table = LiveTable(header=HEADER, body=BODY[:1], transpose=True)
+    update = table.append(BODY[1])
+    assert update.relayout
+    assert table.to_ascii() == text
+
+
+def test_transpose_wrong_number_of_columns():
+    with pytest.raises(BodyColumnCountMismatchError) as e:
+        t2a(header=HEADER, body=[BODY[0], ["Bob", 4]], transpose=True)
+    assert e.value.row_index == 1
+    assert e.value.expected_columns == 3
+
+
+def test_transpose_merged_cells_are_not_merged():
+    text = t2a(
+        header=["a", "b", "c"],
+        body=[["x", Merge.LEFT, "y"], ["p", "q", "r"]],
+        transpose=True,
+        style=PresetStyle.ascii_box,
+    )
+    expected = (
+        "+---+---+---+\n"
+        "| a | x | p |\n"
+        "+---+---+---+\n"
+        "| b |   | q |\n"
+        "+---+---+---+\n"
+        "| c | y | r |\n"
+        "+---+---+---+"
+    )
+    assert text == expected
@@ -0,0 +1,69 @@
+import pytest
+
+from table2ascii import Alignment, Merge, table2ascii as t2a
+from table2ascii.exceptions import (
+    AlignmentCountMismatchError,
+    BodyColumnCountMismatchError,
+    FooterColumnCountMismatchError,
+)
+
+
+def test_validate_false_same_output():
+    header = ["#", "G", "H", "R", "S"]
+    body = [[1, 2, 3, 4, 5], [Merge.LEFT, "a", Merge.LEFT, "b", "c"]]
+    footer = ["SUM", "130", "140", "135", "130"]
+    alignments = [Alignment.LEFT] * 5
+    column_widths = [5, None, None, None, 6]
+    unvalidated = t2a(
+        header,
+        body,
+        footer,
+        alignments=alignments,
+        column_widths=column_widths,
+        first_col_heading=True,
+        validate=False,
+    )
+    assert unvalidated == t2a(
+        header,
+        body,
+        footer,
+        alignments=alignments,
+        column_widths=column_widths,
+        first_col_heading=True,
+    )
+
+
+def test_validate_false_does_not_modify_body():
+    body = [[Merge.LEFT, "a"], ["b", "c"]]
+    text = t2a(body=body, validate=False)
+    expected = "╔═══════╗\n║     a ║\n║ b   c ║\n╚═══════╝"
+    assert text == expected
+    assert body == [[Merge.LEFT, "a"], ["b", "c"]]
+
+
+def test_validate_true_body_mismatch():
+    with pytest.raises(BodyColumnCountMismatchError):
+        t2a(header=["a", "b"], body=[["1", "2"], ["3"]])
+
+
+def test_body_mismatch_error_attributes():
+    with pytest.raises(BodyColumnCountMismatchError) as e:
+        t2a(header=["a", "b"], body=[["1", "2"], ["3", "4"], ["5"], ["6", "7", "8"]])
+    assert e.value.first_invalid_row == ["5"]
+    assert e.value.row_index == 2
+    assert e.value.row_length == 1
+    assert e.value.expected_columns == 2
+    assert not hasattr(e.value, "body")
+    assert str(e.value) == (
+        "Body column count mismatch: A row with 1 columns was found at index 2, expected 2."
+    )
+
+
+def test_validate_true_footer_mismatch():
+    with pytest.raises(FooterColumnCountMismatchError):
+        t2a(header=["a", "b"], body=[["1", "2", "3"]], footer=["4"])
+
+
+def test_validate_true_alignment_mismatch():
+    with pytest.raises(AlignmentCountMismatchError):
+        t2a(header=["a", "b"], alignments=[Alignment.LEFT])
@@ -0,0 +1,47 @@
+import pytest
+
+from table2ascii import Merge, PresetStyle, table2ascii as t2a
+from table2ascii.exceptions import InvalidWorkersError
+
+
+def _large_body(rows):
+    body = []
+    for i in range(rows):
+        if i % 7 == 0:
+            body.append([i, f"merged {i}", Merge.LEFT, i * 3])
+        else:
+            body.append([i, f"row {i}", i * 2, i * 3])
+    return body
+
+
+def test_workers_matches_single_process():
+    # rows at the chunk boundaries (999, 1000, 2000) are separated by merged cells
+    body = _large_body(2500)
+    body[1000] = [1000, "boundary", Merge.LEFT, Merge.LEFT]
+    header = ["#", "Name", "Value", "Total"]
+    footer = ["SUM", "", Merge.LEFT, 0]
+    style = PresetStyle.double_thin_box
+    parallel = t2a(header, body, footer, first_col_heading=True, style=style, workers=2)
+    assert parallel == t2a(header, body, footer, first_col_heading=True, style=style)
+
+
+def test_workers_small_body():
+    text = t2a(
+        header=["#", "G", "H", "R", "S"],
+        body=[["1", "30", "40", "35", "30"], ["2", "30", "40", "35", "30"]],
+        workers=4,
+    )
+    expected = (
+        "╔═══════════════════════╗\n"
+        "║ #   G    H    R    S  ║\n"
+        "╟───────────────────────╢\n"
+        "║ 1   30   40   35   30 ║\n"
+        "║ 2   30   40   35   30 ║\n"
+        "╚═══════════════════════╝"
+    )
+    assert text == expected
+
+
+def test_invalid_workers():
+    with pytest.raises(InvalidWorkersError):
+        t2a(header=["a", "b"], body=[["1", "2"]], workers=0)